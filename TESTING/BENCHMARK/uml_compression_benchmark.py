@@ -0,0 +1,53 @@
+import sys
+import os
+import json
+import time
+import tempfile
+
+###############################################################################
+# ADD ROOT PATH #
+# Adjusting the path to allow imports from the project root
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(root_path)
+
+from UML_MVC.UML_CONTROLLER.uml_storage_manager import UMLStorageManager as Storage
+from uml_save_benchmark import _build_main_data
+
+###############################################################################
+# Compressed diagram benchmark
+# Builds a synthetic diagram of about the given size (50 MB by default), then
+# saves and loads it as plain JSON, gzip-compressed JSON and lzma-compressed
+# JSON, and reports the file size and the save and load times of each.
+#
+# Usage: python TESTING/BENCHMARK/uml_compression_benchmark.py [size_in_mb]
+
+# Time one call #
+def _measure(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+# Read every record of a saved diagram #
+def _load(storage: Storage, file_path: str):
+    for _ in storage._load_records_from_json_gui(file_path):
+        pass
+
+def main():
+    size_in_mb = float(sys.argv[1]) if len(sys.argv) > 1 else 50
+    # Measure the indented size of one class to scale the diagram
+    class_size = len(json.dumps(_build_main_data(2), indent=4)) / 2
+    main_data = _build_main_data(int(size_in_mb * 1024 * 1024 / class_size))
+    storage = Storage()
+    print(f"Synthetic diagram: {len(main_data['classes'])} classes")
+    with tempfile.TemporaryDirectory() as directory:
+        plain_size = None
+        for label, file_name in (("Plain JSON", "diagram.json"), ("gzip", "diagram.json.gz"), ("lzma", "diagram.json.xz")):
+            file_path = os.path.join(directory, file_name)
+            save_time = _measure(storage._save_data_to_json_gui, file_path, main_data)
+            load_time = _measure(_load, storage, file_path)
+            size = os.path.getsize(file_path) / 1024 / 1024
+            plain_size = plain_size or size
+            print(f"{label:<10} {size:8.2f} MiB ({plain_size / size:5.1f}x)   save {save_time:6.2f} s   load {load_time:6.2f} s")
+
+if __name__ == "__main__":
+    main()
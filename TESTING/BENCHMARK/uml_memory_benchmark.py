@@ -0,0 +1,100 @@
+import sys
+import os
+import gc
+import tracemalloc
+
+###############################################################################
+# ADD ROOT PATH #
+# Adjusting the path to allow imports from the project root
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(root_path)
+
+from UML_CORE.UML_CLASS.uml_class import UMLClass as Class
+from UML_CORE.UML_FIELD.uml_field import UMLField as Field
+from UML_CORE.UML_METHOD.uml_method import UMLMethod as Method
+from UML_CORE.UML_METHOD.uml_method_table import UMLMethodTable as MethodTable
+from UML_CORE.UML_PARAMETER.uml_parameter import UMLParameter as Parameter
+from UML_CORE.UML_RELATIONSHIP.uml_relationship import UMLRelationship as Relationship
+
+###############################################################################
+# Memory benchmark for the core entities
+# Builds a synthetic model of about 50k members twice: once with the
+# __slots__ layout of UML_CORE and once with the same classes rebuilt with a
+# per-instance __dict__ (the layout before __slots__), then reports the
+# bytes used per entity.
+#
+# Usage: python TESTING/BENCHMARK/uml_memory_benchmark.py [class_count]
+
+ENTITY_LIST = [Class, Field, Method, MethodTable, Parameter, Relationship]
+
+# Rebuild a class without __slots__ so its instances get a __dict__ #
+def _without_slots(cls):
+    member_type = type(Field.__dict__["_UMLField__type"])
+    namespace = {key: value for key, value in cls.__dict__.items()
+                 if key != "__slots__" and not isinstance(value, member_type)}
+    return type(cls.__name__, (), namespace)
+
+# Build a synthetic model with the given entity classes #
+def _build_model(entity_table: dict, class_count: int):
+    class_cls = entity_table["Class"]
+    field_cls = entity_table["Field"]
+    method_cls = entity_table["Method"]
+    parameter_cls = entity_table["Parameter"]
+    relationship_cls = entity_table["Relationship"]
+    class_list = {}
+    for class_index in range(class_count):
+        class_name = f"Class{class_index}"
+        class_object = class_cls(class_name, x=class_index, y=class_index)
+        for field_index in range(5):
+            class_object._add_field(field_cls("int", f"field{field_index}"))
+        method_table = class_object._get_method_table()
+        for method_index in range(5):
+            param_list = [parameter_cls("int", f"param{param_index}") for param_index in range(2)]
+            method_table._append(method_cls("void", f"method{method_index}"), param_list)
+        class_list[class_name] = class_object
+    relationship_list = [relationship_cls(f"Class{index}", f"Class{index + 1}", "Aggregation")
+                         for index in range(class_count - 1)]
+    return class_list, relationship_list
+
+# Measure the memory held by one synthetic model #
+def _measure(entity_table: dict, class_count: int) -> int:
+    gc.collect()
+    tracemalloc.start()
+    model = _build_model(entity_table, class_count)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del model
+    return size
+
+# Build the entity table of one layout #
+def _entity_table(use_slots: bool) -> dict:
+    table = {"Class": Class, "Field": Field, "Method": Method, "Parameter": Parameter, "Relationship": Relationship}
+    if use_slots:
+        return table
+    table = {name: _without_slots(cls) for name, cls in table.items()}
+    method_table_cls = _without_slots(MethodTable)
+    class_cls = table["Class"]
+    original_init = class_cls.__init__
+    # The class owns a method table, make it a __dict__ based one as well
+    def __init__(self, *args, **kwargs):
+        original_init(self, *args, **kwargs)
+        self._UMLClass__method_table = method_table_cls()
+    class_cls.__init__ = __init__
+    return table
+
+def main():
+    class_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    # 1 class + 5 fields + 5 methods + 10 parameters + 1 method table per class, plus the relationships
+    entity_count = class_count * 22 + (class_count - 1)
+    before = _measure(_entity_table(use_slots=False), class_count)
+    after = _measure(_entity_table(use_slots=True), class_count)
+    print(f"Synthetic model: {class_count} classes, {entity_count} entities")
+    print(f"Before (__dict__): {before / entity_count:8.1f} bytes per entity ({before / 1024 / 1024:.1f} MiB)")
+    print(f"After (__slots__): {after / entity_count:8.1f} bytes per entity ({after / 1024 / 1024:.1f} MiB)")
+    print(f"Saved: {100 * (before - after) / before:.1f}%")
+    # Print the instance size of each entity for reference
+    for cls in ENTITY_LIST:
+        print(f"  {cls.__name__:<16} {sys.getsizeof(object.__new__(cls))} bytes per instance")
+
+if __name__ == "__main__":
+    main()
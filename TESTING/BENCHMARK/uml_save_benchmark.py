@@ -0,0 +1,74 @@
+import sys
+import os
+import json
+import time
+import tempfile
+
+###############################################################################
+# ADD ROOT PATH #
+# Adjusting the path to allow imports from the project root
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(root_path)
+
+from UML_MVC.UML_CONTROLLER.uml_storage_manager import UMLStorageManager as Storage
+
+###############################################################################
+# Save throughput benchmark
+# Builds a synthetic diagram of about the given size (50 MB by default) and
+# saves it over an existing file three ways: the old read-before-write save,
+# the atomic single-pass save, and the atomic save with compact encoding.
+#
+# Usage: python TESTING/BENCHMARK/uml_save_benchmark.py [size_in_mb]
+
+# Build main data for a synthetic diagram #
+def _build_main_data(class_count: int) -> dict:
+    class_list = []
+    for class_index in range(class_count):
+        class_list.append({
+            "name": f"Class{class_index}",
+            "fields": [{"name": f"field{field_index}", "type": "int"} for field_index in range(5)],
+            "methods": [{"name": f"method{method_index}", "return_type": "void",
+                         "params": [{"name": f"param{param_index}", "type": "int"} for param_index in range(2)]}
+                        for method_index in range(5)],
+            "position": {"x": class_index, "y": class_index},
+        })
+    relationship_list = [{"source": f"Class{index}", "destination": f"Class{index + 1}", "type": "Aggregation"}
+                         for index in range(class_count - 1)]
+    return {"classes": class_list, "relationships": relationship_list}
+
+# The save before the atomic rewrite: load the old file, then dump over it #
+def _old_save(file_path: str, main_data: dict):
+    with open(file_path, "r") as json_file:
+        json.load(json_file)
+    with open(file_path, "w") as json_file:
+        json.dump(main_data, json_file, indent=4)
+
+# Time one save function, the target file already exists #
+def _measure(save_function, file_path: str, main_data: dict) -> float:
+    start = time.perf_counter()
+    save_function(file_path, main_data)
+    return time.perf_counter() - start
+
+def main():
+    size_in_mb = float(sys.argv[1]) if len(sys.argv) > 1 else 50
+    # Measure the indented size of one class to scale the diagram
+    class_size = len(json.dumps(_build_main_data(2), indent=4)) / 2
+    main_data = _build_main_data(int(size_in_mb * 1024 * 1024 / class_size))
+    storage = Storage()
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "diagram.json")
+        storage._save_data_to_json_gui(file_path, main_data)
+        size = os.path.getsize(file_path) / 1024 / 1024
+        print(f"Synthetic diagram: {len(main_data['classes'])} classes, {size:.1f} MiB indented")
+        old = _measure(_old_save, file_path, main_data)
+        print(f"Read-before-write save: {old:6.2f} s ({size / old:6.1f} MiB/s)")
+        storage._set_compact(False)
+        atomic = _measure(storage._save_data_to_json_gui, file_path, main_data)
+        print(f"Atomic save:            {atomic:6.2f} s ({size / atomic:6.1f} MiB/s)")
+        storage._set_compact(True)
+        compact = _measure(storage._save_data_to_json_gui, file_path, main_data)
+        compact_size = os.path.getsize(file_path) / 1024 / 1024
+        print(f"Atomic compact save:    {compact:6.2f} s ({compact_size:.1f} MiB written)")
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,9 @@
 import sys
 import os
+import copy
+import json
+import time
+import random
 import pytest
 from rich.console import Console
 from unittest.mock import patch, MagicMock
@@ -10,6 +14,7 @@ sys.path.append(root_path)
 
 # Import the UMLModel class and UMLObserver
 from UML_MVC.UML_MODEL.uml_model import UMLModel
+from UML_MVC.UML_MODEL.uml_slot_dict import UMLSlotDict
 from UML_MVC.UML_VIEW.UML_CLI_VIEW.uml_cli_view import UMLView
 from UML_MVC.uml_observer import UMLObserver
 
@@ -20,6 +25,12 @@ from UML_CORE.UML_METHOD.uml_method import UMLMethod
 from UML_CORE.UML_PARAMETER.uml_parameter import UMLParameter
 from UML_CORE.UML_RELATIONSHIP.uml_relationship import UMLRelationship
 from UML_MVC.UML_CONTROLLER.uml_storage_manager import UMLStorageManager  # Corrected import
+from UML_MVC.UML_CONTROLLER.uml_sqlite_storage import UMLSQLiteStorage
+from UML_MVC.UML_CONTROLLER.uml_controller import UMLController
+from UML_MVC import uml_command_pattern as Command
+from UML_MVC.uml_command_factory import CommandFactory
+from UML_MVC.uml_command_journal import UMLCommandJournal
+from UML_MVC.uml_autosave import UMLAutosaveService
 
 ###############################################################################
 
@@ -89,7 +100,7 @@ def test_uml_model_init():
     # Verify attributes are correctly initialized
     assert uml_model._UMLModel__user_view == view
     assert uml_model._UMLModel__console == console
-    assert isinstance(uml_model._UMLModel__class_list, dict)
+    assert isinstance(uml_model._UMLModel__class_list, UMLSlotDict)
     assert isinstance(uml_model._UMLModel__storage_manager, UMLStorageManager)  # Corrected to UMLStorageManager
     assert isinstance(uml_model._UMLModel__relationship_list, list)
     assert isinstance(uml_model._UMLModel__main_data, dict)
@@ -511,9 +522,9 @@ def test_add_method(uml_model, sample_class, sample_observer):
     # Check if method was successfully added
     assert result is True
     class_data = uml_model._get_class_list()["TestClass"]
-    methods = class_data._get_method_and_parameters_list()
+    methods = class_data._get_method_table()
     assert len(methods) == 1
-    assert list(methods[0].keys())[0]._get_name() == "testMethod"
+    assert methods._get_method(0)._get_name() == "testMethod"
     
     # Check that observers were notified
     assert len(sample_observer.events) == 2  # Expecting add_class and add_method events
@@ -533,7 +544,7 @@ def test_check_method_param_list(uml_model, sample_class, sample_observer):
     uml_model._add_method(class_name="TestClass", method_type="void", method_name="existingMethod", is_loading=False)
     
     # Prepare a new method with the same name and parameter list to check for duplicates
-    existing_methods = uml_model._get_class_list()["TestClass"]._get_method_and_parameters_list()
+    existing_methods = uml_model._get_class_list()["TestClass"]._get_method_table()
     duplicate_method = uml_model.create_method(method_type="void", method_name="existingMethod")
     
     # Attempt to add a duplicate method
@@ -561,7 +572,7 @@ def test_delete_method(uml_model, sample_class, sample_observer):
     # Check if method was successfully deleted
     assert result is True
     class_data = uml_model._get_class_list()["TestClass"]
-    methods = class_data._get_method_and_parameters_list()
+    methods = class_data._get_method_table()
     assert len(methods) == 0  # Ensure method list is now empty
     
     # Check that observers were notified
@@ -590,7 +601,7 @@ def test_rename_method(uml_model, sample_class, sample_observer):
     
     # Check if the method name has been updated
     class_data = uml_model._get_class_list()["TestClass"]
-    renamed_method = list(class_data._get_method_and_parameters_list()[0].keys())[0]
+    renamed_method = class_data._get_method_table()._get_method(0)
     assert renamed_method._get_name() == "newMethod"  # Should reflect the new name
     
     # Verify observer notifications
@@ -740,7 +751,7 @@ def test_add_parameter(uml_model, sample_class, sample_observer):
     # Check if parameter was added successfully
     assert result is True
     class_data = uml_model._get_class_list()["TestClass"]
-    method_params = list(class_data._get_method_and_parameters_list()[0].values())[0]
+    method_params = class_data._get_method_table()._get_parameter_list(class_data._get_method_table()._get_method(0))
     assert len(method_params) == 1
     assert method_params[0]._get_parameter_name() == "param1"
     assert method_params[0]._get_type() == "int"
@@ -770,7 +781,7 @@ def test_delete_parameter(uml_model, sample_class, sample_observer):
     # Ensure parameter deletion succeeded
     assert result is True
     class_data = uml_model._get_class_list()["TestClass"]
-    method_params = list(class_data._get_method_and_parameters_list()[0].values())[0]
+    method_params = class_data._get_method_table()._get_parameter_list(class_data._get_method_table()._get_method(0))
     assert len(method_params) == 0  # parameter list should be empty after deletion
     
     # Verify observer notification
@@ -798,7 +809,7 @@ def test_rename_parameter(uml_model, sample_class, sample_observer):
     # Check if renaming was successful
     assert result is True
     class_data = uml_model._get_class_list()["TestClass"]
-    renamed_param = list(class_data._get_method_and_parameters_list()[0].values())[0][0]
+    renamed_param = class_data._get_method_table()._get_parameter_list(class_data._get_method_table()._get_method(0))[0]
     assert renamed_param._get_parameter_name() == "newParam"
     
     # Verify observer notification
@@ -825,7 +836,7 @@ def test_replace_param_list(uml_model, sample_class, sample_observer):
     # Ensure replacement was successful
     assert result is True
     class_data = uml_model._get_class_list()["TestClass"]
-    new_params = list(class_data._get_method_and_parameters_list()[0].values())[0]
+    new_params = class_data._get_method_table()._get_parameter_list(class_data._get_method_table()._get_method(0))
     assert len(new_params) == 2
     assert new_params[0]._get_parameter_name() == "newParam1"
     assert new_params[1]._get_parameter_name() == "newParam2"
@@ -969,6 +980,19 @@ def test_edit_parameter_type_valid(uml_model):
     edited_param = uml_model._get_param_based_on_index("TestClass", "1", "sampleParam")
     assert edited_param._get_type() == "string", "Expected parameter type to be updated to 'string'"
 
+# Changing a parameter type onto an existing overload is rejected
+def test_edit_parameter_type_duplicate_signature(uml_model):
+    uml_model._add_class("TestClass", is_loading=False)
+    uml_model._add_method("TestClass", "void", "method1", is_loading=False)
+    uml_model._add_parameter(class_name="TestClass", method_num="1", param_type="int", param_name="value", is_loading=False)
+    uml_model._add_method("TestClass", "void", "method1", is_loading=True)
+    uml_model._add_parameter(class_name="TestClass", method_num="2", param_type="string", param_name="value", is_loading=False)
+
+    assert uml_model._edit_parameter_type("TestClass", "2", "value", "int") is False
+    assert uml_model._check_method_signature("TestClass", "method1", ["string"]) is False
+    assert uml_model._edit_parameter_type("TestClass", "2", "value", "float") is True
+    assert uml_model._check_method_signature("TestClass", "method1", ["string"]) is True
+
 # Test with invalid class name
 def test_edit_parameter_type_invalid_class(uml_model):
     result = uml_model._edit_parameter_type("NonExistentClass", 1, "sampleParam", "string")
@@ -1450,14 +1474,18 @@ def test_private_class_exists(uml_model):
 ##################################################################################
 
 def test_saved_file_name_check_existing(uml_model):
-    with patch.object(uml_model._UMLModel__storage_manager, '_get_saved_list', return_value=[{"file1": "path1"}, {"file2": "path2"}]):
-        result = uml_model._saved_file_name_check("file1")
-        assert result is True  # File exists
+    saved_registry = uml_model._UMLModel__storage_manager._get_saved_registry()
+    saved_registry._add("file1")
+    saved_registry._add("file2")
+    result = uml_model._saved_file_name_check("file1")
+    assert result is True  # File exists
 
 def test_saved_file_name_check_nonexistent(uml_model):
-    with patch.object(uml_model._UMLModel__storage_manager, '_get_saved_list', return_value=[{"file1": "path1"}, {"file2": "path2"}]):
-        result = uml_model._saved_file_name_check("file3")
-        assert result is False  # File does not exist
+    saved_registry = uml_model._UMLModel__storage_manager._get_saved_registry()
+    saved_registry._add("file1")
+    saved_registry._add("file2")
+    result = uml_model._saved_file_name_check("file3")
+    assert result is False  # File does not exist
 
 ##################################################################################
 # _update_main_data_for_every_action
@@ -1731,12 +1759,12 @@ def test_validate_entities_method_does_not_exist(uml_model):
 def test_validate_entities_parameter_exists(uml_model):
     # Mock `__validate_parameter_existence` to return True, simulating an existing parameter
     with patch.object(uml_model, '_UMLModel__validate_parameter_existence', return_value=True) as mock_param_exist:
-        method_and_param_list = {"TestMethod": ["TestParameter"]}
-        result = uml_model._validate_entities(class_name="TestClass", method_and_param_list=method_and_param_list, parameter_name="TestParameter", parameter_should_exist=True)
+        chosen_method = UMLMethod(type="void", method_name="TestMethod")
+        result = uml_model._validate_entities(class_name="TestClass", chosen_method=chosen_method, parameter_name="TestParameter", parameter_should_exist=True)
         
         # Verify the function returns True when the parameter exists as expected
         assert result is True
-        mock_param_exist.assert_called_once_with("TestClass", method_and_param_list, "TestParameter", True)
+        mock_param_exist.assert_called_once_with("TestClass", chosen_method, "TestParameter", True)
 
 def test_change_data_type_parameter(uml_model):
     # Mock `_edit_parameter_type` to simulate parameter type change
@@ -2071,3 +2099,906 @@ def test_delete_saved_file_NAME_LIST(uml_model):
 
         # Verify that the function returns None (or whatever the function returns on quit)
         assert result is None
+
+###############################################################################
+# INCREMENTAL MAIN DATA TESTS #
+
+def _full_rebuild_of(uml_model):
+    # Rebuild main data from scratch on a copy of the current state
+    class_data_list = [uml_model._class_json_format(class_name) for class_name in uml_model._get_class_list()]
+    relationship_data_list = uml_model._get_relationship_format_list()
+    return {"classes": class_data_list, "relationships": relationship_data_list}
+
+def test_incremental_main_data_matches_full_rebuild(uml_model):
+    uml_model._add_class("Class1", is_loading=False)
+    uml_model._add_class("Class2", is_loading=False)
+    uml_model._add_class("Class3", is_loading=False)
+    uml_model._add_field("Class2", "int", "count", is_loading=False)
+    uml_model._add_relationship("Class1", "Class2", "Aggregation", is_loading=False)
+    uml_model._add_relationship("Class2", "Class3", "Composition", is_loading=False)
+    assert uml_model._get_main_data() == _full_rebuild_of(uml_model)
+
+    uml_model._rename_field("Class2", "count", "total")
+    uml_model._change_type("Class1", "Class2", "Inheritance")
+    assert uml_model._get_main_data() == _full_rebuild_of(uml_model)
+
+def test_incremental_main_data_rename_keeps_slot(uml_model):
+    uml_model._add_class("Class1", is_loading=False)
+    uml_model._add_class("Class2", is_loading=False)
+    uml_model._add_relationship("Class1", "Class2", "Aggregation", is_loading=False)
+    uml_model._rename_class("Class1", "First")
+    main_data = uml_model._get_main_data()
+    assert [each["name"] for each in main_data["classes"]] == ["First", "Class2"]
+    assert main_data["relationships"][0]["source"] == "First"
+    # Later edits on the renamed class must patch the same slot
+    uml_model._add_field("First", "str", "label", is_loading=False)
+    assert uml_model._get_main_data() == _full_rebuild_of(uml_model)
+
+def test_incremental_main_data_keeps_order_after_rename_delete_and_re_add(uml_model):
+    for class_name in ("A", "B", "C"):
+        uml_model._add_class(class_name, is_loading=False)
+    uml_model._rename_class("A", "Z")
+    assert list(uml_model._get_class_list()) == ["Z", "B", "C"]
+    uml_model._delete_class("B")
+    uml_model._add_class("B", is_loading=False)
+    uml_model._rename_class("C", "A")
+    incremental = uml_model._get_main_data()
+    assert [each["name"] for each in incremental["classes"]] == ["Z", "A", "B"]
+    assert incremental == _full_rebuild_of(uml_model)
+    # The streamed main data and a batch rebuild give the same order
+    assert [each["name"] for each in uml_model._iter_main_data()["classes"]] == ["Z", "A", "B"]
+    with uml_model._batch():
+        uml_model._rename_class("Z", "Y")
+    assert uml_model._get_main_data() == _full_rebuild_of(uml_model)
+    assert [each["name"] for each in uml_model._get_main_data()["classes"]] == ["Y", "A", "B"]
+
+def test_slot_dict_renames_in_place_and_compacts_deleted_slots():
+    slot_dict = UMLSlotDict((f"Class{number}", number) for number in range(40))
+    slot_dict._rename_key("Class0", "Car")
+    assert list(slot_dict)[:2] == ["Car", "Class1"]
+    with pytest.raises(KeyError):
+        slot_dict._rename_key("Class1", "Car")
+    for number in range(1, 21):
+        del slot_dict[f"Class{number}"]
+    # Half of the slots are empty now, they are dropped at once
+    assert len(slot_dict._UMLSlotDict__key_slot_list) == 20
+    slot_dict._rename_key("Class39", "Truck")
+    assert list(slot_dict.items()) == [("Car", 0)] + [(f"Class{number}", number) for number in range(21, 39)] + [("Truck", 39)]
+
+def test_incremental_main_data_deletes_leave_other_slots_alone(uml_model):
+    for number in range(40):
+        uml_model._add_class(f"Class{number}", is_loading=False)
+    for number in range(39):
+        uml_model._add_relationship(f"Class{number}", f"Class{number + 1}", "Aggregation", is_loading=False)
+    slot_index = uml_model._UMLModel__class_slot_index
+    assert slot_index["Class39"] == 39
+    uml_model._delete_class("Class1")
+    # The entries after the deleted class keep their slots
+    assert slot_index["Class39"] == 39
+    assert uml_model._get_main_data() == _full_rebuild_of(uml_model)
+    for number in range(2, 40, 2):
+        uml_model._delete_class(f"Class{number}")
+        uml_model._rename_class(f"Class{number + 1}", f"Renamed{number + 1}")
+        assert uml_model._get_main_data() == _full_rebuild_of(uml_model)
+    # The empty slots were compacted away once they made up half of the list
+    assert len(uml_model._UMLModel__main_data["classes"]) == 20
+    assert [each["name"] for each in uml_model._get_main_data()["classes"]][:3] == ["Class0", "Renamed3", "Renamed5"]
+
+def test_incremental_main_data_delete_class_removes_relationships(uml_model):
+    uml_model._add_class("Class1", is_loading=False)
+    uml_model._add_class("Class2", is_loading=False)
+    uml_model._add_class("Class3", is_loading=False)
+    uml_model._add_relationship("Class1", "Class2", "Aggregation", is_loading=False)
+    uml_model._add_relationship("Class2", "Class3", "Aggregation", is_loading=False)
+    uml_model._add_relationship("Class3", "Class1", "Aggregation", is_loading=False)
+    uml_model._delete_class("Class2")
+    main_data = uml_model._get_main_data()
+    assert [each["name"] for each in main_data["classes"]] == ["Class1", "Class3"]
+    assert main_data == _full_rebuild_of(uml_model)
+    # Slots after the deleted one are shifted, so later edits land on the right entry
+    uml_model._add_field("Class3", "int", "x", is_loading=False)
+    uml_model._delete_relationship("Class3", "Class1")
+    assert uml_model._get_main_data() == _full_rebuild_of(uml_model)
+
+###############################################################################
+# BULK LOAD TESTS #
+
+def _loaded_file_data(number_of_class):
+    classes = []
+    for i in range(number_of_class):
+        classes.append({
+            "name": f"Class{i}",
+            "fields": [{"name": "count", "type": "int"}],
+            "methods": [
+                {"name": "run", "return_type": "void", "params": []},
+                {"name": "run", "return_type": "void", "params": [{"name": "speed", "type": "int"}]},
+            ],
+            "position": {"x": i, "y": i},
+        })
+    relationships = [{"source": f"Class{i}", "destination": f"Class{i + 1}", "type": "Aggregation"} for i in range(number_of_class - 1)]
+    return {"classes": classes, "relationships": relationships}
+
+def test_bulk_load_builds_model_and_notifies_once(uml_model, sample_observer):
+    uml_model._attach_observer(sample_observer)
+    loaded_data = _loaded_file_data(50)
+    uml_model._UMLModel__update_data_members(copy.deepcopy(loaded_data))
+    assert len(uml_model._get_class_list()) == 50
+    assert len(uml_model._get_relationship_list()) == 49
+    assert uml_model._get_main_data() == loaded_data
+    assert len(sample_observer.events) == 1
+    assert sample_observer.events[0]["event_type"] == "load"
+    assert sample_observer.events[0]["is_loading"] is True
+    # Main data index must be usable right after loading
+    uml_model._add_field("Class3", "str", "label")
+    assert uml_model._get_main_data()["classes"][3]["fields"][-1] == {"name": "label", "type": "str"}
+
+def test_bulk_load_skips_invalid_entries(uml_model):
+    loaded_data = _loaded_file_data(2)
+    loaded_data["classes"].append(copy.deepcopy(loaded_data["classes"][0]))
+    loaded_data["classes"][1]["fields"].append({"name": "count", "type": "str"})
+    loaded_data["classes"][1]["methods"].append({"name": "run", "return_type": "int", "params": []})
+    loaded_data["relationships"].append({"source": "Class0", "destination": "Missing", "type": "Aggregation"})
+    loaded_data["relationships"].append({"source": "Class1", "destination": "Class0", "type": "Unknown"})
+    uml_model._UMLModel__update_data_members(loaded_data)
+    assert list(uml_model._get_class_list()) == ["Class0", "Class1"]
+    assert len(uml_model._get_class_list()["Class1"]._get_class_field_list()) == 1
+    assert len(uml_model._get_class_list()["Class1"]._get_method_table()) == 2
+    assert len(uml_model._get_relationship_list()) == 1
+
+###############################################################################
+# RELATIONSHIP INDEX TESTS #
+
+def test_relationship_index_follows_rename_and_delete(uml_model):
+    for class_name in ("ClassA", "ClassB", "ClassC"):
+        uml_model._add_class(class_name, is_loading=False)
+    uml_model._add_relationship("ClassA", "ClassB", "Aggregation", is_loading=False)
+    uml_model._add_relationship("ClassB", "ClassC", "Composition", is_loading=False)
+    uml_model._add_relationship("ClassB", "ClassB", "Inheritance", is_loading=False)
+    assert uml_model._relationship_exist("ClassA", "ClassB")
+    assert uml_model._get_chosen_relationship("ClassB", "ClassC")._get_type() == "Composition"
+
+    uml_model._rename_class("ClassB", "Middle")
+    assert not uml_model._relationship_exist("ClassA", "ClassB")
+    assert uml_model._relationship_exist("ClassA", "Middle")
+    assert uml_model._relationship_exist("Middle", "ClassC")
+    assert uml_model._relationship_exist("Middle", "Middle")
+    assert uml_model._get_main_data()["relationships"] == _full_rebuild_of(uml_model)["relationships"]
+
+    uml_model._delete_class("Middle")
+    assert uml_model._get_relationship_list() == []
+    assert not uml_model._relationship_exist("ClassA", "Middle")
+    assert uml_model._get_main_data()["relationships"] == []
+    # The pair can be reused once the class is gone
+    uml_model._add_class("Middle", is_loading=False)
+    assert uml_model._add_relationship("ClassA", "Middle", "Aggregation", is_loading=False) is True
+
+def test_delete_class_keeps_other_relationships_in_order(uml_model):
+    for class_name in ("C0", "C1", "C2", "C3"):
+        uml_model._add_class(class_name, is_loading=False)
+    uml_model._add_relationship("C0", "C1", "Aggregation", is_loading=False)
+    uml_model._add_relationship("C2", "C3", "Aggregation", is_loading=False)
+    uml_model._add_relationship("C1", "C2", "Aggregation", is_loading=False)
+    uml_model._add_relationship("C3", "C0", "Aggregation", is_loading=False)
+    uml_model._delete_class("C1")
+    pairs = [(rel._get_source_class(), rel._get_destination_class()) for rel in uml_model._get_relationship_list()]
+    assert pairs == [("C2", "C3"), ("C3", "C0")]
+    assert uml_model._get_main_data() == _full_rebuild_of(uml_model)
+    uml_model._change_type("C3", "C0", "Composition")
+    assert uml_model._get_main_data() == _full_rebuild_of(uml_model)
+
+###############################################################################
+# SNAPSHOT TESTS #
+
+def test_snapshots_are_reused_until_data_changes(uml_model):
+    uml_model._add_class("ClassA", is_loading=False)
+    version = uml_model._get_data_version()
+    assert uml_model._get_main_data() is uml_model._get_main_data()
+    assert uml_model._get_class_list() is uml_model._get_class_list()
+    uml_model._add_field("ClassA", "int", "count", is_loading=False)
+    assert uml_model._get_data_version() != version
+    assert uml_model._get_main_data()["classes"][0]["fields"] == [{"name": "count", "type": "int"}]
+
+def test_old_snapshot_stays_consistent_after_edits(uml_model):
+    uml_model._add_class("ClassA", is_loading=False)
+    uml_model._add_class("ClassB", is_loading=False)
+    old_main_data = uml_model._get_main_data()
+    old_class_list = uml_model._get_class_list()
+    uml_model._add_field("ClassA", "int", "count", is_loading=False)
+    uml_model._delete_class("ClassB")
+    assert [class_data["name"] for class_data in old_main_data["classes"]] == ["ClassA", "ClassB"]
+    assert old_main_data["classes"][0]["fields"] == []
+    assert old_class_list["ClassA"]._get_class_field_list() == []
+    assert list(uml_model._get_class_list()) == ["ClassA"]
+
+def test_unchanged_classes_are_shared_between_snapshots(uml_model):
+    uml_model._add_class("ClassA", is_loading=False)
+    uml_model._add_class("ClassB", is_loading=False)
+    old_class_list = uml_model._get_class_list()
+    old_main_data = uml_model._get_main_data()
+    uml_model._add_field("ClassA", "int", "count", is_loading=False)
+    new_class_list = uml_model._get_class_list()
+    assert new_class_list["ClassB"] is old_class_list["ClassB"]
+    assert new_class_list["ClassA"] is not old_class_list["ClassA"]
+    assert uml_model._get_main_data()["classes"][1] is old_main_data["classes"][1]
+
+def test_snapshots_are_read_only(uml_model):
+    uml_model._add_class("ClassA", is_loading=False)
+    main_data = uml_model._get_main_data()
+    with pytest.raises(TypeError):
+        main_data["classes"].append({})
+    with pytest.raises(TypeError):
+        main_data["classes"][0]["name"] = "Renamed"
+    with pytest.raises(TypeError):
+        uml_model._get_class_list().pop("ClassA")
+    # A deep copy is an ordinary mutable structure
+    main_data_copy = copy.deepcopy(main_data)
+    main_data_copy["classes"][0]["name"] = "Renamed"
+    assert uml_model._get_main_data()["classes"][0]["name"] == "ClassA"
+
+###############################################################################
+# BATCH TESTS #
+
+def test_batch_defers_main_data_and_notifications(uml_model, sample_observer):
+    uml_model._attach_observer(sample_observer)
+    with patch.object(uml_model, "_update_main_data_for_every_action", wraps=uml_model._update_main_data_for_every_action) as mock_rebuild:
+        with uml_model._batch():
+            uml_model._add_class("Car", is_loading=False)
+            for index in range(20):
+                uml_model._add_field("Car", "int", f"field{index}", is_loading=False)
+            assert sample_observer.events == []
+        mock_rebuild.assert_called_once()
+    assert len(sample_observer.events) == 21
+    assert sample_observer.events[0]["event_type"] == "add_class"
+    assert len(uml_model._get_main_data()["classes"][0]["fields"]) == 20
+    assert uml_model._get_main_data() == _full_rebuild_of(uml_model)
+
+def test_nested_batch_commits_with_outermost(uml_model, sample_observer):
+    uml_model._attach_observer(sample_observer)
+    uml_model._begin_batch()
+    uml_model._begin_batch()
+    uml_model._add_class("Car", is_loading=False)
+    assert uml_model._commit_batch() is True
+    assert sample_observer.events == []
+    assert uml_model._commit_batch() is True
+    assert len(sample_observer.events) == 1
+    assert uml_model._commit_batch() is False
+
+def test_batch_rolls_back_on_error(uml_model, sample_observer):
+    uml_model._add_class("Car", is_loading=False)
+    uml_model._add_class("Wheel", is_loading=False)
+    uml_model._add_relationship("Car", "Wheel", "Aggregation", is_loading=False)
+    uml_model._add_method("Car", "void", "drive", is_loading=False)
+    main_data_before = copy.deepcopy(uml_model._get_main_data())
+    uml_model._attach_observer(sample_observer)
+    with pytest.raises(RuntimeError):
+        with uml_model._batch():
+            uml_model._add_field("Car", "int", "speed", is_loading=False)
+            uml_model._rename_class("Wheel", "Tire")
+            uml_model._delete_method("Car", "1")
+            raise RuntimeError("edit failed")
+    assert sample_observer.events == []
+    assert uml_model._get_main_data() == main_data_before
+    assert uml_model._get_main_data() == _full_rebuild_of(uml_model)
+    assert uml_model._relationship_exist("Car", "Wheel")
+    assert uml_model._get_class_list()["Car"]._get_class_field_list() == []
+    # The restored model is fully usable
+    assert uml_model._add_field("Car", "int", "speed", is_loading=False) is True
+    assert uml_model._rename_class("Wheel", "Tire") is True
+    assert uml_model._relationship_exist("Car", "Tire")
+
+###############################################################################
+# EVENT BUS TESTS #
+
+def test_observer_subscribes_to_event_types(uml_model, sample_observer):
+    uml_model._attach_observer(sample_observer, ["add_field"])
+    uml_model._add_class("Car", is_loading=False)
+    uml_model._add_field("Car", "int", "speed", is_loading=False)
+    assert [event["event_type"] for event in sample_observer.events] == ["add_field"]
+    # Attaching again replaces the subscribed event types
+    uml_model._attach_observer(sample_observer)
+    uml_model._add_class("Wheel", is_loading=False)
+    assert sample_observer.events[-1]["event_type"] == "add_class"
+
+def test_batch_merges_redundant_events(uml_model, sample_observer):
+    uml_model._add_class("Car", is_loading=False)
+    uml_model._add_field("Car", "int", "speed", is_loading=False)
+    uml_model._attach_observer(sample_observer)
+    with uml_model._batch():
+        uml_model._rename_class("Car", "Truck")
+        uml_model._rename_class("Truck", "Bus")
+        uml_model._change_data_type(class_name="Bus", input_name="speed", new_type="float", is_field=True)
+        uml_model._change_data_type(class_name="Bus", input_name="speed", new_type="double", is_field=True)
+    assert [event["event_type"] for event in sample_observer.events] == ["rename_class", "edit_field_type"]
+    assert sample_observer.events[0]["data"] == {"old_name": "Car", "new_name": "Bus"}
+    assert sample_observer.events[1]["data"]["new_type"] == "double"
+
+def test_batch_drops_renames_back_to_the_first_name(uml_model, sample_observer):
+    uml_model._add_class("Car", is_loading=False)
+    uml_model._add_field("Car", "int", "speed", is_loading=False)
+    uml_model._attach_observer(sample_observer)
+    with uml_model._batch():
+        uml_model._rename_class("Car", "Truck")
+        uml_model._rename_class("Truck", "Car")
+        uml_model._rename_field("Car", "speed", "velocity")
+        uml_model._rename_field("Car", "velocity", "speed")
+        uml_model._change_data_type(class_name="Car", input_name="speed", new_type="float", is_field=True)
+    # Only the type change is left, no rename from a name to itself
+    assert [event["event_type"] for event in sample_observer.events] == ["edit_field_type"]
+    assert list(uml_model._get_class_list()) == ["Car"]
+
+def test_batch_keeps_events_separated_by_other_edits(uml_model, sample_observer):
+    uml_model._add_class("Car", is_loading=False)
+    uml_model._attach_observer(sample_observer)
+    with uml_model._batch():
+        uml_model._rename_class("Car", "Truck")
+        uml_model._add_field("Truck", "int", "speed", is_loading=False)
+        uml_model._rename_class("Truck", "Bus")
+    assert [event["event_type"] for event in sample_observer.events] == ["rename_class", "add_field", "rename_class"]
+
+def test_event_bus_flush_threshold(uml_model, sample_observer):
+    uml_model._attach_observer(sample_observer)
+    event_bus = uml_model._get_event_bus()
+    event_bus._set_flush_threshold(3)
+    uml_model._add_class("Car", is_loading=False)
+    uml_model._add_class("Wheel", is_loading=False)
+    assert sample_observer.events == []
+    assert event_bus._get_pending_count() == 2
+    uml_model._add_class("Door", is_loading=False)
+    assert len(sample_observer.events) == 3
+    uml_model._add_class("Seat", is_loading=False)
+    event_bus._flush()
+    assert len(sample_observer.events) == 4
+
+###############################################################################
+# COMMAND JOURNAL TESTS #
+
+def _run_journaled_session(uml_model, base_path, compaction_threshold=500):
+    journal = UMLCommandJournal(uml_model, compaction_threshold=compaction_threshold)
+    journal._start(base_path)
+    input_handler = Command.InputHandler(journal=journal)
+    input_handler.execute_command(Command.AddClassCommand(uml_model, class_name="Car"))
+    input_handler.execute_command(Command.AddClassCommand(uml_model, class_name="Wheel"))
+    input_handler.execute_command(Command.AddFieldCommand(uml_model, class_name="Car", type="int", field_name="speed"))
+    input_handler.execute_command(Command.AddRelationshipCommand(uml_model, source_class="Car", dest_class="Wheel", rel_type="Composition"))
+    input_handler.execute_command(Command.RenameClassCommand(uml_model, class_name="Car", new_name="Truck"))
+    input_handler.execute_command(Command.AddClassCommand(uml_model, class_name="Door"))
+    input_handler.undo()
+    input_handler.undo()
+    input_handler.redo()
+    return journal
+
+def _recover_into_new_model(base_path):
+    recovered_model = UMLModel(view=UMLView(), console=Console())
+    journal = UMLCommandJournal(recovered_model)
+    checkpoint_path = journal._recover(base_path)
+    assert checkpoint_path is not None
+    assert recovered_model._load_records_from_file(checkpoint_path)
+    return recovered_model
+
+def test_journal_replays_commands_after_a_crash(uml_model, tmp_path):
+    base_path = str(tmp_path / "diagram.json")
+    journal = _run_journaled_session(uml_model, base_path)
+    # Every command, undo and redo is one line
+    assert journal._get_record_count() == 9
+    with open(journal._get_journal_path()) as journal_file:
+        assert [json.loads(line)["action"] for line in journal_file][-3:] == ["undo", "undo", "redo"]
+    # The session crashes without closing the journal
+    recovered_model = _recover_into_new_model(base_path)
+    assert recovered_model._get_main_data() == uml_model._get_main_data()
+    assert list(recovered_model._get_class_list()) == ["Truck", "Wheel"]
+
+def test_journal_compacts_into_checkpoint(uml_model, tmp_path):
+    base_path = str(tmp_path / "diagram.json")
+    journal = _run_journaled_session(uml_model, base_path, compaction_threshold=4)
+    assert os.path.isfile(journal._get_checkpoint_path())
+    assert journal._get_record_count() == 1
+    # A torn last line is ignored
+    with open(journal._get_journal_path(), "a") as journal_file:
+        journal_file.write('{"sequence": 10, "action": "exec')
+    recovered_model = _recover_into_new_model(base_path)
+    assert recovered_model._get_main_data() == uml_model._get_main_data()
+
+def test_journal_is_dropped_on_clean_exit(uml_model, tmp_path):
+    base_path = str(tmp_path / "diagram.json")
+    journal = _run_journaled_session(uml_model, base_path, compaction_threshold=4)
+    journal._close(is_discarded=True)
+    assert os.listdir(tmp_path) == []
+    assert UMLCommandJournal(uml_model)._recover(base_path) is None
+
+###############################################################################
+# AUTOSAVE TESTS #
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+def test_autosave_writes_once_after_a_burst(uml_model, tmp_path):
+    target_path = str(tmp_path / "diagram.json")
+    autosave = UMLAutosaveService(uml_model, lambda: target_path, interval=0, idle_threshold=0.2, poll_interval=0.01)
+    autosave._start()
+    try:
+        with autosave._get_model_lock():
+            for class_name in ("Car", "Wheel", "Door"):
+                uml_model._add_class(class_name, is_loading=False)
+        assert _wait_for(lambda: autosave._get_write_count() == 1)
+        with open(target_path) as file:
+            assert [entry["name"] for entry in json.load(file)["classes"]] == ["Car", "Wheel", "Door"]
+        # Nothing changed since, nothing is written
+        time.sleep(0.3)
+        assert autosave._get_write_count() == 1
+    finally:
+        autosave._stop()
+    assert not autosave._is_running()
+
+def test_autosave_skips_unchanged_content(uml_model, tmp_path):
+    target_path = str(tmp_path / "diagram.json")
+    autosave = UMLAutosaveService(uml_model, lambda: target_path, interval=0, idle_threshold=0.05)
+    autosave._start(is_self_polling=False)
+    try:
+        uml_model._add_class("Car", is_loading=False)
+        # Still within the idle threshold
+        assert not autosave._poll()
+        time.sleep(0.1)
+        assert autosave._poll()
+        assert _wait_for(lambda: autosave._get_write_count() == 1)
+        # The version changes but the content is the same as the last autosave
+        uml_model._add_class("Wheel", is_loading=False)
+        uml_model._delete_class("Wheel")
+        assert not autosave._poll()
+        time.sleep(0.1)
+        assert autosave._poll()
+        assert _wait_for(lambda: autosave._get_skip_count() == 1)
+        assert autosave._get_write_count() == 1
+    finally:
+        autosave._stop()
+
+def test_autosave_yields_to_explicit_saves(uml_model, tmp_path):
+    target_path = str(tmp_path / "diagram.json")
+    autosave = UMLAutosaveService(uml_model, lambda: target_path, interval=0, idle_threshold=0)
+    autosave._start(is_self_polling=False)
+    try:
+        with autosave._suspend():
+            uml_model._add_class("Car", is_loading=False)
+            # The explicit save is in progress, no snapshot is handed over until it is done
+            uml_model._get_storage_manager()._write_json_atomic(target_path, uml_model._get_main_data())
+        # The saved state is the new starting point
+        assert not autosave._poll()
+        assert autosave._get_write_count() == 0
+    finally:
+        autosave._stop()
+
+def test_autosave_skips_data_loaded_from_another_database(uml_model, tmp_path):
+    controller = UMLController(uml_model, UMLView(), Console())
+    autosave = controller._get_autosave()
+    active_path = str(tmp_path / "active.umldb")
+    for class_name in ("Car", "CarSeat", "Bus"):
+        uml_model._add_class(class_name, is_loading=False)
+    assert uml_model._save_sqlite(active_path)
+    other_path = str(tmp_path / "other.umldb")
+    assert uml_model._save_sqlite(other_path)
+    with patch.object(uml_model, "_get_active_file_gui", return_value=active_path):
+        autosave._configure(interval=0, idle_threshold=0)
+        controller._start_autosave(is_gui=True)
+        try:
+            # Only part of a database that is not the active file
+            assert uml_model._load_sqlite(other_path, name_prefix="Car")
+            assert uml_model._is_detached()
+            uml_model._rename_class("Car", "Automobile")
+            assert not autosave._poll()
+            # Even the whole database is not the active file, until the data is replaced
+            assert uml_model._load_sqlite(other_path)
+            uml_model._add_class("Bike", is_loading=False)
+            assert not autosave._poll()
+            uml_model._reset_storage()
+            assert not uml_model._is_detached()
+            uml_model._add_class("Truck", is_loading=False)
+            assert autosave._poll()
+            assert _wait_for(lambda: autosave._get_write_count() == 1)
+        finally:
+            autosave._stop()
+    storage = UMLSQLiteStorage(active_path)
+    assert storage._get_class_names() == ["Truck"]
+    storage._close()
+    storage = UMLSQLiteStorage(other_path)
+    assert storage._get_class_names() == ["Car", "CarSeat", "Bus"]
+    storage._close()
+
+###############################################################################
+# UNDO HISTORY BUDGET TESTS #
+
+def test_undo_history_evicts_oldest_commands_past_entry_budget(uml_model):
+    input_handler = Command.InputHandler(max_entries=3)
+    for class_name in ["Car", "Wheel", "Door", "Seat", "Roof"]:
+        input_handler.execute_command(Command.AddClassCommand(uml_model, class_name=class_name))
+    history_stats = input_handler._get_history_stats()
+    assert history_stats["entries"] == 3
+    assert history_stats["evicted_entries"] == 2
+    assert history_stats["estimated_bytes"] > 0
+    # Only the three newest commands can be undone
+    for _ in range(5):
+        input_handler.undo()
+    assert list(uml_model._get_class_list()) == ["Car", "Wheel"]
+    # Undone commands are kept for redo when the budget shrinks
+    input_handler._set_budget(max_entries=1)
+    assert input_handler._get_history_stats()["redo_entries"] == 3
+    input_handler.redo()
+    input_handler.redo()
+    assert list(uml_model._get_class_list()) == ["Car", "Wheel", "Door", "Seat"]
+
+def test_undo_history_evicts_past_memory_budget(uml_model):
+    input_handler = Command.InputHandler()
+    input_handler.execute_command(Command.AddClassCommand(uml_model, class_name="Car"))
+    command_cost = input_handler._get_history_stats()["estimated_bytes"]
+    input_handler._set_budget(max_bytes=command_cost * 2)
+    for class_name in ["Wheel", "Door", "Seat"]:
+        input_handler.execute_command(Command.AddClassCommand(uml_model, class_name=class_name))
+    history_stats = input_handler._get_history_stats()
+    assert history_stats["estimated_bytes"] <= command_cost * 2
+    assert history_stats["entries"] + history_stats["evicted_entries"] == 4
+    # The last command done is kept even when it is over the budget on its own
+    input_handler._set_budget(max_bytes=0)
+    assert input_handler._get_history_stats()["entries"] == 1
+    input_handler.undo()
+    assert "Seat" not in uml_model._get_class_list()
+
+###############################################################################
+# DELETE CLASS UNDO TESTS #
+
+def test_delete_class_undo_restores_class_and_its_relationships(uml_model):
+    input_handler = Command.InputHandler()
+    for class_name in ["Car", "Wheel", "Door"]:
+        uml_model._add_class(class_name, is_loading=False)
+    uml_model._add_field("Car", "int", "speed")
+    uml_model._add_method("Car", "void", "drive")
+    uml_model._add_parameter("Car", "1", "int", "distance")
+    uml_model._add_relationship("Car", "Wheel", "Composition")
+    uml_model._add_relationship("Door", "Car", "Aggregation")
+    uml_model._add_relationship("Wheel", "Door", "Realization")
+    main_data_before = copy.deepcopy(uml_model._get_main_data())
+    delete_class_command = Command.DeleteClassCommand(uml_model, class_name="Car")
+    assert input_handler.execute_command(delete_class_command)
+    # Only the class and the relationships it takes part in are kept for undo
+    assert delete_class_command.class_delta["class"]["name"] == "Car"
+    assert {(relationship["source"], relationship["destination"]) for relationship in delete_class_command.class_delta["relationships"]} == {("Car", "Wheel"), ("Door", "Car")}
+    assert [(relationship._get_source_class(), relationship._get_destination_class()) for relationship in uml_model._get_relationship_list()] == [("Wheel", "Door")]
+    input_handler.undo()
+    main_data_after = uml_model._get_main_data()
+    assert sorted(main_data_after["classes"], key=lambda entry: entry["name"]) == sorted(main_data_before["classes"], key=lambda entry: entry["name"])
+    assert sorted(map(dict, main_data_after["relationships"]), key=lambda entry: entry["source"]) == sorted(map(dict, main_data_before["relationships"]), key=lambda entry: entry["source"])
+    input_handler.redo()
+    assert "Car" not in uml_model._get_class_list()
+    input_handler.undo()
+    assert uml_model._relationship_exist("Door", "Car")
+
+def test_delete_class_undo_skips_relationships_to_missing_classes(uml_model):
+    uml_model._add_class("Car", is_loading=False)
+    uml_model._add_class("Wheel", is_loading=False)
+    uml_model._add_relationship("Car", "Wheel", "Composition")
+    class_delta = uml_model._get_class_delta("Car")
+    assert uml_model._get_class_delta("Boat") is None
+    uml_model._delete_class("Car")
+    uml_model._delete_class("Wheel")
+    assert uml_model._restore_class(class_delta)
+    assert list(uml_model._get_class_list()) == ["Car"]
+    assert uml_model._get_relationship_list() == []
+    # A class with the same name is not overwritten
+    assert not uml_model._restore_class(class_delta)
+
+###############################################################################
+# GROUP MOVE TESTS #
+
+def test_change_type_undo_stores_only_the_old_type(uml_model):
+    uml_model._add_class("Car", is_loading=False)
+    uml_model._add_class("Wheel", is_loading=False)
+    uml_model._add_field("Car", "int", "speed", is_loading=False)
+    uml_model._add_relationship("Car", "Wheel", "Aggregation", is_loading=False)
+    input_handler = Command.InputHandler()
+    field_command = Command.ChangeTypeCommand(uml_model, class_name="Car", input_name="speed", new_type="float", is_field=True)
+    rel_command = Command.ChangeTypeCommand(uml_model, source_class="Car", dest_class="Wheel", new_type="Composition", is_rel=True)
+    assert input_handler.execute_command(field_command)
+    small_size = Command.estimate_command_size(field_command)
+    assert input_handler.execute_command(rel_command)
+    assert field_command.original_type == "int"
+    assert rel_command.original_type == "Aggregation"
+    # What a change keeps to undo itself does not grow with the diagram
+    for number in range(200):
+        uml_model._add_class(f"Extra{number}", is_loading=False)
+    big_command = Command.ChangeTypeCommand(uml_model, class_name="Car", input_name="speed", new_type="double", is_field=True)
+    assert input_handler.execute_command(big_command)
+    assert Command.estimate_command_size(big_command) <= small_size + 8
+    input_handler.undo()
+    input_handler.undo()
+    input_handler.undo()
+    car_entry = uml_model._get_main_data()["classes"][0]
+    assert car_entry["fields"] == [{"name": "speed", "type": "int"}]
+    assert uml_model._get_rel_type("Car", "Wheel") == "Aggregation"
+
+def test_group_move_is_one_undo_step():
+    box_a, box_b = MagicMock(), MagicMock()
+    input_handler = Command.InputHandler()
+    move_group_command = Command.MoveGroupCommand([(box_a, 0, 0, 10, 20), (box_b, 5, 5, 15, 25)])
+    assert input_handler.execute_command(move_group_command)
+    box_a.setPos.assert_called_with(10, 20)
+    box_b.setPos.assert_called_with(15, 25)
+    input_handler.undo()
+    box_a.setPos.assert_called_with(0, 0)
+    box_b.setPos.assert_called_with(5, 5)
+    assert input_handler._get_history_stats()["undo_entries"] == 0
+
+def test_consecutive_group_moves_merge_within_window():
+    box_a, box_b = MagicMock(), MagicMock()
+    input_handler = Command.InputHandler()
+    first_move = Command.MoveGroupCommand([(box_a, 0, 0, 10, 0), (box_b, 0, 5, 10, 5)])
+    input_handler.execute_command(first_move)
+    # A nudge of the same boxes right after is merged into the first move
+    input_handler.execute_command(Command.MoveGroupCommand([(box_b, 10, 5, 20, 5), (box_a, 10, 0, 20, 0)]))
+    assert input_handler._get_history_stats()["entries"] == 1
+    assert [move[1:] for move in first_move.move_list] == [[0, 0, 20, 0], [0, 5, 20, 5]]
+    # A move of other boxes, or one that starts after the window, is a step of its own
+    input_handler.execute_command(Command.MoveGroupCommand([(box_a, 20, 0, 30, 0)]))
+    late_move = Command.MoveGroupCommand([(box_a, 30, 0, 40, 0)], start_time=time.monotonic() + Command.MOVE_MERGE_WINDOW + 1)
+    input_handler.execute_command(late_move)
+    assert input_handler._get_history_stats()["entries"] == 3
+    input_handler.undo()
+    input_handler.undo()
+    input_handler.undo()
+    box_a.setPos.assert_called_with(0, 0)
+    box_b.setPos.assert_called_with(0, 5)
+
+###############################################################################
+# COMPOSITE COMMAND TESTS #
+
+def _build_class_commands(uml_model, class_name):
+    return [
+        Command.AddClassCommand(uml_model, class_name=class_name),
+        Command.AddFieldCommand(uml_model, class_name=class_name, type="int", field_name="speed"),
+        Command.AddFieldCommand(uml_model, class_name=class_name, type="str", field_name="model"),
+        Command.AddMethodCommand(uml_model, class_name=class_name, type="void", method_name="drive"),
+        Command.AddParameterCommand(uml_model, class_name=class_name, method_num="1", param_type="int", param_name="distance"),
+    ]
+
+def test_composite_command_runs_children_as_one_step(uml_model):
+    input_handler = Command.InputHandler()
+    composite_command = CommandFactory(uml_model).create_command(
+        command_name="composite", child_command_list=_build_class_commands(uml_model, "Car"))
+    version_before = uml_model._get_data_version()
+    with patch.object(uml_model, "_update_main_data_for_every_action", wraps=uml_model._update_main_data_for_every_action) as update_main_data:
+        assert input_handler.execute_command(composite_command)
+        # Main data is rebuilt once for the whole composite
+        assert update_main_data.call_count == 1
+    assert uml_model._get_data_version() > version_before
+    class_entry = uml_model._get_main_data()["classes"][0]
+    assert [field["name"] for field in class_entry["fields"]] == ["speed", "model"]
+    assert class_entry["methods"][0]["params"][0]["name"] == "distance"
+    assert input_handler._get_history_stats()["entries"] == 1
+    input_handler.undo()
+    assert uml_model._get_main_data()["classes"] == []
+    input_handler.redo()
+    assert len(uml_model._get_data_from_chosen_class("Car", is_field_list=True)) == 2
+
+def test_composite_command_is_all_or_nothing(uml_model):
+    child_command_list = _build_class_commands(uml_model, "Car")
+    # The field already exists, the whole composite is undone
+    child_command_list.append(Command.AddFieldCommand(uml_model, class_name="Car", type="int", field_name="speed"))
+    input_handler = Command.InputHandler()
+    assert not input_handler.execute_command(Command.CompositeCommand(uml_model, child_command_list))
+    assert "Car" not in uml_model._get_class_list()
+    assert uml_model._get_main_data()["classes"] == []
+    assert input_handler._get_history_stats()["entries"] == 0
+
+def test_failed_composite_command_sends_no_events(uml_model, sample_observer):
+    uml_model._add_class("Wheel", is_loading=False)
+    uml_model._attach_observer(sample_observer)
+    child_command_list = _build_class_commands(uml_model, "Car")
+    child_command_list.append(Command.AddFieldCommand(uml_model, class_name="Car", type="int", field_name="speed"))
+    assert not Command.CompositeCommand(uml_model, child_command_list).execute()
+    assert sample_observer.events == []
+    assert list(uml_model._get_class_list()) == ["Wheel"]
+    assert [entry["name"] for entry in uml_model._get_main_data()["classes"]] == ["Wheel"]
+    # Inside another batch the children are undone and the outer batch carries on
+    with uml_model._batch():
+        uml_model._add_class("Door", is_loading=False)
+        assert not Command.CompositeCommand(uml_model, list(child_command_list)).execute()
+    assert list(uml_model._get_class_list()) == ["Wheel", "Door"]
+    assert uml_model._get_main_data() == _full_rebuild_of(uml_model)
+
+def test_copy_class_command_is_one_undo_step(uml_model):
+    controller = UMLController(uml_model, UMLView(), Console())
+    input_handler = controller._get_input_handler()
+    for command in _build_class_commands(uml_model, "Car"):
+        assert input_handler.execute_command(command)
+    controller._process_command("copy_class", ["Car", "Truck"])
+    car_entry, truck_entry = uml_model._get_main_data()["classes"]
+    assert truck_entry["name"] == "Truck"
+    assert truck_entry["fields"] == car_entry["fields"]
+    assert truck_entry["methods"] == car_entry["methods"]
+    assert input_handler._get_history_stats()["entries"] == 6
+    input_handler.undo()
+    assert list(uml_model._get_class_list()) == ["Car"]
+    # Copying to a name in use adds nothing
+    controller._process_command("copy_class", ["Car", "Car"])
+    assert list(uml_model._get_class_list()) == ["Car"]
+    assert input_handler._get_history_stats()["entries"] == 5
+
+def _without_positions(main_data):
+    # Redoing an added class gives it the next default position
+    return [{key: value for key, value in class_entry.items() if key != "position"} for class_entry in main_data["classes"]]
+
+def _run_class_commands(uml_model, input_handler, class_count):
+    # Every main data snapshot by the number of commands done
+    snapshot_list = [_without_positions(uml_model._get_main_data())]
+    for number in range(class_count):
+        for command in _build_class_commands(uml_model, f"Class{number}"):
+            assert input_handler.execute_command(command)
+            snapshot_list.append(_without_positions(uml_model._get_main_data()))
+    return snapshot_list
+
+def test_go_to_history_entry_matches_undo_and_redo(uml_model):
+    input_handler = Command.InputHandler(uml_model=uml_model, checkpoint_interval=4)
+    snapshot_list = _run_class_commands(uml_model, input_handler, 4)
+    assert len(input_handler._get_history()) == 20
+    for position in (13, 2, 0, 17, 20, 9):
+        assert input_handler._go_to(position)
+        assert input_handler._get_position() == position
+        assert _without_positions(uml_model._get_main_data()) == snapshot_list[position]
+    assert not input_handler._go_to(21)
+    # Plain undo and redo keep working from where the history was moved to
+    input_handler.undo()
+    assert _without_positions(uml_model._get_main_data()) == snapshot_list[8]
+    input_handler.redo()
+    input_handler.redo()
+    assert _without_positions(uml_model._get_main_data()) == snapshot_list[10]
+
+def test_go_to_history_entry_replays_from_nearest_checkpoint(uml_model):
+    input_handler = Command.InputHandler(uml_model=uml_model, checkpoint_interval=5)
+    snapshot_list = _run_class_commands(uml_model, input_handler, 4)
+    assert [entry["position"] for entry in input_handler._get_history() if entry["has_checkpoint"]] == [5, 10, 15, 20]
+    with patch.object(uml_model, "_restore_checkpoint", wraps=uml_model._restore_checkpoint) as restore_checkpoint:
+        # From 20 back to 17, checkpoint 15 then two commands
+        assert input_handler._go_to(17)
+        restore_checkpoint.assert_called_once()
+        # Forward, the commands in between are run
+        input_handler._go_to(0)
+        assert input_handler._go_to(17)
+        restore_checkpoint.assert_called_once()
+    assert _without_positions(uml_model._get_main_data()) == snapshot_list[17]
+    # A new command drops the checkpoints past it
+    input_handler._go_to(12)
+    assert input_handler.execute_command(Command.AddClassCommand(uml_model, class_name="Extra"))
+    assert [entry["position"] for entry in input_handler._get_history() if entry["has_checkpoint"]] == [5, 10]
+
+def test_go_to_history_entry_sends_one_load_event(uml_model, sample_observer):
+    input_handler = Command.InputHandler(uml_model=uml_model, checkpoint_interval=5)
+    snapshot_list = _run_class_commands(uml_model, input_handler, 2)
+    uml_model._attach_observer(sample_observer)
+    # Straight onto checkpoint 5, nothing replayed after it
+    assert input_handler._go_to(5)
+    assert [event["event_type"] for event in sample_observer.events] == ["load"]
+    assert sample_observer.events[0]["data"] == {"class_count": 1, "relationship_count": 0}
+    assert _without_positions(uml_model._get_main_data()) == snapshot_list[5]
+    sample_observer.events.clear()
+    # The replayed commands are not announced one by one
+    assert input_handler._go_to(10)
+    assert input_handler._go_to(6)
+    assert [event["event_type"] for event in sample_observer.events].count("load") == 1
+    assert _without_positions(uml_model._get_main_data()) == snapshot_list[6]
+    assert uml_model._get_main_data() == _full_rebuild_of(uml_model)
+
+def test_restore_checkpoint_only_copies_changed_classes(uml_model):
+    for number in range(10):
+        uml_model._add_class(f"Class{number}", is_loading=False)
+    uml_model._add_relationship("Class0", "Class1", "Aggregation", is_loading=False)
+    uml_model._add_relationship("Class1", "Class2", "Aggregation", is_loading=False)
+    checkpoint = uml_model._create_checkpoint()
+    main_data_before = copy.deepcopy(uml_model._get_main_data())
+    live_class_list = uml_model._UMLModel__class_list
+    kept_class = live_class_list["Class5"]
+    kept_relationship = uml_model._UMLModel__relationship_by_pair[("Class0", "Class1")]
+    uml_model._add_field("Class3", "int", "speed", is_loading=False)
+    uml_model._rename_class("Class4", "Car")
+    uml_model._delete_class("Class2")
+    uml_model._add_class("Truck", is_loading=False)
+    with patch("copy.deepcopy", wraps=copy.deepcopy) as deep_copy:
+        uml_model._restore_checkpoint(checkpoint)
+    # Class2, Class3 and Class4 changed, the others are kept as they are
+    assert deep_copy.call_count == 3
+    assert uml_model._UMLModel__class_list["Class5"] is kept_class
+    assert uml_model._UMLModel__relationship_by_pair[("Class0", "Class1")] is kept_relationship
+    assert list(uml_model._get_class_list()) == [f"Class{number}" for number in range(10)]
+    assert uml_model._get_main_data() == main_data_before
+    assert uml_model._get_main_data() == _full_rebuild_of(uml_model)
+    # The model keeps working from the restored state
+    uml_model._rename_class("Class3", "Bus")
+    assert uml_model._get_main_data() == _full_rebuild_of(uml_model)
+
+def test_go_to_history_entry_ignores_checkpoints_after_outside_changes(uml_model):
+    input_handler = Command.InputHandler(uml_model=uml_model, checkpoint_interval=5)
+    _run_class_commands(uml_model, input_handler, 2)
+    input_handler._go_to(0)
+    # A change outside the history, the checkpoints no longer describe the diagram
+    uml_model._add_class("Outside")
+    with patch.object(uml_model, "_restore_checkpoint") as restore_checkpoint:
+        assert input_handler._go_to(9)
+        restore_checkpoint.assert_not_called()
+    assert "Outside" in uml_model._get_class_list()
+    assert not any(entry["has_checkpoint"] for entry in input_handler._get_history())
+
+def _build_mixed_commands(uml_model):
+    return [
+        Command.AddClassCommand(uml_model, class_name="A"),
+        Command.AddClassCommand(uml_model, class_name="B"),
+        Command.AddFieldCommand(uml_model, class_name="A", type="int", field_name="speed"),
+        Command.AddRelationshipCommand(uml_model, source_class="A", dest_class="B", rel_type="Aggregation"),
+        Command.RenameClassCommand(uml_model, class_name="A", new_name="Q"),
+        Command.AddMethodCommand(uml_model, class_name="Q", type="void", method_name="drive"),
+        Command.AddParameterCommand(uml_model, class_name="Q", method_num="1", param_type="int", param_name="distance"),
+        Command.DeleteClassCommand(uml_model, class_name="B"),
+        Command.AddClassCommand(uml_model, class_name="D"),
+        Command.RenameFieldCommand(uml_model, class_name="Q", old_field_name="speed", new_field_name="velocity"),
+    ]
+
+def _relationship_pairs(uml_model):
+    return sorted((entry["source"], entry["destination"]) for entry in uml_model._get_main_data()["relationships"])
+
+def test_go_to_history_entry_keeps_undo_data_of_skipped_commands(uml_model):
+    input_handler = Command.InputHandler(uml_model=uml_model, checkpoint_interval=3)
+    for command in _build_mixed_commands(uml_model):
+        assert input_handler.execute_command(command)
+    assert input_handler._go_to(0)
+    assert input_handler._go_to(10)
+    for _ in range(8):
+        input_handler.undo()
+    # Back at two commands done, the deleted class and its relationship came back on the way
+    assert sorted(uml_model._get_class_list()) == ["A", "B"]
+    assert _relationship_pairs(uml_model) == []
+    input_handler.redo()
+    input_handler.redo()
+    assert _relationship_pairs(uml_model) == [("A", "B")]
+
+def test_go_to_history_entry_matches_plain_undo_and_redo_randomly():
+    random_generator = random.Random(25)
+    for _ in range(20):
+        checkpointed_model = UMLModel(view=UMLView(), console=Console())
+        plain_model = UMLModel(view=UMLView(), console=Console())
+        checkpointed_handler = Command.InputHandler(uml_model=checkpointed_model, checkpoint_interval=random_generator.randint(1, 4))
+        plain_handler = Command.InputHandler()
+        for checkpointed_command, plain_command in zip(_build_mixed_commands(checkpointed_model), _build_mixed_commands(plain_model)):
+            assert checkpointed_handler.execute_command(checkpointed_command)
+            assert plain_handler.execute_command(plain_command)
+        for _ in range(30):
+            action = random_generator.choice(("goto", "undo", "redo"))
+            if action == "goto":
+                position = random_generator.randint(0, 10)
+                assert checkpointed_handler._go_to(position)
+                while plain_handler._get_position() > position:
+                    plain_handler.undo()
+                while plain_handler._get_position() < position:
+                    plain_handler.redo()
+            else:
+                getattr(checkpointed_handler, action)()
+                getattr(plain_handler, action)()
+            assert checkpointed_handler._get_position() == plain_handler._get_position()
+            assert _without_positions(checkpointed_model._get_main_data()) == _without_positions(plain_model._get_main_data())
+            assert _relationship_pairs(checkpointed_model) == _relationship_pairs(plain_model)
+
+def test_checkpoints_count_towards_memory_budget(uml_model):
+    input_handler = Command.InputHandler(uml_model=uml_model, checkpoint_interval=2)
+    _run_class_commands(uml_model, input_handler, 2)
+    stats = input_handler._get_history_stats()
+    assert stats["checkpoints"] == 5
+    command_only_handler = Command.InputHandler(uml_model=uml_model, checkpoint_interval=1000)
+    for command in _build_class_commands(uml_model, "Other"):
+        command_only_handler.execute_command(command)
+    # Over budget, the checkpoints are dropped before any command
+    input_handler._set_budget(max_bytes=stats["estimated_bytes"] - 1)
+    stats = input_handler._get_history_stats()
+    assert stats["checkpoints"] < 5
+    assert stats["entries"] == 10
+    input_handler._set_budget(max_bytes=1)
+    stats = input_handler._get_history_stats()
+    assert stats["checkpoints"] == 0
+    assert stats["estimated_bytes"] == sum(input_handler._InputHandler__cost_list)
@@ -0,0 +1,435 @@
+import sys
+import os
+import io
+import copy
+import gzip
+import json
+import pytest
+from rich.console import Console
+from unittest.mock import patch, MagicMock
+
+# ADD ROOT PATH #
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(root_path)
+
+from UML_MVC.UML_CONTROLLER import uml_storage_manager
+from UML_MVC.UML_CONTROLLER.uml_storage_manager import UMLStorageManager
+from UML_MVC.UML_CONTROLLER.uml_json_stream import UMLJsonRecordReader, iter_json_chunks, iter_main_data_records
+from UML_MVC.UML_CONTROLLER.uml_binary_snapshot import (UMLBinarySnapshot, convert_binary_to_json, convert_json_to_binary,
+                                                        is_binary_snapshot, write_binary_snapshot)
+from UML_MVC.UML_CONTROLLER.uml_sqlite_storage import UMLSQLiteStorage, is_sqlite_database
+from UML_MVC.UML_CONTROLLER.uml_saved_file_registry import UMLSavedFileRegistry
+from UML_MVC.UML_MODEL.uml_model import UMLModel
+from UML_MVC.UML_VIEW.UML_CLI_VIEW.uml_cli_view import UMLView
+
+###############################################################################
+
+@pytest.fixture
+def storage_manager(tmp_path, monkeypatch):
+    # Save diagrams into a temporary directory instead of the project root
+    monkeypatch.setattr(uml_storage_manager, "root_directory", str(tmp_path))
+    return UMLStorageManager()
+
+@pytest.fixture
+def sample_main_data():
+    return {
+        "classes": [
+            {"name": "Car", "fields": [{"name": "speed", "type": "int"}],
+             "methods": [{"name": "drive", "return_type": "void", "params": [{"name": "distance", "type": "int"}]}],
+             "position": {"x": 0, "y": 0}},
+        ],
+        "relationships": [],
+    }
+
+###############################################################################
+# SAVE TESTS #
+
+def test_save_writes_indented_json(storage_manager, sample_main_data, tmp_path):
+    storage_manager._save_data_to_json("diagram", sample_main_data)
+    text = (tmp_path / "diagram.json").read_text()
+    assert text == json.dumps(sample_main_data, indent=4)
+    assert os.listdir(tmp_path) == ["diagram.json"]
+
+def test_save_compact_json(storage_manager, sample_main_data, tmp_path):
+    storage_manager._set_compact(True)
+    storage_manager._save_data_to_json_gui(str(tmp_path / "diagram.json"), sample_main_data)
+    text = (tmp_path / "diagram.json").read_text()
+    assert "\n" not in text
+    assert json.loads(text) == sample_main_data
+
+def test_save_does_not_read_existing_file(storage_manager, sample_main_data, tmp_path):
+    file_path = tmp_path / "diagram.json"
+    # A corrupted file is simply replaced
+    file_path.write_text("{ not json")
+    storage_manager._save_data_to_json_gui(str(file_path), sample_main_data)
+    assert json.loads(file_path.read_text()) == sample_main_data
+
+def test_save_keeps_old_file_when_write_fails(storage_manager, sample_main_data, tmp_path):
+    file_path = tmp_path / "diagram.json"
+    storage_manager._save_data_to_json_gui(str(file_path), sample_main_data)
+    # An object that can't be encoded makes json.dump fail halfway through
+    broken_data = {"classes": sample_main_data["classes"], "relationships": [object()]}
+    assert storage_manager._write_json_atomic(str(file_path), broken_data) is False
+    assert json.loads(file_path.read_text()) == sample_main_data
+    assert os.listdir(tmp_path) == ["diagram.json"]
+
+def test_save_skips_existing_file_not_in_saved_list(storage_manager, sample_main_data, tmp_path):
+    file_path = tmp_path / "other.json"
+    file_path.write_text("{}")
+    # "other" was never saved through the storage manager, so it isn't overwritten
+    storage_manager._save_data_to_json("other", sample_main_data)
+    assert file_path.read_text() == "{}"
+
+###############################################################################
+# STREAMING WRITER TESTS #
+
+@pytest.mark.parametrize("is_compact", [False, True])
+@pytest.mark.parametrize("main_data", [
+    {},
+    {"classes": [], "relationships": []},
+    {"classes": [{"name": "Ünïcode \"quoted\"\n", "fields": [], "methods": [], "position": {"x": 1.5, "y": None}}],
+     "relationships": [{"source": "A", "destination": "B", "type": "Aggregation"}], "version": 2},
+])
+def test_stream_chunks_match_json_dump(main_data, is_compact):
+    if is_compact:
+        expected = json.dumps(main_data, separators=(",", ":"))
+    else:
+        expected = json.dumps(main_data, indent=4)
+    assert "".join(iter_json_chunks(main_data, is_compact=is_compact)) == expected
+
+def test_stream_chunks_accept_generators(sample_main_data):
+    section_table = {key: (entry for entry in value) for key, value in sample_main_data.items()}
+    assert "".join(iter_json_chunks(section_table)) == json.dumps(sample_main_data, indent=4)
+
+def test_save_streamed_model_matches_main_data(tmp_path, monkeypatch):
+    monkeypatch.setattr(uml_storage_manager, "root_directory", str(tmp_path))
+    uml_model = UMLModel(view=UMLView(), console=Console())
+    uml_model._add_class("Car", is_loading=False)
+    uml_model._add_class("Wheel", is_loading=False)
+    uml_model._add_field("Car", "int", "speed", is_loading=False)
+    uml_model._add_method("Car", "void", "drive", is_loading=False)
+    uml_model._add_parameter("Car", "1", "int", "distance", is_loading=False)
+    uml_model._add_relationship("Car", "Wheel", "Composition", is_loading=False)
+    storage_manager = uml_model._get_storage_manager()
+    storage_manager._save_data_to_json_gui(str(tmp_path / "diagram.json"), uml_model._iter_main_data())
+    expected = json.dumps(copy.deepcopy(uml_model._get_main_data()), indent=4)
+    assert (tmp_path / "diagram.json").read_text() == expected
+
+###############################################################################
+# STREAMING LOADER TESTS #
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+def test_record_reader_yields_records_in_file_order(sample_main_data, chunk_size):
+    sample_main_data["relationships"].append({"source": "Car", "destination": "Car", "type": "Aggregation"})
+    text = json.dumps(sample_main_data, indent=4)
+    progress_list = []
+    reader = UMLJsonRecordReader(io.BytesIO(text.encode("utf-8")), chunk_size=chunk_size,
+                                 progress_callback=lambda *progress: progress_list.append(progress))
+    assert list(reader._iter_records()) == list(iter_main_data_records(sample_main_data))
+    assert reader._get_bytes_read() == len(text)
+    assert reader._get_record_count("classes") == 1
+    assert progress_list[-1][0] == len(text)
+    assert progress_list[-1][2] == 1
+
+def test_record_reader_rejects_malformed_file():
+    reader = UMLJsonRecordReader(io.BytesIO(b'{"classes": [{"name": "Car"} {"name": "Bus"}]}'), chunk_size=4)
+    with pytest.raises(json.JSONDecodeError):
+        list(reader._iter_records())
+
+@pytest.mark.parametrize("text", [
+    b'{"classes": [], "relationships": []} garbage',
+    b'{"classes": [{"name": "Car"}]}{"x": 1}',
+    b'{}]',
+])
+def test_record_reader_rejects_extra_data(text):
+    reader = UMLJsonRecordReader(io.BytesIO(text), chunk_size=4)
+    with pytest.raises(json.JSONDecodeError, match="Extra data"):
+        list(reader._iter_records())
+
+def test_record_reader_accepts_trailing_whitespace():
+    reader = UMLJsonRecordReader(io.BytesIO(b'{"classes": [{"name": "Car"}]}\n\n  '), chunk_size=4)
+    assert list(reader._iter_records()) == [("classes", {"name": "Car"})]
+
+def test_load_builds_model_from_streamed_records(tmp_path, monkeypatch, sample_main_data):
+    monkeypatch.setattr(uml_storage_manager, "root_directory", str(tmp_path))
+    uml_model = UMLModel(view=UMLView(), console=Console())
+    (tmp_path / "diagram.json").write_text(json.dumps(sample_main_data, indent=4))
+    storage_manager = uml_model._get_storage_manager()
+    with patch("builtins.input", return_value="diagram"), \
+         patch.object(uml_model, "_saved_file_name_check", return_value=True), \
+         patch.object(uml_model, "_set_file_status"), \
+         patch.object(storage_manager, "_update_saved_list"):
+        uml_model._load()
+    assert list(uml_model._get_class_list()) == ["Car"]
+    assert uml_model._get_main_data() == sample_main_data
+
+def test_load_malformed_file_leaves_model_empty(tmp_path, monkeypatch, sample_main_data):
+    monkeypatch.setattr(uml_storage_manager, "root_directory", str(tmp_path))
+    uml_model = UMLModel(view=UMLView(), console=Console())
+    uml_model._add_class("Old", is_loading=False)
+    (tmp_path / "diagram.json").write_text(json.dumps(sample_main_data, indent=4)[:-10])
+    with patch("builtins.input", return_value="diagram"), \
+         patch.object(uml_model, "_saved_file_name_check", return_value=True), \
+         patch.object(uml_model, "_set_file_status") as mock_set_file_status:
+        uml_model._load()
+    mock_set_file_status.assert_not_called()
+    assert uml_model._get_class_list() == {}
+
+def test_load_gui_malformed_file_leaves_model_and_canvas_empty(tmp_path, sample_main_data):
+    uml_model = UMLModel(view=UMLView(), console=Console())
+    graphical_view = MagicMock()
+    graphical_view.class_name_list = {"Old": MagicMock()}
+    sample_main_data["classes"].append({"name": "Wheel", "fields": [], "methods": [], "position": {"x": 1, "y": 1}})
+    sample_main_data["relationships"].append({"source": "Car", "destination": "Wheel", "type": "Composition"})
+    file_path = tmp_path / "diagram.json"
+    # Cut in the relationships, every class has been read by then
+    file_path.write_text(json.dumps(sample_main_data, indent=4)[:-30])
+    assert not uml_model._load_records_from_file(str(file_path), graphical_view)
+    # The canvas is only built once the whole file was read
+    graphical_view.build_from_main_data.assert_not_called()
+    graphical_view.clear_current_scene.assert_called_once()
+    assert graphical_view.class_name_list == {}
+    assert uml_model._get_class_list() == {}
+    assert uml_model._get_main_data() == {"classes": [], "relationships": []}
+
+def test_load_gui_builds_canvas_once_from_loaded_data(tmp_path, sample_main_data):
+    uml_model = UMLModel(view=UMLView(), console=Console())
+    observer = MagicMock()
+    uml_model._attach_observer(observer)
+    graphical_view = MagicMock()
+    sample_main_data["classes"].append({"name": "Wheel", "fields": [], "methods": [], "position": {"x": 1, "y": 1}})
+    sample_main_data["relationships"].append({"source": "Car", "destination": "Wheel", "type": "Composition"})
+    file_path = tmp_path / "diagram.json"
+    file_path.write_text(json.dumps(sample_main_data))
+    assert uml_model._load_records_from_file(str(file_path), graphical_view)
+    # One validating pass in the model, one notification, then the canvas is built from the result
+    graphical_view.build_from_main_data.assert_called_once_with(uml_model._get_main_data())
+    graphical_view.add_class.assert_not_called()
+    graphical_view.add_field.assert_not_called()
+    assert [event.args[0] for event in observer._update.call_args_list] == ["load"]
+    assert [class_data["name"] for class_data in uml_model._get_main_data()["classes"]] == [class_data["name"] for class_data in sample_main_data["classes"]]
+
+###############################################################################
+# BINARY SNAPSHOT TESTS #
+
+def test_binary_snapshot_round_trip(sample_main_data, tmp_path):
+    sample_main_data["classes"].append({"name": "Wheel", "fields": [], "methods": [], "position": {"x": 2.5, "y": -3}})
+    sample_main_data["relationships"].append({"source": "Car", "destination": "Wheel", "type": "Composition"})
+    binary_path = tmp_path / "diagram.umlb"
+    with open(binary_path, "wb") as binary_file:
+        write_binary_snapshot(binary_file, sample_main_data)
+    assert is_binary_snapshot(str(binary_path))
+    with open(binary_path, "rb") as binary_file:
+        snapshot = UMLBinarySnapshot(binary_file)
+        assert snapshot._get_class_count() == 2
+        assert snapshot._get_class_name(1) == "Wheel"
+        assert list(snapshot._iter_records()) == list(iter_main_data_records(sample_main_data))
+        snapshot._close()
+
+def test_convert_between_json_and_binary(sample_main_data, tmp_path):
+    json_path, binary_path, converted_path = tmp_path / "diagram.json", tmp_path / "diagram.umlb", tmp_path / "converted.json"
+    json_path.write_text(json.dumps(sample_main_data, indent=4))
+    convert_json_to_binary(str(json_path), str(binary_path))
+    convert_binary_to_json(str(binary_path), str(converted_path))
+    assert converted_path.read_text() == json_path.read_text()
+    assert binary_path.stat().st_size < json_path.stat().st_size
+
+def test_storage_detects_binary_snapshot(storage_manager, sample_main_data, tmp_path):
+    binary_path = str(tmp_path / "diagram.umlb")
+    storage_manager._save_data_to_json_gui(binary_path, sample_main_data)
+    assert is_binary_snapshot(binary_path)
+    # The format comes from the content, not from the file name
+    os.rename(binary_path, tmp_path / "renamed.json")
+    record_iter = storage_manager._load_records_from_json("renamed")
+    assert list(record_iter) == list(iter_main_data_records(sample_main_data))
+    # Saving over an existing snapshot keeps it binary
+    storage_manager._save_data_to_json_gui(str(tmp_path / "renamed.json"), sample_main_data)
+    assert is_binary_snapshot(str(tmp_path / "renamed.json"))
+
+###############################################################################
+# COMPRESSED JSON TESTS #
+
+@pytest.mark.parametrize("extension, magic", [(".json.gz", b"\x1f\x8b"), (".json.xz", b"\xfd7zXZ\x00")])
+def test_compressed_round_trip(storage_manager, sample_main_data, tmp_path, extension, magic):
+    file_path = tmp_path / f"diagram{extension}"
+    assert storage_manager._save_data_to_json_gui(str(file_path), sample_main_data)
+    assert file_path.read_bytes().startswith(magic)
+    assert os.listdir(tmp_path) == [file_path.name]
+    progress_list = []
+    record_list = list(storage_manager._load_records_from_json_gui(str(file_path), lambda *progress: progress_list.append(progress)))
+    assert record_list == list(iter_main_data_records(sample_main_data))
+    assert progress_list[-1][0] == progress_list[-1][1] == file_path.stat().st_size
+    # The copy kept with the saved files is plain JSON
+    assert storage_manager._copy_data_to_json(str(file_path), "copy")
+    assert json.loads((tmp_path / "copy.json").read_text()) == sample_main_data
+    assert storage_manager._get_file_name(str(file_path)) == "diagram"
+
+def test_compression_is_detected_from_content(storage_manager, sample_main_data, tmp_path):
+    file_path = tmp_path / "diagram.json"
+    file_path.write_bytes(gzip.compress(json.dumps({"classes": [], "relationships": []}).encode()))
+    # An existing compressed file stays compressed whatever its name
+    assert storage_manager._save_data_to_json_gui(str(file_path), sample_main_data)
+    assert json.loads(gzip.decompress(file_path.read_bytes())) == sample_main_data
+    assert list(storage_manager._load_records_from_json_gui(str(file_path))) == list(iter_main_data_records(sample_main_data))
+
+def test_corrupted_compressed_file_fails_to_load(storage_manager, sample_main_data, tmp_path):
+    file_path = tmp_path / "diagram.json.xz"
+    storage_manager._save_data_to_json_gui(str(file_path), sample_main_data)
+    file_path.write_bytes(file_path.read_bytes()[:40])
+    with pytest.raises(json.JSONDecodeError):
+        list(storage_manager._load_records_from_json_gui(str(file_path)))
+
+###############################################################################
+# SQLITE STORAGE TESTS #
+
+def test_sqlite_round_trip_and_subsets(storage_manager, sample_main_data, tmp_path):
+    sample_main_data["classes"].append({"name": "CarWheel", "fields": [], "methods": [], "position": {"x": 2.5, "y": -3}})
+    sample_main_data["classes"].append({"name": "Bus", "fields": [], "methods": []})
+    sample_main_data["relationships"].append({"source": "Car", "destination": "CarWheel", "type": "Composition"})
+    sample_main_data["relationships"].append({"source": "Bus", "destination": "Car", "type": "Aggregation"})
+    db_path = str(tmp_path / "diagram.umldb")
+    assert storage_manager._save_data_to_sqlite(db_path, sample_main_data)
+    assert is_sqlite_database(db_path)
+    # Full loads go through the same detection as JSON files and binary snapshots
+    assert list(storage_manager._load_records_from_json_gui(db_path)) == list(iter_main_data_records(sample_main_data))
+    # Subsets only get the relationships between their own classes
+    record_list = list(storage_manager._load_records_from_sqlite(db_path, name_prefix="Car"))
+    assert [record["name"] for section, record in record_list if section == "classes"] == ["Car", "CarWheel"]
+    assert [record for section, record in record_list if section == "relationships"] == [sample_main_data["relationships"][0]]
+    record_list = list(storage_manager._load_records_from_sqlite(db_path, class_name_list=["Bus", "Missing"]))
+    assert record_list == [("classes", sample_main_data["classes"][2])]
+
+def test_sqlite_save_only_writes_changed_classes(tmp_path):
+    uml_model = UMLModel(view=UMLView(), console=Console())
+    for class_name in ("Car", "Bus", "Train"):
+        uml_model._add_class(class_name, is_loading=False)
+    uml_model._add_relationship("Car", "Bus", "Aggregation", is_loading=False)
+    db_path = str(tmp_path / "diagram.umldb")
+    storage_manager = uml_model._get_storage_manager()
+    assert uml_model._save_sqlite(db_path)
+    uml_model._add_field("Bus", "int", "seats", is_loading=False)
+    uml_model._delete_class("Train")
+    with patch.object(storage_manager, "_save_data_to_sqlite") as mock_save_all, \
+         patch.object(storage_manager, "_save_changes_to_sqlite", wraps=storage_manager._save_changes_to_sqlite) as mock_save_changes:
+        assert uml_model._save_sqlite(db_path)
+    mock_save_all.assert_not_called()
+    class_entry_iter, deleted_class_name_list = mock_save_changes.call_args.args[1:3]
+    assert deleted_class_name_list == ["Train"]
+    expected_data = copy.deepcopy(uml_model._get_main_data())
+    assert list(storage_manager._load_records_from_sqlite(db_path)) == list(iter_main_data_records(expected_data))
+    # Nothing changed since, nothing is written
+    with patch.object(storage_manager, "_save_changes_to_sqlite", wraps=storage_manager._save_changes_to_sqlite) as mock_save_changes:
+        assert uml_model._save_sqlite(db_path)
+    assert list(mock_save_changes.call_args.args[1]) == []
+
+def test_sqlite_subset_save_keeps_other_classes(tmp_path):
+    uml_model = UMLModel(view=UMLView(), console=Console())
+    for class_name in ("Car", "CarSeat", "Bus"):
+        uml_model._add_class(class_name, is_loading=False)
+    uml_model._add_relationship("Bus", "Car", "Aggregation", is_loading=False)
+    uml_model._add_relationship("CarSeat", "Car", "Composition", is_loading=False)
+    db_path = str(tmp_path / "diagram.umldb")
+    assert uml_model._save_sqlite(db_path)
+    # Load only the Car classes, rename one of them and save back
+    assert uml_model._load_sqlite(db_path, name_prefix="Car")
+    assert list(uml_model._get_class_list()) == ["Car", "CarSeat"]
+    uml_model._rename_class("Car", "Automobile")
+    assert uml_model._save_sqlite(db_path)
+    storage = UMLSQLiteStorage(db_path)
+    assert storage._get_class_names() == ["Automobile", "CarSeat", "Bus"]
+    relationship_list = [record for section, record in storage._iter_records() if section == "relationships"]
+    storage._close()
+    # The relationship of the class that was not loaded follows the rename
+    assert relationship_list == [{"source": "Bus", "destination": "Automobile", "type": "Aggregation"},
+                                 {"source": "CarSeat", "destination": "Automobile", "type": "Composition"}]
+
+###############################################################################
+# SAVED FILE REGISTRY TESTS #
+
+def test_registry_migrates_old_name_list(tmp_path):
+    registry_path = tmp_path / "NAME_LIST.json"
+    registry_path.write_text(json.dumps([{"first": "off"}, {"second": "on"}, {"third": "off"}], indent=4))
+    registry = UMLSavedFileRegistry(str(registry_path))
+    assert list(registry) == ["first", "second", "third"]
+    assert registry._get_active() == "second"
+    assert registry._to_list() == [{"first": "off"}, {"second": "on"}, {"third": "off"}]
+    # Nothing changed, the old file is left as it is
+    assert registry._flush()
+    assert isinstance(json.loads(registry_path.read_text()), list)
+    registry._set_status("third", "on")
+    assert registry._flush()
+    assert json.loads(registry_path.read_text()) == {"version": 2, "active": "third", "files": ["first", "second", "third"]}
+    reread_registry = UMLSavedFileRegistry(str(registry_path))
+    assert list(reread_registry) == ["first", "second", "third"]
+    assert reread_registry._get_active() == "third"
+
+def test_registry_only_writes_when_dirty(tmp_path):
+    registry_path = tmp_path / "NAME_LIST.json"
+    registry_path.write_text("")
+    registry = UMLSavedFileRegistry(str(registry_path))
+    assert len(registry) == 0
+    assert registry._add("diagram")
+    assert not registry._add("diagram")
+    registry._set_active("diagram")
+    assert registry._is_dirty()
+    assert registry._flush()
+    assert not registry._is_dirty()
+    modified_time = os.stat(registry_path).st_mtime_ns
+    # Setting the same state again leaves the registry clean
+    registry._set_status("diagram", "on")
+    registry._set_active("unknown")
+    assert not registry._is_dirty()
+    assert os.stat(registry_path).st_mtime_ns == modified_time
+    assert registry._remove("diagram")
+    assert registry._get_active() is None
+    assert registry._flush()
+    assert os.listdir(tmp_path) == ["NAME_LIST.json"]
+
+###############################################################################
+# NO-OP SAVE AND LOAD TESTS #
+
+def test_save_gui_skips_unchanged_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(uml_storage_manager, "root_directory", str(tmp_path))
+    uml_model = UMLModel(view=UMLView(), console=Console())
+    uml_model._add_class("Car", is_loading=False)
+    storage_manager = uml_model._get_storage_manager()
+    full_path = str(tmp_path / "chosen" / "diagram.json")
+    os.mkdir(tmp_path / "chosen")
+    storage_manager._get_saved_registry()._add("diagram")
+    with patch.object(storage_manager, "_update_saved_list"), \
+         patch.object(storage_manager, "_update_saved_list_gui"), \
+         patch.object(storage_manager, "_add_name_to_saved_file_gui"), \
+         patch.object(storage_manager, "_write_json_atomic", wraps=storage_manager._write_json_atomic) as mock_write:
+        uml_model._save_gui("diagram", full_path, {})
+        assert mock_write.call_count == 2
+        # Nothing changed, neither file is written again
+        uml_model._save_gui("diagram", full_path, {})
+        assert mock_write.call_count == 2
+        # The chosen path is the saved file itself, it is written once
+        uml_model._add_class("Wheel", is_loading=False)
+        uml_model._save_gui("diagram", str(tmp_path / "diagram.json"), {})
+        assert mock_write.call_count == 3
+        # A file changed on disk is written again
+        (tmp_path / "chosen" / "diagram.json").write_text("{}")
+        uml_model._save_gui("diagram", full_path, {})
+        assert mock_write.call_count == 4
+    assert json.loads((tmp_path / "chosen" / "diagram.json").read_text()) == uml_model._get_main_data()
+
+def test_reloading_unchanged_active_file_is_a_no_op(tmp_path, monkeypatch, sample_main_data):
+    monkeypatch.setattr(uml_storage_manager, "root_directory", str(tmp_path))
+    uml_model = UMLModel(view=UMLView(), console=Console())
+    (tmp_path / "diagram.json").write_text(json.dumps(sample_main_data, indent=4))
+    storage_manager = uml_model._get_storage_manager()
+    storage_manager._get_saved_registry()._add("diagram")
+    with patch("builtins.input", return_value="diagram"), \
+         patch.object(storage_manager, "_update_saved_list"), \
+         patch.object(storage_manager, "_load_records_from_json", wraps=storage_manager._load_records_from_json) as mock_load:
+        uml_model._load()
+        assert uml_model._get_active_file() == "diagram"
+        uml_model._load()
+        assert mock_load.call_count == 1
+        # Once the model changed, loading reads the file again
+        uml_model._add_class("Wheel", is_loading=False)
+        uml_model._load()
+        assert mock_load.call_count == 2
+    assert uml_model._get_main_data() == sample_main_data
@@ -57,9 +57,9 @@ def test_set_class_field_list(uml_class, sample_field):
     uml_class._set_class_field_list([sample_field])
     assert uml_class._get_class_field_list() == [sample_field]
 
-def test_get_method_and_parameters_list(uml_class):
-    # Test getting the method and parameters list (initially empty)
-    assert uml_class._get_method_and_parameters_list() == []
+def test_get_method_table(uml_class):
+    # Test getting the method table (initially empty)
+    assert len(uml_class._get_method_table()) == 0
 
 def test_get_position():
     # Reset position to ensure consistent test results
@@ -161,3 +161,26 @@ def test_set_position():
     expected_position = {'x': new_x, 'y': new_y}
     assert uml_class._get_position() == expected_position
 
+
+###############################################################################
+# Member table tests
+
+def test_field_table_follows_add_rename_remove(uml_class, sample_field):
+    uml_class._add_field(sample_field)
+    assert uml_class._get_field("sample_field") is sample_field
+    uml_class._rename_field(sample_field, "renamed_field")
+    assert uml_class._get_field("sample_field") is None
+    assert uml_class._get_field("renamed_field") is sample_field
+    uml_class._remove_field(sample_field)
+    assert uml_class._get_field("renamed_field") is None
+    assert uml_class._get_class_field_list() == []
+
+def test_set_class_field_list_rebuilds_field_table(uml_class, sample_field):
+    uml_class._set_class_field_list([sample_field])
+    assert uml_class._get_field("sample_field") is sample_field
+
+def test_core_entities_have_no_instance_dict(uml_class, sample_field):
+    # Core entities use __slots__, so they cannot grow a per-instance __dict__
+    for entity in (uml_class, sample_field, uml_class._get_method_table(),
+                   Method("void", "run"), Parameter("int", "value")):
+        assert not hasattr(entity, "__dict__")
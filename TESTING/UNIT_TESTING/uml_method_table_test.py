@@ -0,0 +1,108 @@
+import sys
+import os
+import pytest
+
+###############################################################################
+# ADD ROOT PATH #
+# Adjusting the path to allow imports from the project root
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(root_path)
+
+# Testing Module
+from UML_CORE.UML_METHOD.uml_method_table import UMLMethodTable
+from UML_CORE.UML_METHOD.uml_method import UMLMethod as Method
+from UML_CORE.UML_PARAMETER.uml_parameter import UMLParameter as Parameter
+
+###############################################################################
+
+@pytest.fixture
+def method_table():
+    # Fixture to set up an empty UMLMethodTable for testing
+    return UMLMethodTable()
+
+@pytest.fixture
+def sample_method():
+    # Fixture to create a UMLMethod object
+    return Method(type="void", method_name="sampleMethod")
+
+@pytest.fixture
+def sample_parameter():
+    # Fixture to create a UMLParameter object
+    return Parameter(type="int", parameter_name="sampleParam")
+
+###############################################################################
+
+def test_append_and_get_by_index(method_table, sample_method, sample_parameter):
+    method_table._append(sample_method, [sample_parameter])
+    assert len(method_table) == 1
+    assert method_table._get_method(0) is sample_method
+    assert method_table._get_parameter_list(sample_method) == [sample_parameter]
+    assert list(method_table) == [(sample_method, [sample_parameter])]
+
+def test_overloads_keep_method_number_order(method_table, sample_parameter):
+    first = Method(type="void", method_name="run")
+    other = Method(type="void", method_name="stop")
+    second = Method(type="void", method_name="run")
+    method_table._append(first, [])
+    method_table._append(other, [])
+    method_table._append(second, [sample_parameter])
+    assert method_table._get_overloads("run") == [first, second]
+    # Renaming into an existing name keeps the overloads ordered by method number
+    method_table._rename(other, "run")
+    assert method_table._get_overloads("run") == [first, other, second]
+    assert method_table._get_overloads("stop") == []
+    method_table._remove(first)
+    assert method_table._get_overloads("run") == [other, second]
+    assert method_table._get_method(0) is other
+
+def test_parameter_table_follows_add_rename_remove(method_table, sample_method, sample_parameter):
+    method_table._append(sample_method, [])
+    method_table._add_parameter(sample_method, sample_parameter)
+    assert method_table._get_parameter(sample_method, "sampleParam") is sample_parameter
+    method_table._rename_parameter(sample_method, sample_parameter, "renamedParam")
+    assert method_table._get_parameter(sample_method, "sampleParam") is None
+    assert method_table._get_parameter(sample_method, "renamedParam") is sample_parameter
+    method_table._remove_parameter(sample_method, sample_parameter)
+    assert method_table._get_parameter(sample_method, "renamedParam") is None
+    assert method_table._get_parameter_list(sample_method) == []
+
+def test_replace_parameter_list(method_table, sample_method, sample_parameter):
+    method_table._append(sample_method, [sample_parameter])
+    new_param = Parameter(type="str", parameter_name="label")
+    method_table._replace_parameter_list(sample_method, [new_param])
+    assert method_table._get_parameter(sample_method, "sampleParam") is None
+    assert method_table._get_parameter(sample_method, "label") is new_param
+    assert method_table._get_parameter_list(sample_method) == [new_param]
+
+def test_parameters_are_scoped_per_method(method_table, sample_parameter):
+    first = Method(type="void", method_name="run")
+    second = Method(type="void", method_name="run")
+    method_table._append(first, [sample_parameter])
+    method_table._append(second, [])
+    assert method_table._get_parameter(second, "sampleParam") is None
+
+def test_signature_follows_method_and_parameter_changes(method_table, sample_method, sample_parameter):
+    method_table._append(sample_method, [sample_parameter])
+    assert method_table._has_signature(("sampleMethod", ("int",)))
+    method_table._set_parameter_type(sample_method, sample_parameter, "float")
+    assert not method_table._has_signature(("sampleMethod", ("int",)))
+    assert method_table._has_signature(("sampleMethod", ("float",)))
+    method_table._add_parameter(sample_method, Parameter(type="str", parameter_name="label"))
+    assert method_table._has_signature(("sampleMethod", ("float", "str")))
+    method_table._rename(sample_method, "run")
+    assert not method_table._has_signature(("sampleMethod", ("float", "str")))
+    assert method_table._has_signature(("run", ("float", "str")))
+    method_table._replace_parameter_list(sample_method, [])
+    assert method_table._has_signature(("run", ()))
+    method_table._remove(sample_method)
+    assert not method_table._has_signature(("run", ()))
+
+def test_shared_signature_is_kept_until_last_method_changes(method_table):
+    first = Method(type="void", method_name="run")
+    second = Method(type="int", method_name="run")
+    method_table._append(first, [])
+    method_table._append(second, [])
+    method_table._remove(first)
+    assert method_table._has_signature(("run", ()))
+    method_table._remove(second)
+    assert not method_table._has_signature(("run", ()))
@@ -1,9 +1,11 @@
 from typing import List, Dict, Optional
 
 from UML_CORE.UML_FIELD.uml_field import UMLField as Field
-from UML_CORE.UML_METHOD.uml_method import UMLMethod as Method
-from UML_CORE.UML_PARAMETER.uml_parameter import UMLParameter as Parameter
+from UML_CORE.UML_METHOD.uml_method_table import UMLMethodTable as MethodTable
 class UMLClass:
+    # Fixed attribute layout, no per-instance __dict__
+    __slots__ = ("__class_name", "__field_list", "__field_table", "__method_table", "__position")
+
 
     # Private class variables to track the default position for new classes
     __last_x = 0
@@ -19,9 +21,11 @@ class UMLClass:
         # Store field name and the related field object
         # so we can easily access to the its details
         self.__field_list: List[Field] = []
+        # Field name -> field, kept in sync with the field list
+        self.__field_table: Dict[str, Field] = {}
         
-        # Store method and its parameters
-        self.__method_and_parameter_list: List[Dict[Method, List[Parameter]]] = []
+        # Store methods and their parameters in method number order
+        self.__method_table: MethodTable = MethodTable()
                 
         # If position is provided (e.g., from loaded data), use it; otherwise, use default incrementing position
         if x is not None and y is not None:
@@ -39,12 +43,15 @@ class UMLClass:
     def _get_class_field_list(self) -> List[Field]:
         return self.__field_list
     
-    def _get_method_and_parameters_list(self) -> List[Dict[Method, List[Parameter]]]:
-        return self.__method_and_parameter_list
+    def _get_method_table(self) -> MethodTable:
+        return self.__method_table
     
     def _get_position(self) -> Dict[str, int]:
         return self.__position
     
+    def _get_field(self, field_name: str) -> Optional[Field]:
+        return self.__field_table.get(field_name)
+    
     def __str__(self):
         return f"Class name: {self.__class_name}"
 
@@ -55,13 +62,26 @@ class UMLClass:
 
     def _set_class_field_list(self, new_field_list: List[Field]):
         self.__field_list = new_field_list
+        self.__field_table = {field._get_name(): field for field in new_field_list}
         
-    def _set_parameter_list(self, new_params_list: List[Parameter]):
-        self.parameter_list = new_params_list
-
     def _set_position(self, x: int, y: int):
         self.__position = {"x": x, "y": y}
         
+    #################################################################
+    # Method to modify fields through the field table #
+    def _add_field(self, field: Field):
+        self.__field_list.append(field)
+        self.__field_table[field._get_name()] = field
+
+    def _remove_field(self, field: Field):
+        self.__field_list.remove(field)
+        self.__field_table.pop(field._get_name(), None)
+
+    def _rename_field(self, field: Field, new_name: str):
+        self.__field_table.pop(field._get_name(), None)
+        field._set_name(new_name)
+        self.__field_table[new_name] = field
+        
     #################################################################
     # Method to convert uml class to json format #
     def _convert_to_json_uml_class(self) -> dict[str, list]:
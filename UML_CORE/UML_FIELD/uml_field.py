@@ -1,4 +1,7 @@
 class UMLField:
+    # Fixed attribute layout, no per-instance __dict__
+    __slots__ = ("__type", "__field_name")
+
     # UML class attribute constructor
     # Create an attribute to add to the UML Class
     def __init__(self,type: str = "", field_name: str = ""):
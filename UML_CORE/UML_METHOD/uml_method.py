@@ -1,4 +1,7 @@
 class UMLMethod:
+    # Fixed attribute layout, no per-instance __dict__
+    __slots__ = ("__type", "__method_name")
+
     # UML class method constructor
     # Create a method to add to the UML Class
     def __init__(self,type: str = "", method_name: str = ""):
@@ -0,0 +1,141 @@
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from UML_CORE.UML_METHOD.uml_method import UMLMethod as Method
+from UML_CORE.UML_PARAMETER.uml_parameter import UMLParameter as Parameter
+
+class UMLMethodTable:
+    # Fixed attribute layout, no per-instance __dict__
+    __slots__ = ("__method_list", "__parameter_list_table", "__name_table", "__parameter_table", "__signature_table")
+
+
+    #################################################################
+    # Uml method table constructor
+    # Ordered method storage of a class including:
+    def __init__(self):
+        # Methods in method number order (method number = index + 1)
+        self.__method_list: List[Method] = []
+
+        # Parameter list of each method
+        self.__parameter_list_table: Dict[Method, List[Parameter]] = {}
+
+        # Method name -> overloads in method number order
+        self.__name_table: Dict[str, List[Method]] = {}
+
+        # (method, parameter name) -> parameter
+        self.__parameter_table: Dict[Tuple[Method, str], Parameter] = {}
+
+        # (method name, parameter types) -> number of methods with that signature
+        self.__signature_table: Dict[Tuple[str, Tuple[str, ...]], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.__method_list)
+
+    def __iter__(self) -> Iterator[Tuple[Method, List[Parameter]]]:
+        for method in self.__method_list:
+            yield method, self.__parameter_list_table[method]
+
+    #################################################################
+    # Method to get method table's data members #
+    def _get_method(self, index: int) -> Method:
+        return self.__method_list[index]
+
+    def _get_method_list(self) -> List[Method]:
+        return self.__method_list
+
+    def _get_parameter_list(self, method: Method) -> List[Parameter]:
+        return self.__parameter_list_table[method]
+
+    def _get_overloads(self, method_name: str) -> List[Method]:
+        return self.__name_table.get(method_name, [])
+
+    def _get_parameter(self, method: Method, parameter_name: str) -> Optional[Parameter]:
+        return self.__parameter_table.get((method, parameter_name))
+
+    def _get_index(self, method: Method) -> int:
+        return self.__method_list.index(method)
+
+    def _get_signature(self, method: Method) -> Tuple[str, Tuple[str, ...]]:
+        return method._get_name(), tuple(param._get_type() for param in self.__parameter_list_table[method])
+
+    def _has_signature(self, signature: Tuple[str, Tuple[str, ...]]) -> bool:
+        return signature in self.__signature_table
+
+    #################################################################
+    # Method to modify method table's data members #
+    def _append(self, method: Method, param_list: List[Parameter]):
+        self.__method_list.append(method)
+        self.__parameter_list_table[method] = param_list
+        self.__name_table.setdefault(method._get_name(), []).append(method)
+        for param in param_list:
+            self.__parameter_table[method, param._get_parameter_name()] = param
+        self.__link_signature(method)
+
+    def _remove(self, method: Method):
+        self.__unlink_signature(method)
+        self.__method_list.remove(method)
+        self.__unlink_name(method)
+        for param in self.__parameter_list_table.pop(method):
+            self.__parameter_table.pop((method, param._get_parameter_name()), None)
+
+    def _rename(self, method: Method, new_name: str):
+        self.__unlink_signature(method)
+        self.__unlink_name(method)
+        method._set_name(new_name)
+        # Rebuild the overloads of the new name so they stay in method number order
+        self.__name_table[new_name] = [each_method for each_method in self.__method_list if each_method._get_name() == new_name]
+        self.__link_signature(method)
+
+    def _add_parameter(self, method: Method, param: Parameter):
+        self.__unlink_signature(method)
+        self.__parameter_list_table[method].append(param)
+        self.__parameter_table[method, param._get_parameter_name()] = param
+        self.__link_signature(method)
+
+    def _remove_parameter(self, method: Method, param: Parameter):
+        self.__unlink_signature(method)
+        self.__parameter_list_table[method].remove(param)
+        self.__parameter_table.pop((method, param._get_parameter_name()), None)
+        self.__link_signature(method)
+
+    def _rename_parameter(self, method: Method, param: Parameter, new_name: str):
+        self.__parameter_table.pop((method, param._get_parameter_name()), None)
+        param._set_parameter_name(new_name)
+        self.__parameter_table[method, new_name] = param
+
+    def _set_parameter_type(self, method: Method, param: Parameter, new_type: str):
+        self.__unlink_signature(method)
+        param._set_type(new_type)
+        self.__link_signature(method)
+
+    def _replace_parameter_list(self, method: Method, new_param_list: List[Parameter]):
+        self.__unlink_signature(method)
+        param_list = self.__parameter_list_table[method]
+        for param in param_list:
+            self.__parameter_table.pop((method, param._get_parameter_name()), None)
+        param_list[:] = new_param_list
+        for param in new_param_list:
+            self.__parameter_table[method, param._get_parameter_name()] = param
+        self.__link_signature(method)
+
+    # Remove a method from the overloads of its current name #
+    def __unlink_name(self, method: Method):
+        method_name = method._get_name()
+        overload_list = self.__name_table.get(method_name, [])
+        if method in overload_list:
+            overload_list.remove(method)
+        if not overload_list:
+            self.__name_table.pop(method_name, None)
+
+    # Count the current signature of a method #
+    def __link_signature(self, method: Method):
+        signature = self._get_signature(method)
+        self.__signature_table[signature] = self.__signature_table.get(signature, 0) + 1
+
+    # Drop the current signature of a method, before it changes #
+    def __unlink_signature(self, method: Method):
+        signature = self._get_signature(method)
+        count = self.__signature_table.get(signature, 0)
+        if count > 1:
+            self.__signature_table[signature] = count - 1
+        else:
+            self.__signature_table.pop(signature, None)
@@ -1,4 +1,7 @@
 class UMLRelationship:
+    # Fixed attribute layout, no per-instance __dict__
+    __slots__ = ("__source_class", "__destination_class", "__rel_type")
+
     # UML class relationship constructor
     # Create a relationship between classes
     def __init__(
@@ -8,9 +8,12 @@ from enum import Enum
 
 class InterfaceOptions(Enum):
     MOVE_UNIT = "move_unit" # This is created  for factory command
+    MOVE_GROUP = "move_group" # This is created  for factory command
+    COMPOSITE = "composite" # This is created  for factory command
     ADD_CLASS = "add_class"
     DELETE_CLASS = "delete_class"
     RENAME_CLASS = "rename_class"
+    COPY_CLASS = "copy_class"
     ADD_FIELD = "add_field"
     DELETE_FIELD = "delete_field"
     RENAME_FIELD = "rename_field"
@@ -30,6 +33,9 @@ class InterfaceOptions(Enum):
     EDIT_REL_TYPE = "edit_rel_type"
     UNDO = "undo"
     REDO = "redo"
+    UNDO_STATS = "undo_stats"
+    HISTORY = "history"
+    GOTO = "goto"
     LIST_CLASS = "list_class"
     CLASS_DETAIL = "class_detail"
     CLASS_REL = "class_rel"
@@ -47,6 +53,7 @@ class InterfaceOptions(Enum):
 class RequireClassFirstInput(Enum):
     DELETE_CLASS = "delete_class"
     RENAME_CLASS = "rename_class"
+    COPY_CLASS = "copy_class"
     ADD_FIELD = "add_field"
     DELETE_FIELD = "delete_field"
     RENAME_FIELD = "rename_field"
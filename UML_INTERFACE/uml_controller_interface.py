@@ -492,7 +492,9 @@ class UMLInterface:
             file_name: The name of the file to save.
             file_path: The path where the file will be saved.
         """
-        self.Model._save_gui(file_name, file_path, class_name_list_from_gui)
+        with self.Controller._get_autosave()._suspend():
+            self.Model._save_gui(file_name, file_path, class_name_list_from_gui)
+        self.Controller._restart_journal(is_gui=True)
         
     # Load data #
     def load(self):
@@ -501,9 +503,45 @@ class UMLInterface:
         """
         self.Model._load()
         
+    # Recover a crashed session #
+    def recover_journal(self, graphical_view=None) -> bool:
+        """
+        Rebuilds the state of a crashed session from its command journal and starts journaling, see UMLController._recover_journal.
+
+        Parameters:
+            graphical_view: The canvas to rebuild in GUI mode.
+        """
+        return self.Controller._recover_journal(graphical_view)
+    
     # Load data GUI #
-    def load_gui(self, file_name, file_path, graphical_view):
-        self.Model._load_gui(file_name, file_path, graphical_view)
+    def load_gui(self, file_name, file_path, graphical_view, progress_callback=None):
+        with self.Controller._get_autosave()._suspend():
+            self.Model._load_gui(file_name, file_path, graphical_view, progress_callback)
+        self.Controller._restart_journal(is_gui=True)
+    
+    # Save data to an SQLite database #
+    def save_sqlite(self, file_path: str) -> bool:
+        """
+        Saves the UML diagram data to an SQLite database, only rewriting what changed since the last save to it.
+
+        Parameters:
+            file_path: The path of the database.
+        """
+        with self.Controller._get_autosave()._suspend():
+            return self.Model._save_sqlite(file_path)
+    
+    # Load data from an SQLite database #
+    def load_sqlite(self, file_path: str, class_name_list=None, name_prefix: str = None, progress_callback=None) -> bool:
+        """
+        Loads the UML diagram data, or only some of its classes, from an SQLite database.
+
+        Parameters:
+            file_path: The path of the database.
+            class_name_list: Only load these classes.
+            name_prefix: Only load the classes whose name starts with this prefix.
+        """
+        with self.Controller._get_autosave()._suspend():
+            return self.Model._load_sqlite(file_path, class_name_list, name_prefix, progress_callback)
     
     # Delete saved file #
     def delete_saved_file(self):
@@ -557,7 +595,9 @@ class UMLInterface:
         """
         Ends the current session and resets the program to a blank state by delegating the operation to the model.
         """
-        self.Model._new_file()
+        with self.Controller._get_autosave()._suspend():
+            self.Model._new_file()
+        self.Controller._restart_journal(is_gui=True)
         
     # Sort class list #
     def sort_class_list(self):
@@ -570,9 +610,89 @@ class UMLInterface:
     def exit(self):
         """
         Exits the UML program by delegating the operation to the model.
+        A clean exit stops autosaving and drops the command journal, unsaved work is not recovered on the next start.
         """
+        self.Controller._stop_autosave()
+        self.Controller._close_journal()
         self.Model._exit()
         
+    ## AUTOSAVE ##
+    
+    # Start autosaving #
+    def start_autosave(self, is_gui: bool = False, sync_callback=None):
+        """
+        Starts saving the active file in the background, see UMLController._start_autosave.
+
+        Parameters:
+            is_gui: Autosave to the active GUI file path, the caller then runs poll_autosave from a Qt timer.
+            sync_callback: Run before every poll to copy the canvas positions into the model.
+        """
+        self.Controller._start_autosave(is_gui, sync_callback)
+    
+    # Stop autosaving #
+    def stop_autosave(self):
+        self.Controller._stop_autosave()
+    
+    # Check for changes to autosave, GUI mode #
+    def poll_autosave(self) -> bool:
+        """
+        Hands a snapshot of the diagram to the autosave worker if it is due. Must run on the GUI thread.
+        """
+        return self.Controller._get_autosave()._poll()
+    
+    # Configure autosave #
+    def configure_autosave(self, interval: float = None, idle_threshold: float = None):
+        """
+        Parameters:
+            interval: Minimum number of seconds between two autosaves.
+            idle_threshold: Number of seconds without changes before an autosave.
+        """
+        self.Controller._get_autosave()._configure(interval=interval, idle_threshold=idle_threshold)
+    
+    # Size of the undo history #
+    def get_history_stats(self) -> Dict:
+        """
+        Returns:
+            The number of commands in the undo history and their estimated size, see InputHandler._get_history_stats.
+        """
+        return self.Controller._get_input_handler()._get_history_stats()
+    
+    # List the undo history #
+    def get_history(self) -> List[Dict]:
+        """
+        Returns:
+            The entries of the undo history, oldest first, see InputHandler._get_history.
+        """
+        return self.Controller._get_input_handler()._get_history()
+    
+    # Position and revision of the undo history #
+    def get_history_position(self) -> int:
+        return self.Controller._get_input_handler()._get_position()
+    
+    def get_history_revision(self) -> int:
+        return self.Controller._get_input_handler()._get_revision()
+    
+    # Go to an entry of the undo history #
+    def go_to_history(self, position: int) -> bool:
+        """
+        Parameters:
+            position: The number of commands to have done, 0 before the first one.
+        """
+        return self.Controller._get_input_handler()._go_to(position)
+    
+    # Limit the undo history #
+    def set_history_budget(self, max_entries: int = None, max_bytes: int = None):
+        """
+        Parameters:
+            max_entries: Maximum number of commands kept for undo.
+            max_bytes: Maximum estimated number of bytes the kept commands use.
+        """
+        self.Controller._get_input_handler()._set_budget(max_entries=max_entries, max_bytes=max_bytes)
+    
+    # Copy the canvas positions into the model #
+    def update_positions(self, class_name_list_from_gui):
+        self.Model._update_positions(class_name_list_from_gui)
+    
     # Keep updating main data #
     def update_main_data_for_every_action(self):
         """
@@ -583,14 +703,15 @@ class UMLInterface:
     ## OBSERVER RELATED ##
     
     # Attach observer
-    def attach_observer(self, observer):
+    def attach_observer(self, observer, event_type_list=None):
         """
         Attaches an observer to the model for the observer pattern implementation.
 
         Parameters:
             observer: The observer to attach.
+            event_type_list (list, optional): The event types the observer wants, every event type when None.
         """
-        self.Model._attach_observer(observer)
+        self.Model._attach_observer(observer, event_type_list)
         
     # Detach observer
     def detach_observer(self, observer):
@@ -608,7 +729,50 @@ class UMLInterface:
         Notifies all observers of changes in the model for the observer pattern implementation.
         """
         self.Model._notify_observer()
-    
+
+    ## BATCH RELATED ##
+
+    # Begin batch
+    def begin_batch(self):
+        """
+        Starts a batch of edits: main data is rebuilt and observers are notified once, on commit.
+        """
+        self.Model._begin_batch()
+
+    # Commit batch
+    def commit_batch(self):
+        """
+        Commits the current batch of edits.
+
+        Returns:
+            bool: True if a batch was committed, False if no batch is running.
+        """
+        return self.Model._commit_batch()
+
+    # Rollback batch
+    def rollback_batch(self):
+        """
+        Rolls back the current batch of edits, restoring the data from before the batch began.
+
+        Returns:
+            bool: True if a batch was rolled back, False if no batch is running.
+        """
+        return self.Model._rollback_batch()
+
+    # Batch context
+    def batch(self):
+        """
+        Context manager that commits the edits made inside it as one batch, or rolls them back on an error.
+        """
+        return self.Model._batch()
+
+    # Get event bus
+    def get_event_bus(self):
+        """
+        Retrieves the event bus the model notifies its observers through.
+        """
+        return self.Model._get_event_bus()
+
     # Check for valid input
     def is_valid_input(self, class_name=None, field_name=None, method_name=None, 
                        parameter_name=None, source_class=None, 
@@ -651,6 +815,11 @@ class UMLInterface:
         """
         # Display a welcome message and help menu
         self.View._prompt_menu()  # Show initial instructions
+        # Bring back the work of a session that crashed and journal every command from here
+        self.Controller._recover_journal()
+        # Autosave while the prompt waits for input, commands run under the model lock
+        self.Controller._start_autosave()
+        model_lock = self.Controller._get_autosave()._get_model_lock()
         while True:
             # Display the current active file in the interface
             current_active_file: str = self.get_active_file()
@@ -678,7 +847,8 @@ class UMLInterface:
             elif command == InterfaceOptions.EXIT.value:
                 break
             # Pass command and parameters to the controller for processing
-            self.Controller._process_command(command, parameters)
+            with model_lock:
+                self.Controller._process_command(command, parameters)
         
         # Exit the program after the loop ends
         self.exit()
@@ -0,0 +1,336 @@
+###################################################################################################
+
+# IMPORTED MODULES #
+import mmap
+import struct
+import sys
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Tuple
+from UML_MVC.UML_CONTROLLER.uml_json_stream import UMLJsonRecordReader, iter_json_chunks
+
+###################################################################################################
+# Binary snapshot format for saved diagrams
+# A compact alternative to the JSON files that loads through mmap without parsing text:
+#
+#   header        magic, version, then (offset, count) of every table below
+#   string table  (count + 1) uint32 offsets into a UTF-8 blob, one entry per distinct name or type
+#   classes       name, x, y, position flags, first field, field count, first method, method count
+#   fields        name, type
+#   methods       name, return type, first parameter, parameter count
+#   parameters    name, type
+#   relationships source, destination, type
+#
+# Every name and type is stored once in the string table and referenced by index, every
+# record has a fixed width so record i is found at table offset + i * record size.
+# Records and strings are only decoded when they are read.
+# The records have the same shape as the JSON entries, so a snapshot can be converted to and
+# from JSON without loss, and the model loads both through the same record path.
+
+MAGIC = b"UMLB"
+VERSION = 1
+BINARY_EXTENSION = ".umlb"
+
+# magic, version, reserved, then offset and count of the 7 tables (string offsets, string blob,
+# classes, fields, methods, parameters, relationships)
+HEADER = struct.Struct("<4sHH" + "QI" * 7)
+STRING_OFFSET = struct.Struct("<I")
+CLASS_RECORD = struct.Struct("<IddBIIII")
+FIELD_RECORD = struct.Struct("<II")
+METHOD_RECORD = struct.Struct("<IIII")
+PARAMETER_RECORD = struct.Struct("<II")
+RELATIONSHIP_RECORD = struct.Struct("<III")
+
+# Position flags of a class record
+HAS_POSITION = 1
+X_IS_INT = 2
+Y_IS_INT = 4
+
+# Check whether a file starts with the binary snapshot magic #
+def is_binary_snapshot(file_path: str) -> bool:
+    try:
+        with open(file_path, "rb") as file:
+            return file.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+###################################################################################################
+# Writing #
+
+class _StringTable:
+    """
+    Interns the names and types of a snapshot, every distinct string gets one index.
+    """
+
+    def __init__(self):
+        self.__index_table: Dict[str, int] = {}
+        self.__offset_list: List[int] = [0]
+        self.__blob = bytearray()
+
+    def _intern(self, text: str) -> int:
+        index = self.__index_table.get(text)
+        if index is None:
+            index = len(self.__index_table)
+            self.__index_table[text] = index
+            self.__blob += text.encode("utf-8")
+            self.__offset_list.append(len(self.__blob))
+        return index
+
+    def _get_count(self) -> int:
+        return len(self.__index_table)
+
+    def _get_offset_bytes(self) -> bytes:
+        return struct.pack(f"<{len(self.__offset_list)}I", *self.__offset_list)
+
+    def _get_blob(self) -> bytes:
+        return bytes(self.__blob)
+
+# Pack the position of a class into (x, y, flags) #
+def _pack_position(position) -> Tuple[float, float, int]:
+    if not isinstance(position, dict):
+        return 0.0, 0.0, 0
+    x, y = position.get("x"), position.get("y")
+    if not isinstance(x, (int, float)) or not isinstance(y, (int, float)) or isinstance(x, bool) or isinstance(y, bool):
+        return 0.0, 0.0, 0
+    flags = HAS_POSITION
+    if isinstance(x, int):
+        flags |= X_IS_INT
+    if isinstance(y, int):
+        flags |= Y_IS_INT
+    return float(x), float(y), flags
+
+# Write a diagram as a binary snapshot #
+def write_binary_snapshot(file: BinaryIO, section_table: Dict[str, Iterable]):
+    """
+    Writes a diagram to a binary file. Takes the same sections as iter_json_chunks, the
+    "classes" and "relationships" sections may be generators of JSON-formatted entries.
+    Any other section is not part of the binary format and is left out.
+
+    Args:
+        file (BinaryIO): The file to write, opened in binary mode.
+        section_table (Dict[str, Iterable]): Section name -> list or generator of entries.
+
+    Raises:
+        KeyError, TypeError: If an entry does not have the shape of a saved class or relationship.
+    """
+    def iter_records():
+        for section in ("classes", "relationships"):
+            for entry in section_table.get(section, ()):
+                yield section, entry
+    write_binary_records(file, iter_records())
+
+# Write (section name, entry) records as a binary snapshot #
+def write_binary_records(file: BinaryIO, record_iter: Iterable[Tuple[str, Dict]]):
+    """
+    Writes the records yielded by UMLJsonRecordReader or UMLBinarySnapshot to a binary file
+    in a single pass. Only the fixed-width records and the string table are kept in memory.
+    """
+    string_table = _StringTable()
+    intern = string_table._intern
+    class_bytes, field_bytes, method_bytes, parameter_bytes, relationship_bytes = (bytearray() for _ in range(5))
+    class_count = field_count = method_count = parameter_count = relationship_count = 0
+    for section, entry in record_iter:
+        if section == "relationships":
+            relationship_bytes += RELATIONSHIP_RECORD.pack(intern(entry["source"]), intern(entry["destination"]),
+                                                           intern(entry["type"]))
+            relationship_count += 1
+            continue
+        if section != "classes":
+            continue
+        class_element = entry
+        x, y, flags = _pack_position(class_element.get("position"))
+        field_list = class_element["fields"]
+        method_list = class_element["methods"]
+        class_bytes += CLASS_RECORD.pack(intern(class_element["name"]), x, y, flags,
+                                         field_count, len(field_list), method_count, len(method_list))
+        class_count += 1
+        for field in field_list:
+            field_bytes += FIELD_RECORD.pack(intern(field["name"]), intern(field["type"]))
+            field_count += 1
+        for method in method_list:
+            param_list = method["params"]
+            method_bytes += METHOD_RECORD.pack(intern(method["name"]), intern(method["return_type"]),
+                                               parameter_count, len(param_list))
+            method_count += 1
+            for param in param_list:
+                parameter_bytes += PARAMETER_RECORD.pack(intern(param["name"]), intern(param["type"]))
+                parameter_count += 1
+    table_list = [
+        (string_table._get_offset_bytes(), string_table._get_count()),
+        (string_table._get_blob(), string_table._get_count()),
+        (class_bytes, class_count),
+        (field_bytes, field_count),
+        (method_bytes, method_count),
+        (parameter_bytes, parameter_count),
+        (relationship_bytes, relationship_count),
+    ]
+    header_value_list = []
+    offset = HEADER.size
+    for table_bytes, count in table_list:
+        header_value_list += [offset, count]
+        offset += len(table_bytes)
+    file.write(HEADER.pack(MAGIC, VERSION, 0, *header_value_list))
+    for table_bytes, _ in table_list:
+        file.write(table_bytes)
+
+###################################################################################################
+# Reading #
+
+class UMLBinarySnapshot:
+    """
+    A binary snapshot opened through mmap. Nothing is decoded up front: strings are decoded
+    the first time they are used and records when they are read.
+    """
+
+    def __init__(self, file: BinaryIO, progress_callback: Callable[[int, int, int], None] = None):
+        """
+        Args:
+            file (BinaryIO): The snapshot file, opened in binary mode. It must stay open while the snapshot is used.
+            progress_callback (Callable, optional): Called while iterating with
+                (bytes read, total bytes, classes read so far), like UMLJsonRecordReader.
+
+        Raises:
+            ValueError: If the file is not a binary snapshot of a supported version.
+        """
+        self.__buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.__buffer) < HEADER.size:
+            raise ValueError("Not a UML binary snapshot")
+        header = HEADER.unpack_from(self.__buffer, 0)
+        if header[0] != MAGIC or header[1] != VERSION:
+            raise ValueError("Not a UML binary snapshot")
+        table_list = [(header[index], header[index + 1]) for index in range(3, len(header), 2)]
+        (self.__string_offset_table, (self.__string_blob_offset, _), self.__class_table, self.__field_table,
+         self.__method_table, self.__parameter_table, self.__relationship_table) = table_list
+        self.__string_cache: Dict[int, str] = {}
+        self.__progress_callback = progress_callback
+
+    def _close(self):
+        self.__buffer.close()
+
+    #################################################################
+    # Counts #
+
+    def _get_class_count(self) -> int:
+        return self.__class_table[1]
+
+    def _get_relationship_count(self) -> int:
+        return self.__relationship_table[1]
+
+    #################################################################
+    # Lazy decoding #
+
+    def _get_string(self, index: int) -> str:
+        text = self.__string_cache.get(index)
+        if text is None:
+            table_offset = self.__string_offset_table[0] + index * STRING_OFFSET.size
+            start, end = struct.unpack_from("<II", self.__buffer, table_offset)
+            text = str(self.__buffer[self.__string_blob_offset + start:self.__string_blob_offset + end], "utf-8")
+            self.__string_cache[index] = text
+        return text
+
+    def _get_class_name(self, class_index: int) -> str:
+        """
+        Decodes only the name of a class, without its members.
+        """
+        name_index = STRING_OFFSET.unpack_from(self.__buffer, self.__class_table[0] + class_index * CLASS_RECORD.size)[0]
+        return self._get_string(name_index)
+
+    def _get_class(self, class_index: int) -> Dict:
+        """
+        Decodes one class with its fields, methods and parameters, in the JSON entry format.
+        """
+        name_index, x, y, flags, field_start, field_count, method_start, method_count = CLASS_RECORD.unpack_from(
+            self.__buffer, self.__class_table[0] + class_index * CLASS_RECORD.size)
+        get_string = self._get_string
+        field_list = []
+        for field_name_index, field_type_index in FIELD_RECORD.iter_unpack(
+                self.__get_record_bytes(self.__field_table, FIELD_RECORD, field_start, field_count)):
+            field_list.append({"name": get_string(field_name_index), "type": get_string(field_type_index)})
+        method_list = []
+        for method_name_index, return_type_index, param_start, param_count in METHOD_RECORD.iter_unpack(
+                self.__get_record_bytes(self.__method_table, METHOD_RECORD, method_start, method_count)):
+            param_list = [{"name": get_string(param_name_index), "type": get_string(param_type_index)}
+                          for param_name_index, param_type_index in PARAMETER_RECORD.iter_unpack(
+                              self.__get_record_bytes(self.__parameter_table, PARAMETER_RECORD, param_start, param_count))]
+            method_list.append({"name": get_string(method_name_index), "return_type": get_string(return_type_index),
+                                "params": param_list})
+        class_element = {"name": get_string(name_index), "fields": field_list, "methods": method_list}
+        if flags & HAS_POSITION:
+            class_element["position"] = {"x": int(x) if flags & X_IS_INT else x, "y": int(y) if flags & Y_IS_INT else y}
+        return class_element
+
+    def _get_relationship(self, relationship_index: int) -> Dict:
+        source_index, destination_index, type_index = RELATIONSHIP_RECORD.unpack_from(
+            self.__buffer, self.__relationship_table[0] + relationship_index * RELATIONSHIP_RECORD.size)
+        return {"source": self._get_string(source_index), "destination": self._get_string(destination_index),
+                "type": self._get_string(type_index)}
+
+    def __get_record_bytes(self, table: Tuple[int, int], record: struct.Struct, start: int, count: int) -> bytes:
+        offset = table[0] + start * record.size
+        return self.__buffer[offset:offset + count * record.size]
+
+    #################################################################
+    # Records #
+
+    def _iter_records(self) -> Iterator[Tuple[str, Dict]]:
+        """
+        Yields ("classes", class data) and ("relationships", relationship data) records,
+        the same records UMLJsonRecordReader yields for a JSON file.
+        """
+        total_bytes = len(self.__buffer)
+        class_count = self._get_class_count()
+        # Report progress about a hundred times while reading
+        report_step = max(1, class_count // 100)
+        for class_index in range(class_count):
+            yield "classes", self._get_class(class_index)
+            if self.__progress_callback is not None and (class_index + 1) % report_step == 0:
+                self.__progress_callback(total_bytes * (class_index + 1) // class_count, total_bytes, class_index + 1)
+        for relationship_index in range(self._get_relationship_count()):
+            yield "relationships", self._get_relationship(relationship_index)
+        if self.__progress_callback is not None:
+            self.__progress_callback(total_bytes, total_bytes, class_count)
+
+###################################################################################################
+# Converting #
+
+# Convert a JSON diagram into a binary snapshot #
+def convert_json_to_binary(json_path: str, binary_path: str):
+    """
+    Converts a JSON diagram file into a binary snapshot, reading the JSON file one record at a time.
+    """
+    with open(json_path, "rb") as json_file, open(binary_path, "wb") as binary_file:
+        write_binary_records(binary_file, UMLJsonRecordReader(json_file)._iter_records())
+
+# Convert a binary snapshot into a JSON diagram #
+def convert_binary_to_json(binary_path: str, json_path: str, is_compact: bool = False):
+    """
+    Converts a binary snapshot into a JSON diagram file, decoding one class at a time.
+    """
+    with open(binary_path, "rb") as binary_file:
+        snapshot = UMLBinarySnapshot(binary_file)
+        try:
+            section_table = {
+                "classes": (snapshot._get_class(index) for index in range(snapshot._get_class_count())),
+                "relationships": (snapshot._get_relationship(index) for index in range(snapshot._get_relationship_count())),
+            }
+            with open(json_path, "w") as json_file:
+                for chunk in iter_json_chunks(section_table, is_compact=is_compact):
+                    json_file.write(chunk)
+        finally:
+            snapshot._close()
+
+# Usage: python -m UML_MVC.UML_CONTROLLER.uml_binary_snapshot <input> <output>
+# Converts JSON to binary or binary to JSON, depending on the format of the input file.
+def main():
+    if len(sys.argv) != 3:
+        print("Usage: python -m UML_MVC.UML_CONTROLLER.uml_binary_snapshot <input> <output>")
+        return
+    input_path, output_path = sys.argv[1], sys.argv[2]
+    if is_binary_snapshot(input_path):
+        convert_binary_to_json(input_path, output_path)
+    else:
+        convert_json_to_binary(input_path, output_path)
+    print(f"Converted '{input_path}' to '{output_path}'.")
+
+if __name__ == "__main__":
+    main()
+
+###################################################################################################
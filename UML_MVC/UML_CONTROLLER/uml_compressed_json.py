@@ -0,0 +1,85 @@
+###################################################################################################
+
+# IMPORTED MODULES #
+import gzip
+import lzma
+from typing import BinaryIO, Iterable
+
+###################################################################################################
+# Compressed diagram files
+# Diagram JSON is repetitive and compresses 10-20x, so a diagram can be kept as '.json.gz'
+# (gzip) or '.json.xz' (lzma, smaller but slower), both from the standard library. The text
+# is the same JSON the plain files hold, compressed while it is streamed out and decompressed
+# while it is streamed in, so the whole file is never in memory. On load the codec is told
+# from the first bytes of the file, not from its name.
+
+GZIP_EXTENSION = ".json.gz"
+LZMA_EXTENSION = ".json.xz"
+COMPRESSED_EXTENSION_LIST = (GZIP_EXTENSION, LZMA_EXTENSION)
+
+GZIP = "gzip"
+LZMA = "lzma"
+
+GZIP_MAGIC = b"\x1f\x8b"
+LZMA_MAGIC = b"\xfd7zXZ\x00"
+
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Codec of a file from its first bytes #
+def get_compression_from_header(file_header: bytes) -> str | None:
+    """
+    Returns:
+        str: GZIP or LZMA, None for an uncompressed file.
+    """
+    if file_header.startswith(GZIP_MAGIC):
+        return GZIP
+    if file_header.startswith(LZMA_MAGIC):
+        return LZMA
+    return None
+
+# Codec of a file from its content, or its name for a file that does not exist yet #
+def get_compression(file_path: str) -> str | None:
+    try:
+        with open(file_path, "rb") as file:
+            return get_compression_from_header(file.read(len(LZMA_MAGIC)))
+    except OSError:
+        pass
+    if file_path.endswith(GZIP_EXTENSION):
+        return GZIP
+    if file_path.endswith(LZMA_EXTENSION):
+        return LZMA
+    return None
+
+# Wrap an open binary file in a codec #
+def open_compressed(file: BinaryIO, compression: str, mode: str = "rb") -> BinaryIO:
+    """
+    Args:
+        file (BinaryIO): The underlying file, left open when the returned stream is closed.
+        compression (str): GZIP or LZMA.
+        mode (str): "rb" to decompress while reading, "wb" to compress while writing.
+    """
+    if compression == GZIP:
+        # No time stamp in the header, the same diagram always compresses to the same bytes
+        return gzip.GzipFile(fileobj=file, mode=mode, compresslevel=6, mtime=0)
+    return lzma.LZMAFile(file, mode=mode, preset=6 if mode == "wb" else None)
+
+# Compress text chunks into an open binary file #
+def write_compressed_chunks(file: BinaryIO, chunk_iter: Iterable[str], compression: str):
+    compressed_file = open_compressed(file, compression, "wb")
+    try:
+        # Hand the compressor about a megabyte at a time, not one small chunk per entry
+        buffer_list = []
+        buffer_size = 0
+        for chunk in chunk_iter:
+            buffer_list.append(chunk)
+            buffer_size += len(chunk)
+            if buffer_size >= WRITE_BUFFER_SIZE:
+                compressed_file.write("".join(buffer_list).encode("utf-8"))
+                buffer_list = []
+                buffer_size = 0
+        compressed_file.write("".join(buffer_list).encode("utf-8"))
+    finally:
+        # Writes the end of the stream, the underlying file stays open
+        compressed_file.close()
+
+###################################################################################################
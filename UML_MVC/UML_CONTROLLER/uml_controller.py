@@ -13,10 +13,13 @@ methods, parameters, and relationships.
 import os
 from rich.console import Console
 from typing import List
+from UML_MVC.UML_CONTROLLER import uml_storage_manager
 from UML_MVC.UML_CONTROLLER.uml_storage_manager import UMLStorageManager as Storage
 from UML_MVC.UML_MODEL.uml_model import UMLModel as Model
 from UML_ENUM_CLASS.uml_enum import InterfaceOptions
 from UML_MVC import uml_command_pattern as Command
+from UML_MVC.uml_command_journal import UMLCommandJournal as CommandJournal
+from UML_MVC.uml_autosave import UMLAutosaveService as AutosaveService
 from UML_MVC.UML_CONTROLLER.adapter import UMLToImageAdapter
 
 ###################################################################################################
@@ -38,8 +41,13 @@ class UMLController:
             view: The view class responsible for displaying output to the user.
             console (Console): A rich console instance used to print messages to the terminal.
         """
-        self.__input_handler = Command.InputHandler()
         self.__model = model  # Reference to the UML model
+        # Records every command for crash recovery, started by _recover_journal
+        self.__journal = CommandJournal(model)
+        self.__input_handler = Command.InputHandler(journal=self.__journal, uml_model=model)
+        # Saves the active file in the background, started by _start_autosave
+        self.__autosave = AutosaveService(model, target_callback=self.__get_autosave_path)
+        self.__is_autosave_gui = False
         self.__user_view = view  # Reference to the view for displaying data
         self.__console = console  # Console for printing messages
         self.__storage_manager: Storage = self.__model._get_storage_manager()  # Storage manager to handle save/load functionality
@@ -51,6 +59,125 @@ class UMLController:
     def _get_input_handler(self):
         return self.__input_handler
     
+    def _get_journal(self) -> CommandJournal:
+        return self.__journal
+    
+    def _get_autosave(self) -> AutosaveService:
+        return self.__autosave
+    
+    #################################################################
+    
+    ## COMMAND JOURNAL ##
+    
+    # Full path of the active file, None when there is none #
+    def __get_active_file_path(self, is_gui: bool = False) -> str | None:
+        if is_gui:
+            active_file_path = self.__model._get_active_file_gui()
+            if active_file_path != "No active file!":
+                return active_file_path
+        active_file = self.__model._get_active_file()
+        if active_file != "No active file!":
+            return os.path.join(uml_storage_manager.root_directory, f"{active_file}.json")
+        return None
+    
+    # Path of the file to autosave to #
+    def __get_autosave_path(self) -> str | None:
+        # Data loaded from another file, or only part of one, would replace the active file
+        if self.__model._is_detached():
+            return None
+        return self.__get_active_file_path(self.__is_autosave_gui)
+    
+    # Path of the file the journal is kept next to #
+    def __get_journal_base_path(self, is_gui: bool = False) -> str:
+        active_file_path = self.__get_active_file_path(is_gui)
+        if active_file_path is not None:
+            return active_file_path
+        # Work that was never saved is journaled next to the saved file lists
+        return os.path.join(uml_storage_manager.root_directory, "UML_UTILITY", "SAVED_FILES", "UNTITLED.json")
+    
+    # Recover a crashed session and start journaling #
+    def _recover_journal(self, graphical_view=None) -> bool:
+        """
+        Called once on startup. If the previous session crashed, rebuilds its state from the journal and
+        checkpoint left next to the active file. Then starts journaling every command.
+
+        Args:
+            graphical_view (optional): The canvas to rebuild in GUI mode.
+
+        Returns:
+            bool: True if a crashed session was recovered, False otherwise.
+        """
+        base_path = self.__get_journal_base_path(is_gui=graphical_view is not None)
+        checkpoint_path = self.__journal._recover(base_path)
+        is_recovered = checkpoint_path is not None and self.__model._load_records_from_file(checkpoint_path, graphical_view)
+        self.__journal._start(base_path, is_recovered=is_recovered)
+        if is_recovered:
+            self.__console.print(f"\n[bold green]Recovered unsaved work from [bold white]'{os.path.basename(base_path)}'[/bold white]![/bold green]")
+        return is_recovered
+    
+    # Start a new journal after the active data was saved, loaded or reset #
+    def _restart_journal(self, is_gui: bool = False):
+        """
+        The model now matches the active file, so the journal starts over on top of it. Does nothing before _recover_journal.
+        """
+        if self.__journal._get_base_path() is None:
+            return
+        self.__journal._start(self.__get_journal_base_path(is_gui))
+    
+    # Stop journaling on a clean exit #
+    def _close_journal(self):
+        self.__journal._close(is_discarded=True)
+    
+    #################################################################
+    
+    ## AUTOSAVE ##
+    
+    # Start saving the active file in the background #
+    def _start_autosave(self, is_gui: bool = False, sync_callback=None):
+        """
+        Starts the autosave worker. In CLI mode the worker polls on its own while the prompt loop waits for input,
+        in GUI mode the caller runs _get_autosave()._poll from a Qt timer.
+
+        Args:
+            is_gui (bool): Autosave to the active GUI file path.
+            sync_callback (Callable, optional): Run before every poll to copy the canvas positions into the model.
+        """
+        self.__is_autosave_gui = is_gui
+        self.__autosave._set_sync_callback(sync_callback)
+        self.__autosave._start(is_self_polling=not is_gui)
+    
+    # Stop the autosave worker #
+    def _stop_autosave(self):
+        self.__autosave._stop()
+    
+    #################################################################
+    
+    ## COPY CLASS ##
+    
+    # Build one command that adds a copy of a class with all its members #
+    def __build_copy_class_command(self, class_name: str, new_name: str) -> Command.CompositeCommand:
+        class_data = next(
+            each_class for each_class in self.__model._get_main_data()["classes"]
+            if each_class["name"] == class_name
+        )
+        child_command_list = [Command.AddClassCommand(self.__model, class_name=new_name)]
+        for field in class_data["fields"]:
+            child_command_list.append(
+                Command.AddFieldCommand(self.__model, class_name=new_name, type=field["type"], field_name=field["name"])
+            )
+        for method_num, method in enumerate(class_data["methods"], start=1):
+            child_command_list.append(
+                Command.AddMethodCommand(self.__model, class_name=new_name, type=method["return_type"], method_name=method["name"])
+            )
+            for param in method["params"]:
+                child_command_list.append(
+                    Command.AddParameterCommand(
+                        self.__model, class_name=new_name, method_num=str(method_num),
+                        param_type=param["type"], param_name=param["name"]
+                    )
+                )
+        return Command.CompositeCommand(self.__model, child_command_list)
+    
     #################################################################
     
     ## HANDLE USER INPUT FOR INTERFACE ##
@@ -100,6 +227,16 @@ class UMLController:
         ):
             rename_class_command = Command.RenameClassCommand(self.__model, class_name=first_param, new_name=second_param)
             self.__input_handler.execute_command(rename_class_command)
+        
+        # Copy class
+        elif (
+            command == InterfaceOptions.COPY_CLASS.value
+            and first_param
+            and second_param
+        ):
+            if self.__model._validate_entities(class_name=first_param, class_should_exist=True):
+                copy_class_command = self.__build_copy_class_command(first_param, second_param)
+                self.__input_handler.execute_command(copy_class_command)
 
         #######################################################
         
@@ -290,6 +427,21 @@ class UMLController:
         elif command == InterfaceOptions.REDO.value:
             self.__input_handler.redo()
         
+        # Size of the undo history #
+        elif command == InterfaceOptions.UNDO_STATS.value:
+            self.__user_view._display_history_stats(self.__input_handler._get_history_stats())
+        
+        # List the undo history #
+        elif command == InterfaceOptions.HISTORY.value:
+            self.__user_view._display_history(self.__input_handler._get_history(), self.__input_handler._get_position())
+        
+        # Go to an entry of the undo history #
+        elif command == InterfaceOptions.GOTO.value and first_param:
+            if not first_param.isdigit() or not self.__input_handler._go_to(int(first_param)):
+                self.__console.print(f"\n[bold red]History entry [bold white]'{first_param}'[/bold white] does not exist! Type [bold white]'history'[/bold white] to list the entries.[/bold red]")
+            else:
+                self.__console.print(f"\n[bold green]Went to history entry [bold white]'{first_param}'[/bold white].[/bold green]")
+        
         #######################################################
         # Handle adapter json to image
 
@@ -324,11 +476,15 @@ class UMLController:
         
         # Save current UML data
         elif command == InterfaceOptions.SAVE.value:
-            self.__model._save()
+            with self.__autosave._suspend():
+                self.__model._save()
+            self._restart_journal()
         
         # Load saved UML data
         elif command == InterfaceOptions.LOAD.value:
-            self.__model._load()
+            with self.__autosave._suspend():
+                self.__model._load()
+            self._restart_journal()
         
         # Delete a saved file
         elif command == InterfaceOptions.DELETE_SAVED.value:
@@ -336,11 +492,15 @@ class UMLController:
         
         # Clear current data from storage
         elif command == InterfaceOptions.CLEAR_DATA.value:
-            self.__model._clear_current_active_data()
+            with self.__autosave._suspend():
+                self.__model._clear_current_active_data()
+            self._restart_journal()
         
         # Reset to a blank program
         elif command == InterfaceOptions.NEW.value:
-            self.__model._new_file()
+            with self.__autosave._suspend():
+                self.__model._new_file()
+            self._restart_journal()
         
         # Sort the list of classes alphabetically
         # elif command == InterfaceOptions.SORT.value:
@@ -0,0 +1,257 @@
+###################################################################################################
+
+# IMPORTED MODULES #
+import codecs
+import json
+import os
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, Tuple
+
+###################################################################################################
+# Streaming JSON encoding and decoding for saved diagrams
+# A diagram is a dict of sections ("classes", "relationships"), each a list of entries.
+# The sections may also be generators, so the entries can be produced from the model one
+# at a time and written straight to the file instead of building the whole main data first.
+# The output is byte for byte what json.dump gives for the same data as a dict of lists.
+
+INDENT = 4
+
+# Encode one value the way json.dump would inside a container at the given depth #
+def _encode_value(encoder: json.JSONEncoder, value, depth: int) -> str:
+    text = encoder.encode(value)
+    if encoder.indent is None or depth == 0:
+        return text
+    # JSON strings never contain raw newlines, so every newline starts a new indented line
+    return text.replace("\n", "\n" + " " * (INDENT * depth))
+
+# Encode a list section entry by entry #
+def _iter_section_chunks(encoder: json.JSONEncoder, entry_list: Iterable) -> Iterator[str]:
+    is_indented = encoder.indent is not None
+    item_separator = ",\n" + " " * (INDENT * 2) if is_indented else ","
+    is_first = True
+    for entry in entry_list:
+        if is_first:
+            yield "[\n" + " " * (INDENT * 2) if is_indented else "["
+            is_first = False
+        else:
+            yield item_separator
+        yield _encode_value(encoder, entry, 2)
+    if is_first:
+        yield "[]"
+    else:
+        yield "\n" + " " * INDENT + "]" if is_indented else "]"
+
+# Encode a diagram chunk by chunk #
+def iter_json_chunks(section_table: Dict[str, Iterable], is_compact: bool = False) -> Iterator[str]:
+    """
+    Yields the JSON text of a diagram in chunks, at most one entry of a section at a time.
+
+    Args:
+        section_table (Dict[str, Iterable]): Section name -> list or generator of JSON-compatible entries.
+        is_compact (bool): Encode without indentation.
+    """
+    if is_compact:
+        encoder = json.JSONEncoder(separators=(",", ":"))
+        key_separator, item_separator, opening, closing = ":", ",", "{", "}"
+    else:
+        encoder = json.JSONEncoder(indent=INDENT)
+        key_separator, item_separator = ": ", ",\n" + " " * INDENT
+        opening, closing = "{\n" + " " * INDENT, "\n}"
+    if not section_table:
+        yield "{}"
+        return
+    is_first = True
+    for key, section in section_table.items():
+        yield opening if is_first else item_separator
+        is_first = False
+        yield encoder.encode(key) + key_separator
+        # Lists and generators are streamed, any other value is encoded as a whole
+        if isinstance(section, (dict, str, int, float, bool)) or section is None:
+            yield _encode_value(encoder, section, 1)
+        else:
+            yield from _iter_section_chunks(encoder, section)
+    yield closing
+
+###################################################################################################
+# Streaming JSON decoding for saved diagrams
+# UMLJsonRecordReader reads a diagram file chunk by chunk and yields the entries of its
+# sections one at a time as (section name, entry) pairs, so a loader can build each class
+# as soon as it is read instead of waiting for json.load to parse the whole file.
+# Only the standard library json decoder is used, one entry at a time.
+
+WHITESPACE = " \t\n\r"
+
+class UMLJsonRecordReader:
+    """
+    Incremental reader for diagram files: a JSON object whose values are lists of entries.
+    Entries of list sections are yielded one by one, any other value is yielded as a whole.
+    Reports progress (bytes read, entries read) through an optional callback.
+    """
+
+    def __init__(self, file: BinaryIO, chunk_size: int = 64 * 1024,
+                 progress_callback: Callable[[int, int, int], None] = None):
+        """
+        Args:
+            file (BinaryIO): The diagram file, opened in binary mode.
+            chunk_size (int): Number of bytes read at a time.
+            progress_callback (Callable, optional): Called after every chunk with
+                (bytes read, total bytes, classes read so far).
+        """
+        self.__file = file
+        self.__chunk_size = chunk_size
+        self.__progress_callback = progress_callback
+        self.__decoder = json.JSONDecoder()
+        self.__text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.__buffer = ""
+        self.__position = 0
+        self.__is_eof = False
+        self.__bytes_read = 0
+        try:
+            self.__total_bytes = os.fstat(file.fileno()).st_size
+        except (AttributeError, OSError, ValueError):
+            self.__total_bytes = 0
+        # Section name -> number of entries read
+        self.__record_count_table: Dict[str, int] = {}
+
+    #################################################################
+    # Progress #
+
+    def _get_bytes_read(self) -> int:
+        return self.__bytes_read
+
+    def _get_total_bytes(self) -> int:
+        return self.__total_bytes
+
+    def _get_record_count(self, section: str) -> int:
+        return self.__record_count_table.get(section, 0)
+
+    #################################################################
+    # Records #
+
+    def _iter_records(self) -> Iterator[Tuple[str, object]]:
+        """
+        Yields (section name, entry) for every entry of every section, in file order.
+
+        Raises:
+            json.JSONDecodeError: If the file is not a JSON object or an entry is malformed.
+        """
+        self.__expect("{")
+        if self.__peek() == "}":
+            self.__position += 1
+            self.__expect_end()
+            self.__report_progress()
+            return
+        while True:
+            section = self.__decode_value()
+            if not isinstance(section, str):
+                self.__raise_error("Expecting property name enclosed in double quotes")
+            self.__expect(":")
+            if self.__peek() == "[":
+                self.__position += 1
+                yield from self.__iter_section(section)
+            else:
+                yield section, self.__decode_value()
+            next_char = self.__peek()
+            self.__position += 1
+            if next_char == "}":
+                self.__expect_end()
+                self.__report_progress()
+                return
+            if next_char != ",":
+                self.__position -= 1
+                self.__raise_error("Expecting ',' delimiter")
+
+    # Yield the entries of a list section #
+    def __iter_section(self, section: str) -> Iterator[Tuple[str, object]]:
+        if self.__peek() == "]":
+            self.__position += 1
+            return
+        while True:
+            entry = self.__decode_value()
+            self.__record_count_table[section] = self.__record_count_table.get(section, 0) + 1
+            yield section, entry
+            next_char = self.__peek()
+            self.__position += 1
+            if next_char == "]":
+                return
+            if next_char != ",":
+                self.__position -= 1
+                self.__raise_error("Expecting ',' delimiter")
+
+    #################################################################
+    # Buffer handling #
+
+    # Read more text, at least min_size bytes unless the file ends #
+    def __fill(self, min_size: int = 0) -> bool:
+        if self.__is_eof:
+            return False
+        chunk = self.__file.read(max(self.__chunk_size, min_size))
+        if not chunk:
+            self.__is_eof = True
+            self.__buffer = self.__buffer[self.__position:] + self.__text_decoder.decode(b"", final=True)
+        else:
+            self.__bytes_read += len(chunk)
+            self.__buffer = self.__buffer[self.__position:] + self.__text_decoder.decode(chunk)
+        self.__position = 0
+        self.__report_progress()
+        return True
+
+    def __report_progress(self):
+        if self.__progress_callback is not None:
+            self.__progress_callback(self.__bytes_read, self.__total_bytes, self._get_record_count("classes"))
+
+    # Skip whitespace and return the next character, "" at the end of the file #
+    def __peek(self) -> str:
+        while True:
+            buffer = self.__buffer
+            position = self.__position
+            while position < len(buffer) and buffer[position] in WHITESPACE:
+                position += 1
+            self.__position = position
+            if position < len(buffer):
+                return buffer[position]
+            if not self.__fill():
+                return ""
+
+    # Only whitespace may follow the top-level object, like json.load #
+    def __expect_end(self):
+        if self.__peek() != "":
+            self.__raise_error("Extra data")
+
+    def __expect(self, char: str):
+        if self.__peek() != char:
+            self.__raise_error(f"Expecting '{char}'")
+        self.__position += 1
+
+    # Decode the next complete value, reading more of the file until it is complete #
+    def __decode_value(self):
+        self.__peek()
+        while True:
+            try:
+                value, end = self.__decoder.raw_decode(self.__buffer, self.__position)
+            except json.JSONDecodeError:
+                # Most likely the value continues in the next chunk, read at least as much again
+                if not self.__fill(len(self.__buffer) - self.__position):
+                    raise
+                continue
+            # A number or literal at the very end of the buffer may continue in the next chunk
+            if end == len(self.__buffer) and self.__fill():
+                continue
+            self.__position = end
+            return value
+
+    def __raise_error(self, message: str):
+        raise json.JSONDecodeError(message, self.__buffer, self.__position)
+
+# Turn loaded main data into (section name, entry) records #
+def iter_main_data_records(main_data: Dict) -> Iterator[Tuple[str, object]]:
+    """
+    Yields the same (section name, entry) records as UMLJsonRecordReader for data that is already in memory.
+    """
+    for section, value in main_data.items():
+        if isinstance(value, list):
+            for entry in value:
+                yield section, entry
+        else:
+            yield section, value
+
+###################################################################################################
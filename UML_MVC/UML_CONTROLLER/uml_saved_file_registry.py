@@ -0,0 +1,181 @@
+###################################################################################################
+
+# IMPORTED MODULES #
+import json
+import os
+from typing import Dict, Iterator, List
+
+###################################################################################################
+# Saved file registry
+# The saved files (NAME_LIST.json holds file names, NAME_LIST_GUI.json full paths) used to be
+# kept as a list of single-key dicts, {name: "on" | "off"}, scanned from the start for every
+# lookup and rewritten whole on every change. The registry keeps the names as the keys of a dict,
+# in the order they were added, and a pointer to the active one, so lookups and status changes
+# take constant time. It is written as
+#
+#   {"version": 2, "active": "name" or null, "files": ["name", ...]}
+#
+# only when something changed since the last write, into a temporary file renamed over the old
+# one. A file still in the old list format is read as is and written in the new format the next
+# time the registry changes.
+
+REGISTRY_VERSION = 2
+
+class UMLSavedFileRegistry:
+    """
+    The saved files and the active one, indexed by name (or path) and persisted only when dirty.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Reads the registry from file_path, in the current or the old list format.
+
+        Args:
+            file_path (str): The path of the registry file.
+        """
+        self.__file_path = file_path
+        # Name -> None, the keys keep the order the files were added in
+        self.__name_table: Dict[str, None] = {}
+        self.__active_name: str = None
+        self.__is_dirty = False
+        self.__read()
+
+    #################################################################
+    # Lookups #
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__name_table
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__name_table)
+
+    def __len__(self) -> int:
+        return len(self.__name_table)
+
+    def _get_file_path(self) -> str:
+        return self.__file_path
+
+    def _get_active(self) -> str | None:
+        """
+        Returns:
+            str: The active file, None when no file is active.
+        """
+        return self.__active_name
+
+    def _get_status(self, name: str) -> str:
+        return "on" if name == self.__active_name else "off"
+
+    def _is_dirty(self) -> bool:
+        return self.__is_dirty
+
+    def _to_list(self) -> List[Dict[str, str]]:
+        """
+        Builds the old list of {name: "on" | "off"} dicts, for display.
+        """
+        return [{name: self._get_status(name)} for name in self.__name_table]
+
+    #################################################################
+    # Changes #
+
+    def _add(self, name: str) -> bool:
+        """
+        Returns:
+            bool: True if the name was added, False if it was already there.
+        """
+        if name in self.__name_table:
+            return False
+        self.__name_table[name] = None
+        self.__is_dirty = True
+        return True
+
+    def _remove(self, name: str) -> bool:
+        """
+        Removes a file, it is no longer active if it was.
+
+        Returns:
+            bool: True if the name was removed, False if it was not there.
+        """
+        if name not in self.__name_table:
+            return False
+        del self.__name_table[name]
+        if name == self.__active_name:
+            self.__active_name = None
+        self.__is_dirty = True
+        return True
+
+    def _set_status(self, name: str, status: str):
+        """
+        Turns a file "on", which turns the previously active file off, or "off". Unknown names are ignored.
+        """
+        if name not in self.__name_table:
+            return
+        if status == "on":
+            self._set_active(name)
+        elif name == self.__active_name:
+            self._set_active(None)
+
+    def _set_active(self, name: str | None):
+        """
+        Makes a file the active one, None turns every file off. Unknown names are ignored.
+        """
+        if name is not None and name not in self.__name_table:
+            return
+        if name != self.__active_name:
+            self.__active_name = name
+            self.__is_dirty = True
+
+    #################################################################
+    # Persistence #
+
+    def _flush(self) -> bool:
+        """
+        Writes the registry if it changed since it was read or last written,
+        into a temporary file that atomically replaces the old one.
+
+        Returns:
+            bool: True if the registry is on disk, False if the write failed.
+        """
+        if not self.__is_dirty:
+            return True
+        data = {"version": REGISTRY_VERSION, "active": self.__active_name, "files": list(self.__name_table)}
+        temp_path = f"{self.__file_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "w") as file:
+                json.dump(data, file, indent=4)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self.__file_path)
+        except OSError:
+            print(f"\nError saving data to {self.__file_path}.")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+        self.__is_dirty = False
+        return True
+
+    def __read(self):
+        try:
+            # An empty file is an empty registry
+            if os.stat(self.__file_path).st_size == 0:
+                return
+            with open(self.__file_path, "r") as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            print(f"\nFile {self.__file_path} not found.")
+            return
+        except json.JSONDecodeError:
+            print(f"\nError decoding JSON from {self.__file_path}.")
+            return
+        if isinstance(data, list):
+            # The old format, a list of {name: "on" | "off"} dicts
+            for pair in data:
+                for name, status in pair.items():
+                    self.__name_table[name] = None
+                    if status == "on" and self.__active_name is None:
+                        self.__active_name = name
+            return
+        self.__name_table = dict.fromkeys(data.get("files", ()))
+        active_name = data.get("active")
+        self.__active_name = active_name if active_name in self.__name_table else None
+
+###################################################################################################
@@ -0,0 +1,322 @@
+###################################################################################################
+
+# IMPORTED MODULES #
+import sqlite3
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+
+###################################################################################################
+# SQLite storage for saved diagrams
+# An alternative to the JSON files where every class, field, method, parameter and relationship
+# is a row, so a save only rewrites the rows of the classes that changed since the last save
+# and a load can read a subset of the classes:
+#
+#   classes        name, ordinal, x, y
+#   fields         class name, ordinal, name, type
+#   methods        class name, ordinal, name, return type
+#   params         class name, method ordinal, ordinal, name, type
+#   relationships  source, destination, type, ordinal
+#
+# The ordinals keep the order of the diagram, so a full load gives the classes, members and
+# relationships back in the order they were saved. x and y have no declared type, SQLite then
+# keeps integers and floats as they were given. A class without a position has NULL x and y.
+# Rows are read and written as the same JSON-formatted entries as the JSON files and binary
+# snapshots, so the model loads all three through the same record path.
+
+SQLITE_EXTENSION = ".umldb"
+SQLITE_MAGIC = b"SQLite format 3\x00"
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS classes (
+    name TEXT PRIMARY KEY,
+    ordinal INTEGER NOT NULL,
+    x,
+    y
+);
+CREATE TABLE IF NOT EXISTS fields (
+    class_name TEXT NOT NULL,
+    ordinal INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    PRIMARY KEY (class_name, ordinal)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS methods (
+    class_name TEXT NOT NULL,
+    ordinal INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    return_type TEXT NOT NULL,
+    PRIMARY KEY (class_name, ordinal)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS params (
+    class_name TEXT NOT NULL,
+    method_ordinal INTEGER NOT NULL,
+    ordinal INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    PRIMARY KEY (class_name, method_ordinal, ordinal)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS relationships (
+    source TEXT NOT NULL,
+    destination TEXT NOT NULL,
+    type TEXT NOT NULL,
+    ordinal INTEGER NOT NULL,
+    PRIMARY KEY (source, destination)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS relationships_by_destination ON relationships (destination);
+"""
+
+# Check whether a file is an SQLite database #
+def is_sqlite_database(file_path: str) -> bool:
+    try:
+        with open(file_path, "rb") as file:
+            return file.read(len(SQLITE_MAGIC)) == SQLITE_MAGIC
+    except OSError:
+        return False
+
+class UMLSQLiteStorage:
+    """
+    A diagram stored in an SQLite database. Saves run in a single transaction,
+    either replacing the whole diagram or only the rows of the given classes and relationships.
+    """
+
+    def __init__(self, db_path: str, progress_callback: Callable[[int, int, int], None] = None):
+        """
+        Opens the database, creating the tables if they do not exist yet.
+
+        Args:
+            db_path (str): The path of the database file.
+            progress_callback (Callable, optional): Called while iterating records with
+                (bytes read, total bytes, classes read so far), like UMLJsonRecordReader.
+
+        Raises:
+            sqlite3.Error: If the file is not a database or has a newer schema.
+        """
+        self.__connection = sqlite3.connect(db_path)
+        try:
+            schema_version = self.__connection.execute("PRAGMA user_version").fetchone()[0]
+            if schema_version > SCHEMA_VERSION:
+                raise sqlite3.DatabaseError(f"Unsupported diagram database version {schema_version}")
+            with self.__connection:
+                self.__connection.executescript(SCHEMA)
+                self.__connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        except sqlite3.Error:
+            self.__connection.close()
+            raise
+        self.__progress_callback = progress_callback
+
+    def _close(self):
+        self.__connection.close()
+
+    #################################################################
+    # Saving #
+
+    def _save_all(self, section_table: Dict[str, Iterable]):
+        """
+        Replaces the whole diagram. Takes the same sections as iter_json_chunks,
+        "classes" and "relationships" may be generators of JSON-formatted entries.
+
+        Raises:
+            sqlite3.Error, KeyError, TypeError: If the write fails, nothing is changed then.
+        """
+        connection = self.__connection
+        with connection:
+            for table in ("classes", "fields", "methods", "params", "relationships"):
+                connection.execute(f"DELETE FROM {table}")
+            for ordinal, class_element in enumerate(section_table.get("classes", ())):
+                self.__insert_class(class_element, ordinal)
+            connection.executemany(
+                "INSERT OR REPLACE INTO relationships (source, destination, type, ordinal) VALUES (?, ?, ?, ?)",
+                ((rel["source"], rel["destination"], rel["type"], ordinal)
+                 for ordinal, rel in enumerate(section_table.get("relationships", ()))))
+
+    def _save_changes(self, class_entry_list: Iterable[Dict], deleted_class_name_list: Iterable[str] = (),
+                      relationship_entry_list: Iterable[Dict] = (), deleted_relationship_list: Iterable[Tuple[str, str]] = (),
+                      renamed_class_list: Iterable[Tuple[str, str]] = ()):
+        """
+        Writes only what changed since the last save, in one transaction:
+        renames are applied to the stored classes and relationships first, then deleted classes and relationships
+        are removed, then the given classes and relationships are inserted or replaced.
+        A replaced class or relationship keeps its place in the order of the diagram, new ones go last.
+
+        Args:
+            class_entry_list (Iterable[Dict]): JSON-formatted classes to insert or replace.
+            deleted_class_name_list (Iterable[str]): Classes to remove with their members and relationships.
+            relationship_entry_list (Iterable[Dict]): JSON-formatted relationships to insert or replace.
+            deleted_relationship_list (Iterable[Tuple[str, str]]): (source, destination) pairs to remove.
+            renamed_class_list (Iterable[Tuple[str, str]]): (old name, new name) pairs in the order the renames happened.
+
+        Raises:
+            sqlite3.Error, KeyError, TypeError: If the write fails, nothing is changed then.
+        """
+        connection = self.__connection
+        with connection:
+            # Renamed classes keep their place, relationships to classes that were not loaded follow the rename
+            for current_name, new_name in renamed_class_list:
+                connection.execute("UPDATE OR REPLACE classes SET name = ? WHERE name = ?", (new_name, current_name))
+                connection.execute("UPDATE OR REPLACE relationships SET source = ? WHERE source = ?", (new_name, current_name))
+                connection.execute("UPDATE OR REPLACE relationships SET destination = ? WHERE destination = ?", (new_name, current_name))
+            for class_name in deleted_class_name_list:
+                self.__delete_class_rows(class_name)
+                connection.execute("DELETE FROM relationships WHERE source = ? OR destination = ?", (class_name, class_name))
+            connection.executemany("DELETE FROM relationships WHERE source = ? AND destination = ?", deleted_relationship_list)
+            next_ordinal = self.__get_next_ordinal("classes")
+            for class_element in class_entry_list:
+                row = connection.execute("SELECT ordinal FROM classes WHERE name = ?", (class_element["name"],)).fetchone()
+                if row is None:
+                    ordinal = next_ordinal
+                    next_ordinal += 1
+                else:
+                    ordinal = row[0]
+                    self.__delete_class_rows(class_element["name"])
+                self.__insert_class(class_element, ordinal)
+            next_ordinal = self.__get_next_ordinal("relationships")
+            for rel in relationship_entry_list:
+                row = connection.execute("SELECT ordinal FROM relationships WHERE source = ? AND destination = ?",
+                                         (rel["source"], rel["destination"])).fetchone()
+                if row is None:
+                    ordinal = next_ordinal
+                    next_ordinal += 1
+                else:
+                    ordinal = row[0]
+                connection.execute("INSERT OR REPLACE INTO relationships (source, destination, type, ordinal) VALUES (?, ?, ?, ?)",
+                                   (rel["source"], rel["destination"], rel["type"], ordinal))
+
+    def __insert_class(self, class_element: Dict, ordinal: int):
+        connection = self.__connection
+        class_name = class_element["name"]
+        position = class_element.get("position")
+        x, y = (position["x"], position["y"]) if isinstance(position, dict) else (None, None)
+        connection.execute("INSERT INTO classes (name, ordinal, x, y) VALUES (?, ?, ?, ?)", (class_name, ordinal, x, y))
+        connection.executemany("INSERT INTO fields (class_name, ordinal, name, type) VALUES (?, ?, ?, ?)",
+                               ((class_name, field_ordinal, field["name"], field["type"])
+                                for field_ordinal, field in enumerate(class_element["fields"])))
+        method_list = class_element["methods"]
+        connection.executemany("INSERT INTO methods (class_name, ordinal, name, return_type) VALUES (?, ?, ?, ?)",
+                               ((class_name, method_ordinal, method["name"], method["return_type"])
+                                for method_ordinal, method in enumerate(method_list)))
+        connection.executemany("INSERT INTO params (class_name, method_ordinal, ordinal, name, type) VALUES (?, ?, ?, ?, ?)",
+                               ((class_name, method_ordinal, param_ordinal, param["name"], param["type"])
+                                for method_ordinal, method in enumerate(method_list)
+                                for param_ordinal, param in enumerate(method["params"])))
+
+    def __delete_class_rows(self, class_name: str):
+        connection = self.__connection
+        for table in ("fields", "methods", "params"):
+            connection.execute(f"DELETE FROM {table} WHERE class_name = ?", (class_name,))
+        connection.execute("DELETE FROM classes WHERE name = ?", (class_name,))
+
+    def __get_next_ordinal(self, table: str) -> int:
+        return self.__connection.execute(f"SELECT COALESCE(MAX(ordinal) + 1, 0) FROM {table}").fetchone()[0]
+
+    #################################################################
+    # Loading #
+
+    def _get_class_names(self, name_prefix: str = None) -> List[str]:
+        """
+        Lists the stored classes in diagram order without reading their members.
+
+        Args:
+            name_prefix (str, optional): Only list the classes whose name starts with this prefix.
+        """
+        where, parameter_list = self.__get_prefix_filter(name_prefix)
+        return [row[0] for row in self.__connection.execute(f"SELECT name FROM classes{where} ORDER BY ordinal", parameter_list)]
+
+    def _get_class(self, class_name: str) -> Dict | None:
+        """
+        Reads one class with its fields, methods and parameters, in the JSON entry format.
+
+        Returns:
+            Dict: The class, None if it is not stored.
+        """
+        row = self.__connection.execute("SELECT x, y FROM classes WHERE name = ?", (class_name,)).fetchone()
+        if row is None:
+            return None
+        return self.__read_class(class_name, row[0], row[1])
+
+    def _iter_records(self, class_name_list: Iterable[str] = None, name_prefix: str = None) -> Iterator[Tuple[str, Dict]]:
+        """
+        Yields ("classes", class data) and ("relationships", relationship data) records, the same records
+        UMLJsonRecordReader yields for a JSON file. Only the requested classes are read, through the indexes,
+        with the relationships between them.
+
+        Args:
+            class_name_list (Iterable[str], optional): Only read these classes.
+            name_prefix (str, optional): Only read the classes whose name starts with this prefix.
+        """
+        connection = self.__connection
+        is_subset = class_name_list is not None or name_prefix is not None
+        if class_name_list is not None:
+            row_list = []
+            for class_name in dict.fromkeys(class_name_list):
+                row = connection.execute("SELECT name, x, y, ordinal FROM classes WHERE name = ?", (class_name,)).fetchone()
+                if row is not None and (name_prefix is None or class_name.startswith(name_prefix)):
+                    row_list.append(row)
+            row_list.sort(key=lambda row: row[3])
+        else:
+            where, parameter_list = self.__get_prefix_filter(name_prefix)
+            row_list = connection.execute(f"SELECT name, x, y, ordinal FROM classes{where} ORDER BY ordinal", parameter_list)
+        if not isinstance(row_list, list):
+            row_list = row_list.fetchall()
+        loaded_name_set = set()
+        progress_callback = self.__progress_callback
+        total_bytes = self.__get_size() if progress_callback is not None else 0
+        class_count = len(row_list)
+        # Report progress about a hundred times while reading
+        report_step = max(1, class_count // 100)
+        for class_index, (class_name, x, y, _) in enumerate(row_list, 1):
+            loaded_name_set.add(class_name)
+            yield "classes", self.__read_class(class_name, x, y)
+            if progress_callback is not None and class_index % report_step == 0:
+                progress_callback(total_bytes * class_index // class_count, total_bytes, class_index)
+        if not is_subset:
+            rel_row_list = connection.execute("SELECT source, destination, type FROM relationships ORDER BY ordinal")
+        else:
+            rel_row_list = []
+            for class_name in loaded_name_set:
+                rel_row_list += connection.execute("SELECT source, destination, type, ordinal FROM relationships WHERE source = ?",
+                                                   (class_name,)).fetchall()
+            rel_row_list = sorted((row for row in rel_row_list if row[1] in loaded_name_set), key=lambda row: row[3])
+        for row in rel_row_list:
+            yield "relationships", {"source": row[0], "destination": row[1], "type": row[2]}
+        if progress_callback is not None:
+            progress_callback(total_bytes, total_bytes, class_count)
+
+    def _get_sections(self) -> Dict[str, Iterator[Dict]]:
+        """
+        Reads the whole diagram as "classes" and "relationships" sections of generators,
+        the shape iter_json_chunks and write_binary_snapshot take.
+        """
+        return {
+            "classes": (self._get_class(class_name) for class_name in self._get_class_names()),
+            "relationships": ({"source": source, "destination": destination, "type": rel_type}
+                              for source, destination, rel_type in self.__connection.execute(
+                                  "SELECT source, destination, type FROM relationships ORDER BY ordinal")),
+        }
+
+    def __get_size(self) -> int:
+        page_count = self.__connection.execute("PRAGMA page_count").fetchone()[0]
+        page_size = self.__connection.execute("PRAGMA page_size").fetchone()[0]
+        return page_count * page_size
+
+    def __read_class(self, class_name: str, x, y) -> Dict:
+        connection = self.__connection
+        field_list = [{"name": name, "type": field_type} for name, field_type in connection.execute(
+            "SELECT name, type FROM fields WHERE class_name = ? ORDER BY ordinal", (class_name,))]
+        method_list = [{"name": name, "return_type": return_type, "params": []} for name, return_type in connection.execute(
+            "SELECT name, return_type FROM methods WHERE class_name = ? ORDER BY ordinal", (class_name,))]
+        for method_ordinal, name, param_type in connection.execute(
+                "SELECT method_ordinal, name, type FROM params WHERE class_name = ? ORDER BY method_ordinal, ordinal", (class_name,)):
+            method_list[method_ordinal]["params"].append({"name": name, "type": param_type})
+        class_element = {"name": class_name, "fields": field_list, "methods": method_list}
+        if x is not None and y is not None:
+            class_element["position"] = {"x": x, "y": y}
+        return class_element
+
+    # Filter on a name prefix as a range of the primary key, so the index is used #
+    @staticmethod
+    def __get_prefix_filter(name_prefix: str) -> Tuple[str, tuple]:
+        if not name_prefix:
+            return "", ()
+        return " WHERE name >= ? AND name < ?", (name_prefix, name_prefix + "\U0010ffff")
+
+###################################################################################################
@@ -2,11 +2,25 @@
 
 # IMPORTED MODULES #
 import json
+import lzma
 import os
-from typing import List, Dict
+import shutil
+import sqlite3
+import threading
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Dict, TextIO, Tuple
+from UML_MVC.UML_CONTROLLER.uml_json_stream import UMLJsonRecordReader, iter_json_chunks
+from UML_MVC.UML_CONTROLLER.uml_binary_snapshot import (BINARY_EXTENSION, MAGIC, UMLBinarySnapshot, convert_binary_to_json,
+                                                        is_binary_snapshot, write_binary_snapshot)
+from UML_MVC.UML_CONTROLLER.uml_sqlite_storage import SQLITE_EXTENSION, SQLITE_MAGIC, UMLSQLiteStorage, is_sqlite_database
+from UML_MVC.UML_CONTROLLER.uml_saved_file_registry import UMLSavedFileRegistry as SavedFileRegistry
+from UML_MVC.UML_CONTROLLER.uml_compressed_json import (COMPRESSED_EXTENSION_LIST, get_compression, get_compression_from_header,
+                                                        open_compressed, write_compressed_chunks)
 # Get the root directory where the main.py file exists
 root_directory = os.path.dirname(os.path.abspath(__file__))  # This gets the current script's directory
 root_directory = os.path.abspath(os.path.join(root_directory, "..", ".."))  # Move to the root directory (where main.py is)
+# The saved file registries, relative to the working directory
+NAME_LIST_PATH = "UML_UTILITY/SAVED_FILES/NAME_LIST.json"
+NAME_LIST_GUI_PATH = "UML_UTILITY/SAVED_FILES/NAME_LIST_GUI.json"
 
 ###################################################################################################
 
@@ -17,90 +31,76 @@ class UMLStorageManager:
     It handles the management of saved UML diagram files and their associated metadata.
     """
 
-    # This function loads the saved file name list at the beginning of the program #
-    @staticmethod
-    def load_name():
+    #################################################################
+    
+    # UML storage manager constructor #
+    def __init__(self, is_compact: bool = False):
         """
-        Load the list of saved file names from 'NAME_LIST.json' at the start of the program.
-        
-        Returns:
-            list: A list of dictionaries containing saved file names and their status ('on'/'off').
-            None: If there is a file not found error or JSON decoding error.
+        Initializes the UMLStorageManager by loading the saved file registries into memory.
+
+        Args:
+            is_compact (bool): Save diagrams without indentation, smaller and faster to write.
         """
-        file_path = "UML_UTILITY/SAVED_FILES/NAME_LIST.json"
-        try:
-            # Check if the file is empty
-            if os.stat(file_path).st_size == 0:
-                return []
-            # Load data from the JSON file
-            with open(file_path, "r") as file:
-                data = json.load(file)
-                return data
-        except FileNotFoundError:
-            # Handle the case where the file is not found
-            print(f"\nFile {file_path} not found.")
-            return None
-        except json.JSONDecodeError:
-            # Handle JSON decoding errors (e.g., if the file is not in proper JSON format)
-            print(f"\nError decoding JSON from {file_path}.")
-            return None
+        self.__saved_file_registry = SavedFileRegistry(NAME_LIST_PATH)
+        self.__saved_file_registry_gui = SavedFileRegistry(NAME_LIST_GUI_PATH)
+        self.__is_compact = is_compact
         
-        # This function loads the saved file name list at the beginning of the program #
-    @staticmethod
-    def load_name_gui():
+    # Getters for the saved file registries #
+    def _get_saved_registry(self) -> SavedFileRegistry:
         """
-        Load the list of saved file names from 'NAME_LIST.json' at the start of the program.
-        
+        Retrieve the registry of saved file names and the active one.
+
         Returns:
-            list: A list of dictionaries containing saved file names and their status ('on'/'off').
-            None: If there is a file not found error or JSON decoding error.
+            SavedFileRegistry: The registry behind 'NAME_LIST.json'.
         """
-        file_path = "UML_UTILITY/SAVED_FILES/NAME_LIST_GUI.json"
-        try:
-            # Check if the file is empty
-            if os.stat(file_path).st_size == 0:
-                return []
-            # Load data from the JSON file
-            with open(file_path, "r") as file:
-                data = json.load(file)
-                return data
-        except FileNotFoundError:
-            # Handle the case where the file is not found
-            print(f"\nFile {file_path} not found.")
-            return None
-        except json.JSONDecodeError:
-            # Handle JSON decoding errors (e.g., if the file is not in proper JSON format)
-            print(f"\nError decoding JSON from {file_path}.")
-            return None
-        
-    #################################################################
+        return self.__saved_file_registry
     
-    # UML storage manager constructor #
-    def __init__(self):
+    def _get_saved_registry_gui(self) -> SavedFileRegistry:
         """
-        Initializes the UMLStorageManager by loading the saved file name list into memory.
+        Retrieve the registry of saved file paths and the active one.
+
+        Returns:
+            SavedFileRegistry: The registry behind 'NAME_LIST_GUI.json'.
         """
-        self.__saved_file_name_list: List[Dict] = self.load_name()
-        self.__saved_file_name_list_gui: List[Dict] = self.load_name_gui()
-        
+        return self.__saved_file_registry_gui
+    
     # Getter to retrieve the list of saved file names #
     def _get_saved_list(self) -> List[Dict]:
         """
-        Retrieve the current list of saved file names and their statuses ('on'/'off').
+        Retrieve the current list of saved file names and their statuses ('on'/'off'), built from the registry for display.
 
         Returns:
             List[Dict]: A list of dictionaries with file names and their statuses.
         """
-        return self.__saved_file_name_list
+        return self.__saved_file_registry._to_list()
     
     def _get_saved_list_gui(self) -> List[Dict]:
         """
-        Retrieve the current list of saved file names and their statuses ('on'/'off').
+        Retrieve the current list of saved file paths and their statuses ('on'/'off'), built from the registry for display.
 
         Returns:
-            List[Dict]: A list of dictionaries with file names and their statuses.
+            List[Dict]: A list of dictionaries with file paths and their statuses.
+        """
+        return self.__saved_file_registry_gui._to_list()
+    
+    # Getter and setter for the compact encoding of saved diagrams #
+    def _is_compact(self) -> bool:
+        """
+        Check whether diagrams are saved without indentation.
+
+        Returns:
+            bool: True if diagrams are saved compact, False if they are indented.
         """
-        return self.__saved_file_name_list_gui
+        return self.__is_compact
+    
+    def _set_compact(self, is_compact: bool):
+        """
+        Choose between compact (non-indented) and indented diagram files. Both load the same way.
+
+        Args:
+            is_compact (bool): True to save compact, False to save indented.
+        """
+        self.__is_compact = is_compact
         
     #################################################################
     ### MEMBER FUNCTIONS ###
@@ -114,121 +114,365 @@ class UMLStorageManager:
 
         Args:
             file_name (str): The name of the file to save.
-            main_data (Dict): The UML data to be saved in JSON format.
+            main_data (Dict): The UML data to be saved in JSON format, its sections may be generators of entries.
 
         Returns:
-            None
+            bool: True if the file was written, False otherwise.
         """
-        file_path = os.path.join(root_directory, f"{file_name}.json")
-        try:
-            # If the file does not exist, create and write the data
-            if not os.path.exists(file_path):
-                with open(file_path, "w") as json_file:
-                    json.dump(main_data, json_file, indent=4)
-                    return
-            # If file exists, update its data if the file name is in the saved list
-            for dictionary in self.__saved_file_name_list:
-                if file_name in dictionary:
-                    # Open the file and overwrite the current data with the new data
-                    with open(file_path, "r") as json_file:
-                        data = json.load(json_file)
-                        data = main_data  # Overwrite with new data
-                    with open(file_path, "w") as json_file:
-                        json.dump(data, json_file, indent=4)
-        except json.JSONDecodeError:
-            # Handle JSON decoding errors
-            print(f"\nError decoding JSON from {file_path}.")
-            return None
+        file_path = self._get_json_path(file_name)
+        # Only create new files or overwrite files that are in the saved list
+        if os.path.exists(file_path) and file_name not in self.__saved_file_registry:
+            return False
+        return self._write_json_atomic(file_path, main_data)
+    
+    # Full path of a saved file #
+    def _get_json_path(self, file_name: str) -> str:
+        """
+        Args:
+            file_name (str): The name of a saved file.
+
+        Returns:
+            str: The full path of '<file_name>.json' in the root directory.
+        """
+        return os.path.join(root_directory, f"{file_name}.json")
     
     # Save data specifically for GUI-based interactions
     def _save_data_to_json_gui(self, file_path: str, main_data: Dict):
         """
         Save the UML data (main_data) to a specified file path for GUI operations.
+        Files ending in '.umlb', or existing binary snapshots, are saved as binary snapshots,
+        files ending in '.umldb', or existing SQLite databases, as SQLite databases,
+        files ending in '.json.gz' or '.json.xz', or existing compressed files, as compressed JSON, everything else as JSON.
 
         Args:
             file_name (str): The name of the file to save.
             file_path (str): The full path (directory + file) where the data will be saved.
-            main_data (Dict): The UML data to be saved in JSON format.
+            main_data (Dict): The UML data to be saved in JSON format, its sections may be generators of entries.
 
         Returns:
-            None
+            bool: True if the file was written, False otherwise.
         """
-        try:
-            # If file does not exist, create it and write the data
-            if not os.path.exists(file_path):
-                with open(file_path, "w") as json_file:
-                    json.dump(main_data, json_file, indent=4)
-                    return
-            
-            # If file exists, update its data
-            with open(file_path, "r") as json_file:
-                data = json.load(json_file)
-            
-            # Overwrite with new data
-            with open(file_path, "w") as json_file:
-                json.dump(main_data, json_file, indent=4)
+        if file_path.endswith(BINARY_EXTENSION) or is_binary_snapshot(file_path):
+            return self._write_binary_atomic(file_path, main_data)
+        if self._is_sqlite_path(file_path):
+            return self._save_data_to_sqlite(file_path, main_data)
+        compression = get_compression(file_path)
+        if compression is not None:
+            return self._write_compressed_atomic(file_path, main_data, compression)
+        return self._write_json_atomic(file_path, main_data)
         
-        except json.JSONDecodeError:
-            print(f"\nError decoding JSON from {file_path}.")
-            return None
+    # Write data to a JSON file in one pass, replacing the old file only once the new one is complete #
+    def _write_json_atomic(self, file_path: str, data: Dict) -> bool:
+        """
+        Stream data into a temporary file next to file_path and atomically rename it over file_path.
+        A crash or error mid-write leaves the previous file untouched instead of a truncated one.
+
+        Args:
+            file_path (str): The full path of the file to write.
+            data (Dict): The data to be saved in JSON format, its sections may be generators of entries.
+
+        Returns:
+            bool: True if the file was written, False otherwise.
+        """
+        def write_json(json_file: TextIO):
+            # Write chunk by chunk, the full text is never built in memory
+            for chunk in iter_json_chunks(data, is_compact=self.__is_compact):
+                json_file.write(chunk)
+        return self.__write_atomic(file_path, write_json, "w")
+    
+    # Write data to a compressed JSON file, replacing the old file only once the new one is complete #
+    def _write_compressed_atomic(self, file_path: str, data: Dict, compression: str) -> bool:
+        """
+        Stream data as JSON through a gzip or lzma compressor into a temporary file next to file_path
+        and atomically rename it over file_path.
+
+        Args:
+            file_path (str): The full path of the file to write.
+            data (Dict): The data to be saved in JSON format, its sections may be generators of entries.
+            compression (str): "gzip" or "lzma".
+
+        Returns:
+            bool: True if the file was written, False otherwise.
+        """
+        def write_compressed(compressed_file: BinaryIO):
+            write_compressed_chunks(compressed_file, iter_json_chunks(data, is_compact=self.__is_compact), compression)
+        return self.__write_atomic(file_path, write_compressed, "wb")
+    
+    # Write data to a binary snapshot, replacing the old file only once the new one is complete #
+    def _write_binary_atomic(self, file_path: str, data: Dict) -> bool:
+        """
+        Write data as a binary snapshot into a temporary file next to file_path and atomically rename it over file_path.
+
+        Args:
+            file_path (str): The full path of the file to write.
+            data (Dict): The data to be saved, its sections may be generators of entries.
+
+        Returns:
+            bool: True if the file was written, False otherwise.
+        """
+        def write_binary(binary_file: BinaryIO):
+            write_binary_snapshot(binary_file, data)
+        return self.__write_atomic(file_path, write_binary, "wb")
+    
+    def __write_atomic(self, file_path: str, write_function: Callable, mode: str) -> bool:
+        # The temporary file lives in the same directory so the rename never crosses file systems,
+        # and is per thread so an autosave and an explicit save never share it
+        temp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, mode, buffering=1024 * 1024) as file:
+                write_function(file)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, file_path)
+            return True
+        except (OSError, KeyError, TypeError, ValueError, lzma.LZMAError):
+            print(f"\nError saving data to {file_path}.")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
         
-    # Load UML data from a specified JSON file #
-    def _load_data_from_json(self, file_name: str):
+    # Check whether a path is saved as an SQLite database #
+    @staticmethod
+    def _is_sqlite_path(file_path: str) -> bool:
         """
-        Load UML data from a specified JSON file.
+        Check whether a file is saved as an SQLite database: its name ends in '.umldb' or it already is one.
 
         Args:
-            file_name (str): The name of the file to load data from.
+            file_path (str): The full path of the file.
 
         Returns:
-            dict: The UML data loaded from the JSON file.
-            None: If there is a file not found error or JSON decoding error.
+            bool: True for an SQLite database, False otherwise.
+        """
+        return file_path.endswith(SQLITE_EXTENSION) or is_sqlite_database(file_path)
+    
+    # Replace the whole diagram in an SQLite database #
+    def _save_data_to_sqlite(self, file_path: str, main_data: Dict) -> bool:
         """
-        # Create the file path to save the file in the root directory
-        file_path = os.path.join(root_directory, f"{file_name}.json")
+        Save the UML data (main_data) to an SQLite database in one transaction, replacing what it held.
+
+        Args:
+            file_path (str): The full path of the database.
+            main_data (Dict): The UML data to be saved, its sections may be generators of entries.
+
+        Returns:
+            bool: True if the data was saved, False otherwise; the database is left unchanged then.
+        """
+        return self.__write_sqlite(file_path, lambda storage: storage._save_all(main_data))
+    
+    # Save only what changed to an SQLite database #
+    def _save_changes_to_sqlite(self, file_path: str, class_entry_list: Iterable[Dict], deleted_class_name_list: Iterable[str] = (),
+                                relationship_entry_list: Iterable[Dict] = (), deleted_relationship_list: Iterable[Tuple[str, str]] = (),
+                                renamed_class_list: Iterable[Tuple[str, str]] = ()) -> bool:
+        """
+        Update an SQLite database in one transaction, rewriting only the rows of the given classes and relationships.
+
+        Args:
+            file_path (str): The full path of the database.
+            class_entry_list (Iterable[Dict]): JSON-formatted classes to insert or replace.
+            deleted_class_name_list (Iterable[str]): Names of the deleted classes.
+            relationship_entry_list (Iterable[Dict]): JSON-formatted relationships to insert or replace.
+            deleted_relationship_list (Iterable[Tuple[str, str]]): (source, destination) pairs of the deleted relationships.
+            renamed_class_list (Iterable[Tuple[str, str]]): (old name, new name) pairs of the renamed classes.
+
+        Returns:
+            bool: True if the changes were saved, False otherwise; the database is left unchanged then.
+        """
+        return self.__write_sqlite(file_path, lambda storage: storage._save_changes(
+            class_entry_list, deleted_class_name_list, relationship_entry_list, deleted_relationship_list, renamed_class_list))
+    
+    def __write_sqlite(self, file_path: str, write_function: Callable[[UMLSQLiteStorage], None]) -> bool:
+        try:
+            storage = UMLSQLiteStorage(file_path)
+        except sqlite3.Error:
+            print(f"\nError saving data to {file_path}.")
+            return False
         try:
-            with open(file_path, "r") as file:
-                data = json.load(file)
-                return data
-        except FileNotFoundError:
-            # Handle the case where the file is not found
+            write_function(storage)
+            return True
+        except (sqlite3.Error, KeyError, TypeError):
+            print(f"\nError saving data to {file_path}.")
+            return False
+        finally:
+            storage._close()
+    
+    # Load some or all classes of an SQLite database one record at a time #
+    def _load_records_from_sqlite(self, file_path: str, class_name_list: Iterable[str] = None, name_prefix: str = None,
+                                  progress_callback: Callable[[int, int, int], None] = None) -> Iterator[Tuple[str, Dict]] | None:
+        """
+        Read the classes of an SQLite database, or only a subset of them, with the relationships between them.
+        Only the rows of the requested classes are read.
+
+        Args:
+            file_path (str): The full path of the database.
+            class_name_list (Iterable[str], optional): Only read these classes.
+            name_prefix (str, optional): Only read the classes whose name starts with this prefix.
+            progress_callback (Callable, optional): Called with (bytes read, total bytes, classes read).
+
+        Returns:
+            Iterator[Tuple[str, Dict]]: The records of the database, see _load_records_from_json.
+            None: If the file is not found.
+        """
+        if not os.path.isfile(file_path):
             print(f"File {file_path} not found.")
             return None
-        except json.JSONDecodeError:
-            # Handle JSON decoding errors
-            print(f"\nError decoding JSON from {file_path}.")
-            return None
+        return self.__iter_sqlite_records(file_path, progress_callback, class_name_list, name_prefix)
+    
+    def __iter_sqlite_records(self, file_path: str, progress_callback: Callable[[int, int, int], None],
+                              class_name_list: Iterable[str] = None, name_prefix: str = None) -> Iterator[Tuple[str, Dict]]:
+        try:
+            storage = UMLSQLiteStorage(file_path, progress_callback=progress_callback)
+        except sqlite3.Error:
+            raise json.JSONDecodeError("Unsupported diagram database", "", 0)
+        try:
+            yield from storage._iter_records(class_name_list, name_prefix)
+        except sqlite3.Error:
+            raise json.JSONDecodeError("Malformed diagram database", "", 0)
+        finally:
+            storage._close()
         
-    # Load UML data from a specified JSON file #
-    def _load_data_from_json_gui(self, file_path: str):
+    # Load UML data from a JSON file one record at a time #
+    def _load_records_from_json(self, file_name: str, progress_callback: Callable[[int, int, int], None] = None) -> Iterator[Tuple[str, Dict]] | None:
         """
-        Load UML data from a specified JSON file.
+        Read a saved file incrementally, yielding its classes and relationships one at a time.
 
         Args:
             file_name (str): The name of the file to load data from.
+            progress_callback (Callable, optional): Called with (bytes read, total bytes, classes read).
 
         Returns:
-            dict: The UML data loaded from the JSON file.
-            None: If there is a file not found error or JSON decoding error.
+            Iterator[Tuple[str, Dict]]: ("classes", class data) and ("relationships", relationship data) records,
+                raising json.JSONDecodeError while iterating if the file is malformed.
+            None: If the file is not found.
         """
-        # Create the file path to save the file in the root directory
-        try:
-            with open(file_path, "r") as file:
-                data = json.load(file)
-                return data
-        except FileNotFoundError:
-            # Handle the case where the file is not found
+        file_path = self._get_json_path(file_name)
+        return self._load_records_from_json_gui(file_path, progress_callback)
+    
+    # Load UML data from a JSON file at any path one record at a time #
+    def _load_records_from_json_gui(self, file_path: str, progress_callback: Callable[[int, int, int], None] = None) -> Iterator[Tuple[str, Dict]] | None:
+        """
+        Read a JSON file, binary snapshot or SQLite database at the given path incrementally, yielding its classes and relationships one at a time.
+
+        Args:
+            file_path (str): The full path of the file to load data from.
+            progress_callback (Callable, optional): Called with (bytes read, total bytes, classes read).
+
+        Returns:
+            Iterator[Tuple[str, Dict]]: The records of the file, see _load_records_from_json.
+            None: If the file is not found.
+        """
+        if not os.path.isfile(file_path):
             print(f"File {file_path} not found.")
             return None
-        except json.JSONDecodeError:
-            # Handle JSON decoding errors
-            print(f"\nError decoding JSON from {file_path}.")
-            return None
+        return self.__iter_records(file_path, progress_callback)
+    
+    # Read the records of a JSON file, a binary snapshot or an SQLite database, the format is detected from the file content #
+    def __iter_records(self, file_path: str, progress_callback: Callable[[int, int, int], None]) -> Iterator[Tuple[str, Dict]]:
+        with open(file_path, "rb") as file:
+            file_header = file.read(len(SQLITE_MAGIC))
+            file.seek(0)
+            if file_header == SQLITE_MAGIC:
+                yield from self.__iter_sqlite_records(file_path, progress_callback)
+                return
+            compression = get_compression_from_header(file_header)
+            if compression is not None:
+                yield from self.__iter_compressed_records(file, compression, progress_callback)
+                return
+            is_binary = file_header.startswith(MAGIC)
+            if not is_binary:
+                yield from UMLJsonRecordReader(file, progress_callback=progress_callback)._iter_records()
+                return
+            try:
+                snapshot = UMLBinarySnapshot(file, progress_callback=progress_callback)
+            except ValueError:
+                raise json.JSONDecodeError("Unsupported binary snapshot", "", 0)
+            try:
+                yield from snapshot._iter_records()
+            finally:
+                snapshot._close()
+    
+    # Read the records of a compressed JSON file, decompressing it as it is read #
+    def __iter_compressed_records(self, file: BinaryIO, compression: str,
+                                  progress_callback: Callable[[int, int, int], None]) -> Iterator[Tuple[str, Dict]]:
+        total_bytes = os.fstat(file.fileno()).st_size
+        reader_progress_callback = None
+        if progress_callback is not None:
+            # Progress is reported in compressed bytes, the size of the file on disk
+            def reader_progress_callback(bytes_read: int, _: int, class_count: int):
+                progress_callback(min(file.tell(), total_bytes), total_bytes, class_count)
+        decompressed_file = open_compressed(file, compression)
+        try:
+            yield from UMLJsonRecordReader(decompressed_file, progress_callback=reader_progress_callback)._iter_records()
+        except (OSError, EOFError, lzma.LZMAError) as error:
+            raise json.JSONDecodeError(f"Corrupted compressed file: {error}", "", 0)
+        finally:
+            decompressed_file.close()
+    
+    # Name of a saved file, its path without the directory and extension #
+    @staticmethod
+    def _get_file_name(file_path: str) -> str:
+        """
+        Args:
+            file_path (str): The full path of a diagram file.
+
+        Returns:
+            str: The file name without its extension, '.json.gz' and '.json.xz' count as one extension.
+        """
+        file_base_name = os.path.basename(file_path)
+        for extension in COMPRESSED_EXTENSION_LIST:
+            if file_base_name.endswith(extension):
+                return file_base_name[:-len(extension)]
+        return os.path.splitext(file_base_name)[0]
+    
+    # Copy a JSON file into the saved files of the root directory #
+    def _copy_data_to_json(self, source_path: str, file_name: str):
+        """
+        Copy a loaded JSON file to '<file_name>.json' in the root directory without parsing it again.
+        A binary snapshot or SQLite database is converted to JSON and a compressed file decompressed instead.
+        The copy is written to a temporary file and renamed, like a save.
+
+        Args:
+            source_path (str): The full path of the file to copy.
+            file_name (str): The name of the saved file.
+
+        Returns:
+            bool: True if the saved file holds the copy, False otherwise.
+        """
+        file_path = self._get_json_path(file_name)
+        if os.path.exists(file_path) and os.path.samefile(source_path, file_path):
+            return True
+        temp_path = f"{file_path}.{os.getpid()}.tmp"
+        try:
+            if is_binary_snapshot(source_path):
+                convert_binary_to_json(source_path, temp_path, is_compact=self.__is_compact)
+            elif is_sqlite_database(source_path):
+                storage = UMLSQLiteStorage(source_path)
+                try:
+                    with open(temp_path, "w") as json_file:
+                        for chunk in iter_json_chunks(storage._get_sections(), is_compact=self.__is_compact):
+                            json_file.write(chunk)
+                finally:
+                    storage._close()
+            elif get_compression(source_path) is not None:
+                with open(source_path, "rb") as source_file, open(temp_path, "wb") as json_file:
+                    decompressed_file = open_compressed(source_file, get_compression(source_path))
+                    try:
+                        shutil.copyfileobj(decompressed_file, json_file, 1024 * 1024)
+                    finally:
+                        decompressed_file.close()
+            else:
+                shutil.copyfile(source_path, temp_path)
+            os.replace(temp_path, file_path)
+            return True
+        except (OSError, ValueError, EOFError, sqlite3.Error, lzma.LZMAError):
+            print(f"\nError saving data to {file_path}.")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
         
     # Add a new file name to the saved file list #
     def _add_name_to_saved_file(self, file_name: str):
         """
-        Add a new file name to the saved file name list and store it in 'NAME_LIST.json'.
+        Add a new file name to the saved file registry and store it in 'NAME_LIST.json'.
 
         Args:
             file_name (str): The name of the file to be added to the saved list.
@@ -236,97 +480,41 @@ class UMLStorageManager:
         Returns:
             None
         """
-        file_path = "UML_UTILITY/SAVED_FILES/NAME_LIST.json"
-        saved_list = self.__saved_file_name_list
-        # Avoid duplicate file names
-        for pair in saved_list:
-            if file_name in pair:
-                return
-        saved_list.append({file_name: "off"})
-        try:
-            # Write the updated saved list to the file
-            with open(file_path, "w") as file:
-                json.dump(saved_list, file, indent=4)
-        except FileNotFoundError:
-            print(f"\nFile {file_path} not found.")
-            return None
-        except json.JSONDecodeError:
-            print(f"\nError decoding JSON from {file_path}.")
-            return None
+        if self.__saved_file_registry._add(file_name):
+            self.__saved_file_registry._flush()
         
-    # Update the saved file list with new information #
-    def _update_saved_list(self, saved_list: List[Dict]):
+    # Store the saved file list #
+    def _update_saved_list(self):
         """
-        Update the saved file name list and store it in 'NAME_LIST.json'.
-
-        Args:
-            saved_list (List[Dict]): The updated list of saved files.
+        Store the saved file registry in 'NAME_LIST.json' if it changed since it was last stored.
 
         Returns:
             None
         """
-        file_path = "UML_UTILITY/SAVED_FILES/NAME_LIST.json"
-        try:
-            # Write the updated saved list to the file
-            with open(file_path, "w") as file:
-                json.dump(saved_list, file, indent=4)
-        except FileNotFoundError:
-            print(f"\nFile {file_path} not found.")
-            return None
-        except json.JSONDecodeError:
-            print(f"\nError decoding JSON from {file_path}.")
-            return None
+        self.__saved_file_registry._flush()
         
     # Add name to saved list for GUI #
     def _add_name_to_saved_file_gui(self, file_path: str):
         """
-        Add a new file name to the saved file name list and store it in 'NAME_LIST_GUI.json'.
+        Add a new file path to the saved file registry and store it in 'NAME_LIST_GUI.json'.
 
         Args:
-            file_name (str): The name of the file to be added to the saved list.
+            file_path (str): The full path of the file to be added to the saved list.
 
         Returns:
             None
         """
-        file_name_path = "UML_UTILITY/SAVED_FILES/NAME_LIST_GUI.json"
-        saved_list_gui = self.__saved_file_name_list_gui
-        # Avoid duplicate file names
-        for pair in saved_list_gui:
-            if file_path in pair:
-                return
-        saved_list_gui.append({file_path: "off"})
-        try:
-            # Write the updated saved list to the file
-            with open(file_name_path, "w") as file:
-                json.dump(saved_list_gui, file, indent=4)
-        except FileNotFoundError:
-            print(f"\nFile {file_name_path} not found.")
-            return None
-        except json.JSONDecodeError:
-            print(f"\nError decoding JSON from {file_name_path}.")
-            return None
+        if self.__saved_file_registry_gui._add(file_path):
+            self.__saved_file_registry_gui._flush()
         
-    # Update the saved file list with new information #
-    def _update_saved_list_gui(self, saved_list_gui: List[Dict]):
+    # Store the saved file list for GUI #
+    def _update_saved_list_gui(self):
         """
-        Update the saved file name list and store it in 'NAME_LIST.json'.
-
-        Args:
-            saved_list (List[Dict]): The updated list of saved files.
+        Store the saved file registry in 'NAME_LIST_GUI.json' if it changed since it was last stored.
 
         Returns:
             None
         """
-        file_path = "UML_UTILITY/SAVED_FILES/NAME_LIST_GUI.json"
-        try:
-            # Write the updated saved list to the file
-            with open(file_path, "w") as file:
-                json.dump(saved_list_gui, file, indent=4)
-        except FileNotFoundError:
-            print(f"\nFile {file_path} not found.")
-            return None
-        except json.JSONDecodeError:
-            print(f"\nError decoding JSON from {file_path}.")
-            return None
+        self.__saved_file_registry_gui._flush()
 
 ###################################################################################################
\ No newline at end of file
@@ -0,0 +1,59 @@
+from typing import Iterable, List, Set, Tuple
+
+###################################################################################################
+# Change tracking for UMLModel
+# A tracker records which classes and relationships changed since it was last cleared, so a
+# writer (the SQLite storage, the command journal) only has to write those instead of the whole
+# diagram. The model feeds every attached tracker from the same main data helpers that patch
+# main data, so a tracker sees every edit, undo and redo, inside batches too.
+
+class UMLChangeTracker:
+    """
+    Records the classes and relationships that changed, the class renames in the order they
+    happened, and whether everything changed at once (a load, a reset or a full rebuild).
+    """
+
+    def __init__(self):
+        self.__is_all_changed = True
+        self.__class_name_set: Set[str] = set()
+        self.__relationship_key_set: Set[Tuple[str, str]] = set()
+        self.__renamed_class_list: List[Tuple[str, str]] = []
+
+    def _mark(self, class_name_list: Iterable[str] = None, relationship_key_list: Iterable[Tuple[str, str]] = ()):
+        """
+        Args:
+            class_name_list (Iterable[str], optional): The classes that changed, every class when None.
+            relationship_key_list (Iterable[Tuple[str, str]]): The (source, destination) pairs of the relationships that changed.
+        """
+        if class_name_list is None:
+            self.__is_all_changed = True
+            return
+        self.__class_name_set.update(class_name_list)
+        self.__relationship_key_set.update(relationship_key_list)
+
+    def _mark_rename(self, current_name: str, new_name: str):
+        self.__renamed_class_list.append((current_name, new_name))
+        self.__class_name_set.update((current_name, new_name))
+
+    def _clear(self, is_all_changed: bool = False):
+        self.__is_all_changed = is_all_changed
+        self.__class_name_set = set()
+        self.__relationship_key_set = set()
+        self.__renamed_class_list = []
+
+    def _is_all_changed(self) -> bool:
+        return self.__is_all_changed
+
+    def _has_changes(self) -> bool:
+        return self.__is_all_changed or bool(self.__class_name_set or self.__relationship_key_set)
+
+    def _get_class_name_set(self) -> Set[str]:
+        return self.__class_name_set
+
+    def _get_relationship_key_set(self) -> Set[Tuple[str, str]]:
+        return self.__relationship_key_set
+
+    def _get_renamed_class_list(self) -> List[Tuple[str, str]]:
+        return self.__renamed_class_list
+
+###################################################################################################
@@ -9,15 +9,23 @@ to handle save/load functionality and provides static methods for creating UML c
 ###################################################################################################
 
 import copy
+import json
 import re
 import os
-from typing import Dict, List
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Tuple
 from UML_CORE.UML_CLASS.uml_class import UMLClass as Class
 from UML_CORE.UML_FIELD.uml_field import UMLField as Field
 from UML_CORE.UML_METHOD.uml_method import UMLMethod as Method
+from UML_CORE.UML_METHOD.uml_method_table import UMLMethodTable as MethodTable
 from UML_CORE.UML_PARAMETER.uml_parameter import UMLParameter as Parameter
 from UML_CORE.UML_RELATIONSHIP.uml_relationship import UMLRelationship as Relationship
 from UML_MVC.UML_CONTROLLER.uml_storage_manager import UMLStorageManager as Storage
+from UML_MVC.UML_CONTROLLER.uml_json_stream import iter_main_data_records
+from UML_MVC.UML_MODEL.uml_change_tracker import UMLChangeTracker as ChangeTracker
+from UML_MVC.UML_MODEL.uml_slot_dict import MIN_COMPACT_SIZE, UMLSlotDict
+from UML_MVC.UML_MODEL.uml_snapshot import UMLSnapshotDict, UMLSnapshotList, freeze_data
+from UML_MVC.uml_event_bus import UMLEventBus as EventBus
 from UML_ENUM_CLASS.uml_enum import InterfaceOptions, RelationshipType
 from UML_MVC.UML_VIEW.UML_GUI_VIEW.uml_gui_canvas import UMLGraphicsView as GUIView
 # Get the root directory where the main.py file exists
@@ -50,27 +58,59 @@ class UMLModel:
         """
         self.__user_view = view
         self.__console = console   
-        self.__class_list: Dict[str, Class] = {}
+        self.__class_list: Dict[str, Class] = UMLSlotDict()
         self.__storage_manager: Storage = Storage()
         self.__relationship_list: List[Relationship] = []
+        # Relationship index: (source, destination) pair, source -> destinations and destination -> sources
+        self.__relationship_by_pair: Dict[tuple, Relationship] = {}
+        self.__outgoing_relationships: Dict[str, Dict[str, Relationship]] = {}
+        self.__incoming_relationships: Dict[str, Dict[str, Relationship]] = {}
         self.__main_data: Dict = {"classes":[], "relationships":[]}
-        self._observers = [] # For observer design pattern
+        # Slot of each class / relationship inside main data so a single edit only patches its own entry
+        self.__class_slot_index: Dict[str, int] = {}
+        self.__relationship_slot_index: Dict[tuple, int] = {}
+        # Snapshots handed out to readers: a version counter bumped on every change, the read-only
+        # snapshots of the current version, and a read-only copy of every class that has not changed since
+        self.__data_version = 0
+        self.__main_data_snapshot: Dict = None
+        self.__class_list_snapshot: Dict[str, Class] = None
+        self.__class_snapshot_table: Dict[str, Class] = {}
+        # Batch state: nesting depth, whether main data must be rebuilt on commit and the state to restore on rollback
+        self.__batch_depth = 0
+        self.__is_batch_main_data_dirty = False
+        self.__batch_backup: Dict = None
+        # Change trackers fed by every edit. The SQLite one holds the changes since the last save to
+        # the database at __sqlite_path, which may have been loaded as a subset
+        self.__sqlite_change_tracker: ChangeTracker = ChangeTracker()
+        self.__change_tracker_list: List[ChangeTracker] = [self.__sqlite_change_tracker]
+        self.__sqlite_path: str = None
+        self.__is_sqlite_subset = False
+        # The data came from a file other than the active one, or is only part of a file,
+        # until it is saved to the active file or replaced; autosave must not write it there
+        self.__is_detached = False
+        # Full path -> (data version, (modification time, size) of the file) when the model was last
+        # saved to or loaded from the file, so saving or reloading an unchanged model is skipped
+        self.__synced_file_table: Dict[str, Tuple[int, Tuple[int, int]]] = {}
+        # Observers are notified through the event bus
+        self.__event_bus: EventBus = EventBus()
+        self._observers = self.__event_bus._get_observer_list() # For observer design pattern
         self._current_number_of_method = 0
                     
     #################################################################
       
-    def _attach_observer(self, observer):
+    def _attach_observer(self, observer, event_type_list: List[str] = None):
         """
         Attaches an observer to the UMLModel.
 
         Parameters:
             observer: The observer instance to be added to the list of observers.
+            event_type_list (List[str], optional): The event types the observer wants, every event type when None.
 
-        This method adds the given observer to the internal list of observers if it is not already present.
+        This method subscribes the given observer to the model's event bus. Attaching an observer again
+        replaces the event types it is subscribed to.
         Observers are notified of changes in the model's data.
         """
-        if observer not in self._observers:
-            self._observers.append(observer)
+        self.__event_bus._subscribe(observer, event_type_list)
     
     def _detach_observer(self, observer):
         """
@@ -81,8 +121,7 @@ class UMLModel:
 
         This method removes the given observer from the internal list of observers if it is present.
         """
-        if observer in self._observers:
-            self._observers.remove(observer)
+        self.__event_bus._unsubscribe(observer)
     
     def _notify_observers (self, event_type=None, data=None, is_loading=None, is_undo_or_redo: bool = None):
         """
@@ -94,10 +133,176 @@ class UMLModel:
             is_loading (bool, optional): Flag indicating if the notification is part of a loading process.
             is_undo_or_redo (bool, optional): Flag indicating if the notification is part of an undo or redo operation.
 
-        This method calls the _update method on each attached observer, passing along the event information.
+        This method publishes the event on the event bus, which calls the _update method of each observer
+        subscribed to the event type. By default every event is delivered right away; inside a batch, or
+        with a higher flush threshold on the bus, events are queued, redundant ones merged, and delivered together.
         """
-        for observer in self._observers:
-            observer._update(event_type, data, is_loading, is_undo_or_redo)
+        self.__event_bus._publish(event_type, data, is_loading, is_undo_or_redo)
+    
+    def _get_event_bus(self) -> EventBus:
+        """
+        Retrieves the event bus the model notifies its observers through.
+
+        Returns:
+            EventBus: The event bus, e.g. to change its flush threshold or flush it explicitly.
+        """
+        return self.__event_bus
+    
+    #################################################################
+    
+    # Batch #
+    
+    def _begin_batch(self):
+        """
+        Starts a batch of edits. Until the batch commits, main data is not updated after each edit and
+        observer notifications are held back. Batches can be nested, only the outermost one commits.
+
+        The state before the batch is kept (as the read-only snapshots, so classes that did not change
+        since the last snapshot are not copied again) to be restored on rollback.
+        """
+        if self.__batch_depth == 0:
+            self.__batch_backup = self._create_checkpoint()
+            self.__is_batch_main_data_dirty = False
+        self.__batch_depth += 1
+        self.__event_bus._hold()
+    
+    def _commit_batch(self) -> bool:
+        """
+        Commits the current batch. When the outermost batch commits, main data is rebuilt once and the
+        held back notifications are merged and delivered to the observers in one pass by the event bus.
+
+        Returns:
+            bool: True if a batch was committed, False if no batch is running.
+        """
+        if self.__batch_depth == 0:
+            return False
+        self.__batch_depth -= 1
+        if self.__batch_depth == 0:
+            if self.__is_batch_main_data_dirty:
+                self._update_main_data_for_every_action()
+            self.__batch_backup = None
+        self.__event_bus._release()
+        return True
+    
+    def _is_in_batch(self) -> bool:
+        return self.__batch_depth > 0
+    
+    def _rollback_batch(self) -> bool:
+        """
+        Rolls back the current batch, nested batches included. Classes, relationships and main data
+        return to their state before the outermost batch began and the held back notifications are dropped.
+
+        Returns:
+            bool: True if a batch was rolled back, False if no batch is running.
+        """
+        if self.__batch_depth == 0:
+            return False
+        backup = self.__batch_backup
+        self.__event_bus._discard()
+        for _ in range(self.__batch_depth):
+            self.__event_bus._release()
+        self.__batch_depth = 0
+        self.__batch_backup = None
+        self._restore_checkpoint(backup)
+        return True
+    
+    # Checkpoint #
+    
+    def _create_checkpoint(self) -> Dict:
+        """
+        Captures the state of the model, to be put back by _restore_checkpoint. The classes and main data are
+        kept as the read-only snapshots, so what did not change since the last snapshot is shared, not copied.
+        Must not be called inside a batch, main data is not up to date there.
+
+        Returns:
+            Dict: The checkpoint, to be treated as read-only.
+        """
+        return {
+            "class_list": self._get_class_list(),
+            "relationship_list": [(rel._get_source_class(), rel._get_destination_class(), rel._get_type()) for rel in self.__relationship_list],
+            "main_data": self._get_main_data(),
+            "number_of_method": self._current_number_of_method,
+        }
+    
+    def _restore_checkpoint(self, checkpoint: Dict):
+        """
+        Puts the classes, relationships and main data back to the state captured by _create_checkpoint.
+        Only what changed since is restored: a class whose snapshot is still the one in the checkpoint is
+        kept as it is, so is a relationship of the same type, and the main data entries are shared with
+        the checkpoint. Observers are not notified. The checkpoint itself is left untouched and can be restored again.
+
+        Parameters:
+            checkpoint (Dict): A checkpoint returned by _create_checkpoint.
+        """
+        # A class is unchanged since its snapshot was taken as long as the snapshot is still in the table
+        class_snapshot_table = self.__class_snapshot_table
+        checkpoint_class_list = checkpoint["class_list"]
+        live_class_list = self.__class_list
+        changed_class_name_list = [class_name for class_name in live_class_list if class_name not in checkpoint_class_list]
+        restored_class_list = UMLSlotDict()
+        restored_snapshot_list = []
+        for class_name, class_snapshot in checkpoint_class_list.items():
+            if class_name in live_class_list and class_snapshot_table.get(class_name) is class_snapshot:
+                restored_class_list[class_name] = live_class_list[class_name]
+            else:
+                restored_class_list[class_name] = copy.deepcopy(class_snapshot)
+                restored_snapshot_list.append((class_name, class_snapshot))
+                changed_class_name_list.append(class_name)
+        self.__class_list = restored_class_list
+        live_relationship_by_pair = self.__relationship_by_pair
+        self.__relationship_list = []
+        self.__relationship_by_pair = {}
+        self.__outgoing_relationships = {}
+        self.__incoming_relationships = {}
+        changed_relationship_key_list = []
+        for source_class_name, destination_class_name, rel_type in checkpoint["relationship_list"]:
+            relationship = live_relationship_by_pair.get((source_class_name, destination_class_name))
+            if relationship is None or relationship._get_type() != rel_type:
+                relationship = self.create_relationship(source_class_name, destination_class_name, rel_type)
+                changed_relationship_key_list.append((source_class_name, destination_class_name))
+            self.__relationship_list.append(relationship)
+            self.__index_relationship(relationship)
+        changed_relationship_key_list.extend(key for key in live_relationship_by_pair if key not in self.__relationship_by_pair)
+        self._current_number_of_method = checkpoint["number_of_method"]
+        checkpoint_main_data = checkpoint["main_data"]
+        self.__main_data = {key: list(value) if isinstance(value, list) else value for key, value in checkpoint_main_data.items()}
+        self.__rebuild_main_data_index()
+        self.__mark_dirty(changed_class_name_list, changed_relationship_key_list)
+        self.__main_data_changed(changed_class_name_list)
+        # The restored copies match the checkpoint snapshots, so do the snapshots of this version
+        for class_name, class_snapshot in restored_snapshot_list:
+            class_snapshot_table[class_name] = class_snapshot
+        self.__class_list_snapshot = checkpoint_class_list
+        self.__main_data_snapshot = checkpoint_main_data
+    
+    # Announce a restored model #
+    def _notify_reloaded(self):
+        """
+        Drops the notifications held by the running batch and sends one LOAD event instead. For a batch that
+        restored a checkpoint: observers never saw the checkpoint, so the edits after it mean nothing to them,
+        they have to read the whole model again.
+        """
+        self.__event_bus._discard()
+        self._notify_observers(event_type=InterfaceOptions.LOAD.value, data={"class_count": len(self.__class_list), "relationship_count": len(self.__relationship_list)}, is_loading=True)
+    
+    @contextmanager
+    def _batch(self):
+        """
+        Runs the edits of a with-block as one batch: committed when the block ends,
+        rolled back if the block raises.
+
+        Usage:
+            with model._batch():
+                model._add_class("Car")
+                model._add_field("Car", "int", "speed")
+        """
+        self._begin_batch()
+        try:
+            yield self
+        except BaseException:
+            self._rollback_batch()
+            raise
+        self._commit_batch()
     
     #################################################################
         
@@ -105,14 +310,30 @@ class UMLModel:
         
     def _get_class_list(self) -> Dict[str, Class]:
         """
-        Retrieves a deep copy of the current class list.
+        Retrieves a read-only snapshot of the current class list.
 
         Returns:
-            Dict[str, Class]: A deep copy of the dictionary containing all UML classes managed by the model.
+            Dict[str, Class]: A read-only dictionary of copies of all UML classes managed by the model.
 
-        This method provides access to the class list while ensuring the original data remains unmodified by returning a deep copy.
+        The snapshot is taken once per data version and reused until the model changes. Each class is copied
+        only when it changed since the previous snapshot, unchanged classes are shared with older snapshots,
+        so the returned classes must be treated as read-only.
         """
-        return copy.deepcopy(self.__class_list)
+        if self.__class_list_snapshot is None:
+            class_snapshot_table = self.__class_snapshot_table
+            for class_name, class_object in self.__class_list.items():
+                if class_name not in class_snapshot_table:
+                    class_snapshot_table[class_name] = copy.deepcopy(class_object)
+            self.__class_list_snapshot = UMLSnapshotDict((class_name, class_snapshot_table[class_name]) for class_name in self.__class_list)
+        return self.__class_list_snapshot
+    
+    def _is_detached(self) -> bool:
+        """
+        Returns:
+            bool: True if the data does not belong to the active file: it was loaded from an SQLite
+                database, possibly only in part, and not saved to the active file since.
+        """
+        return self.__is_detached
     
     def _get_storage_manager(self) -> Storage:
         """
@@ -138,14 +359,32 @@ class UMLModel:
     
     def _get_main_data(self) -> Dict:
         """
-        Retrieves a deep copy of the main data dictionary.
+        Retrieves a read-only snapshot of the main data dictionary.
 
         Returns:
-            Dict: A deep copy of the main data containing classes and relationships.
+            Dict: A read-only snapshot of the main data containing classes and relationships.
 
         The main data dictionary holds all the UML data in a structured format suitable for saving and loading.
+        Entries in main data are never modified in place, a change replaces the entry, so the snapshot shares
+        them with the model and only copies the two top-level lists once per data version, leaving out the
+        empty slots of deleted entries. Use copy.deepcopy on the snapshot to get a mutable copy.
         """
-        return copy.deepcopy(self.__main_data)
+        if self.__main_data_snapshot is None:
+            self.__main_data_snapshot = UMLSnapshotDict(
+                (key, UMLSnapshotList(freeze_data(entry) for entry in value if entry is not None) if isinstance(value, list) else freeze_data(value))
+                for key, value in self.__main_data.items())
+        return self.__main_data_snapshot
+    
+    def _get_data_version(self) -> int:
+        """
+        Retrieves the data version of the model.
+
+        Returns:
+            int: A counter that changes every time main data changes.
+
+        Readers can compare versions to tell whether a snapshot they hold is still current.
+        """
+        return self.__data_version
     
     def _set_main_data(self, new_main_data) -> Dict:
         """
@@ -156,7 +395,11 @@ class UMLModel:
 
         This method replaces the current main data with the provided data. It is used when loading new data into the model.
         """
-        self.__main_data = new_main_data
+        self.__main_data = {key: [freeze_data(entry) for entry in value] if isinstance(value, list) else value
+                            for key, value in new_main_data.items()}
+        self.__mark_dirty()
+        self.__rebuild_main_data_index()
+        self.__main_data_changed()
     
     def _get_user_view(self):
         """
@@ -293,7 +536,7 @@ class UMLModel:
         new_class = self.create_class(class_name)
         self.__class_list[class_name] = new_class
         # Update main data and notify observers
-        self._update_main_data_for_every_action()
+        self._update_class_in_main_data(class_name)
         self._notify_observers(event_type=InterfaceOptions.ADD_CLASS.value, data={"class_name": class_name}, is_loading=is_loading, is_undo_or_redo=is_undo_or_redo)
         return True
     
@@ -317,12 +560,73 @@ class UMLModel:
         # Remove the class from the class list
         self.__class_list.pop(class_name)
         # Clean up any relationships involving the class
-        self.__clean_up_relationship(class_name)
+        removed_relationships = self.__clean_up_relationship(class_name)
         # Update main data and notify observers
-        self._update_main_data_for_every_action()
+        self._remove_class_from_main_data(class_name)
+        self._remove_relationships_from_main_data([(each_relationship._get_source_class(), each_relationship._get_destination_class())
+                                                   for each_relationship in removed_relationships])
         self._notify_observers(event_type=InterfaceOptions.DELETE_CLASS.value, data={"class_name": class_name}, is_undo_or_redo=is_undo_or_redo)
         return True
         
+    # Get what deleting a class removes #
+    def _get_class_delta(self, class_name: str) -> Dict | None:
+        """
+        Collects a class with its members and the relationships it takes part in, which is everything
+        deleting the class removes. Only the class and its own relationships are visited.
+
+        Parameters:
+            class_name (str): The name of the class.
+
+        Returns:
+            Dict: {"class": the class in the saved JSON format, "relationships": the incident relationships in the saved JSON format}.
+            None: If the class does not exist.
+        """
+        if class_name not in self.__class_list:
+            return None
+        incident_relationships = list(self.__outgoing_relationships.get(class_name, {}).values())
+        incident_relationships.extend(relationship for relationship in self.__incoming_relationships.get(class_name, {}).values()
+                                      if relationship._get_source_class() != class_name)
+        return {
+            "class": self._class_json_format(class_name),
+            "relationships": [relationship._convert_to_json_relationship() for relationship in incident_relationships],
+        }
+    
+    # Restore a deleted class #
+    def _restore_class(self, class_delta: Dict, is_undo_or_redo: bool = True) -> bool:
+        """
+        Puts back a class and its relationships collected by _get_class_delta, building the class directly
+        from its data instead of replaying one add per member. Relationships whose other class is gone are skipped.
+
+        Parameters:
+            class_delta (Dict): The class and relationships returned by _get_class_delta.
+            is_undo_or_redo (bool): Flag indicating whether the operation is part of an undo or redo.
+
+        Returns:
+            bool: True if the class was restored, False if a class with the same name exists.
+        """
+        class_name = class_delta["class"]["name"]
+        if class_name in self.__class_list:
+            return False
+        self._current_number_of_method = self._current_number_of_method + self.__load_class_record(class_delta["class"])
+        if class_name not in self.__class_list:
+            return False
+        self._update_class_in_main_data(class_name)
+        self._notify_observers(event_type=InterfaceOptions.ADD_CLASS.value, data={"class_name": class_name}, is_undo_or_redo=is_undo_or_redo)
+        for each_dictionary in class_delta["relationships"]:
+            source_class_name = each_dictionary["source"]
+            destination_class_name = each_dictionary["destination"]
+            if source_class_name not in self.__class_list or destination_class_name not in self.__class_list:
+                continue
+            if self._relationship_exist(source_class_name, destination_class_name):
+                continue
+            new_relationship = self.create_relationship(source_class_name, destination_class_name, each_dictionary["type"])
+            self.__relationship_list.append(new_relationship)
+            self.__index_relationship(new_relationship)
+            self._update_relationship_in_main_data(new_relationship)
+            self._notify_observers(event_type=InterfaceOptions.ADD_REL.value, data={"source": source_class_name, "dest": destination_class_name,
+                                                                                    "type": each_dictionary["type"]}, is_undo_or_redo=is_undo_or_redo)
+        return True
+        
     # Rename class #
     def _rename_class(self, current_name: str, new_name: str, is_undo_or_redo: bool = False):
         """
@@ -344,11 +648,14 @@ class UMLModel:
         # Rename the class and update the class list
         class_object = self.__class_list[current_name]
         class_object._set_class_name(new_name)
-        self.__class_list[new_name] = self.__class_list.pop(current_name)
+        # Keep the renamed class in its place, like its slot in main data
+        self.__class_list._rename_key(current_name, new_name)
         # Update the class name in the relationships
-        self.__update_name_in_relationship(current_name, new_name)
+        renamed_relationships = self.__update_name_in_relationship(current_name, new_name)
         # Update main data and notify observers
-        self._update_main_data_for_every_action()
+        self._rename_class_in_main_data(current_name, new_name)
+        for old_key, each_relationship in renamed_relationships:
+            self._update_relationship_in_main_data(each_relationship, old_key=old_key)
         self._notify_observers(event_type=InterfaceOptions.RENAME_CLASS.value, data={"old_name": current_name, "new_name": new_name}, is_undo_or_redo=is_undo_or_redo)
         return True
         
@@ -373,12 +680,11 @@ class UMLModel:
         is_class_and_field_exist = self._validate_entities(class_name=class_name, field_name=field_name, class_should_exist=True, field_should_exist=False)
         if not is_class_and_field_exist:
             return False
-        # Retrieve the class and add the new field to its field list
-        field_list = self._get_data_from_chosen_class(class_name, is_field_list=True)
+        # Retrieve the class and add the new field to its field table
         new_field = self.create_field(field_type, field_name)
-        field_list.append(new_field)
+        self.__class_list[class_name]._add_field(new_field)
         # Update main data and notify observers
-        self._update_main_data_for_every_action()
+        self._update_class_in_main_data(class_name)
         self._notify_observers(event_type=InterfaceOptions.ADD_FIELD.value, data={"class_name": class_name, "type": field_type, 
                                                                                   "field_name": field_name}, is_loading=is_loading, is_undo_or_redo=is_undo_or_redo)
         return True
@@ -399,12 +705,11 @@ class UMLModel:
         is_class_and_field_exist = self._validate_entities(class_name=class_name, field_name=field_name, class_should_exist=True, field_should_exist=True)
         if not is_class_and_field_exist:
             return False
-        # Remove the field from the class's field list
-        field_list = self._get_data_from_chosen_class(class_name, is_field_list=True)
+        # Remove the field from the class's field table
         chosen_field = self._get_chosen_field_or_method(class_name, field_name, is_field=True)
-        field_list.remove(chosen_field)
+        self.__class_list[class_name]._remove_field(chosen_field)
         # Update main data and notify observers
-        self._update_main_data_for_every_action()
+        self._update_class_in_main_data(class_name)
         self._notify_observers(event_type=InterfaceOptions.DELETE_FIELD.value, data={"class_name": class_name, "field_name": field_name}, is_undo_or_redo=is_undo_or_redo)
         return True
         
@@ -427,10 +732,10 @@ class UMLModel:
             return False
         # Rename the field in the class
         chosen_field = self._get_chosen_field_or_method(class_name, old_field_name, is_field=True)
-        chosen_field._set_name(new_field_name)
+        self.__class_list[class_name]._rename_field(chosen_field, new_field_name)
         
         # Update main data and notify observers
-        self._update_main_data_for_every_action()
+        self._update_class_in_main_data(class_name)
         self._notify_observers(event_type=InterfaceOptions.RENAME_FIELD.value, data={"class_name": class_name, "old_field_name": old_field_name, 
                                                                                      "new_field_name": new_field_name}, is_undo_or_redo=is_undo_or_redo)
         return True
@@ -461,8 +766,7 @@ class UMLModel:
         if not is_class_and_method_exist:
             return False
 
-        # Retrieve the method list for the class and create the new method #
-        method_and_parameter_list = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
+        # Create the new method #
         new_method = self.create_method(method_type, method_name)
         method_and_pram_list_element = {new_method: []}  # Create a dictionary with method and an empty parameter list
 
@@ -472,11 +776,11 @@ class UMLModel:
             if not is_new_method_valid:
                 return False
             
-        # Add the new method and its empty parameter list to the method_and_parameter_list #
-        method_and_parameter_list.append(method_and_pram_list_element)
+        # Add the new method and its empty parameter list to the method table #
+        self.__class_list[class_name]._get_method_table()._append(new_method, method_and_pram_list_element[new_method])
         self._current_number_of_method = self._current_number_of_method + 1
         # Notify observers and update internal data #
-        self._update_main_data_for_every_action()
+        self._update_class_in_main_data(class_name)
         self._notify_observers(event_type=InterfaceOptions.ADD_METHOD.value,
                                data={"class_name": class_name, "type": method_type, "method_name": method_name}, is_loading=is_loading, is_undo_or_redo=is_undo_or_redo)
         return True
@@ -499,12 +803,10 @@ class UMLModel:
         if not is_method_num_valid:
             return None
         # Retrieve the method and parameter list from the chosen class
-        method_and_parameter_list = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
+        method_table = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
         selected_index = int(method_num) - 1  # Convert to zero-based index
-        if 0 <= selected_index < len(method_and_parameter_list):
-            chosen_pair = method_and_parameter_list[selected_index]
-            method = next(iter(chosen_pair))  # Extract the method object
-            return method
+        if 0 <= selected_index < len(method_table):
+            return method_table._get_method(selected_index)
         else:
             # Print error message if the method number is out of range
             self.__console.print("\n[bold red]Method number out of range! Please enter a valid number.[/bold red]")
@@ -529,16 +831,12 @@ class UMLModel:
         if not is_method_num_valid:
             return None
         # Retrieve the method and parameter list from the chosen class
-        method_and_parameter_list = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
+        method_table = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
         selected_index = int(method_num) - 1  # Convert to zero-based index
-        if 0 <= selected_index < len(method_and_parameter_list):
-            chosen_pair = method_and_parameter_list[selected_index]
-            # Extract the parameter list from the chosen method
-            param_list = next(iter(chosen_pair.values()))
-            # Search for the parameter with the specified name
-            for each_parameter in param_list:
-                if each_parameter._get_parameter_name() == parameter_name:
-                    return each_parameter
+        if 0 <= selected_index < len(method_table):
+            # Look the parameter up in the parameter table of the chosen method
+            method = method_table._get_method(selected_index)
+            return method_table._get_parameter(method, parameter_name)
         return None
 
     def _check_method_param_list(self, class_name: str, new_method_and_params: dict):
@@ -552,25 +850,28 @@ class UMLModel:
         Returns:
             bool: True if no method with the same signature exists, False otherwise.
         """
-        # Loop through each method in the existing method list #
-        method_and_parameter_list = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
-
-        for method_and_parameter in method_and_parameter_list:
-            # Loops through each method and gets the met
-            for method, param_list in method_and_parameter.items():
-                # Gets the new method from the parameter
-                new_method = next(iter(new_method_and_params))
-                # Compare method names #
-                if method._get_name() == new_method._get_name():
-                    # Retrieve parameter types for both methods (existing and new) #
-                    first_param_type_list = [param._get_type() for param in param_list]
-                    second_param_type_list = [param._get_type() for param in new_method_and_params[new_method]]
-
-                    # If parameter lists match, the new method is a duplicate #
-                    if first_param_type_list == second_param_type_list:
-                        self.__console.print(f"\n[bold red]New method [bold white]'{new_method._get_name()}'[/bold white] "
-                                             f"has the same parameter list signature as an existing method in class [bold white]'{class_name}'[/bold white]![bold red]")
-                        return False
+        # Gets the new method from the parameter
+        new_method, new_param_list = next(iter(new_method_and_params.items()))
+        return self._check_method_signature(class_name, new_method._get_name(), [param._get_type() for param in new_param_list])
+
+    def _check_method_signature(self, class_name: str, method_name: str, param_type_list: List[str]):
+        """
+        Checks if a method with the given name and parameter types already exists in the class.
+        The method table keeps every signature of the class hashed, so this is a single lookup.
+
+        Parameters:
+            class_name (str) : class which the method belongs to
+            method_name (str): The name of the method being checked.
+            param_type_list (List[str]): The parameter types of the method, in order.
+
+        Returns:
+            bool: True if no method with the same signature exists, False otherwise.
+        """
+        method_table = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
+        if method_table._has_signature((method_name, tuple(param_type_list))):
+            self.__console.print(f"\n[bold red]New method [bold white]'{method_name}'[/bold white] "
+                                 f"has the same parameter list signature as an existing method in class [bold white]'{class_name}'[/bold white]![bold red]")
+            return False
         return True
     
     # Check if the input for the method number is a number or not
@@ -618,20 +919,18 @@ class UMLModel:
             return False
         
         # Get method and parameter list from chosen class
-        method_and_parameter_list = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
+        method_table = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
         
         # Convert the input to an index #
         selected_index = int(method_num) - 1
 
-        if 0 <= selected_index < len(method_and_parameter_list):
-            # Get the pair of method, param_list from the index given #
-            chosen_pair = method_and_parameter_list[selected_index]
-            # Extract method and param_list (key and value) from the dictionary
-            method, param_list = next(iter(chosen_pair.items()))
+        if 0 <= selected_index < len(method_table):
+            # Get the method from the index given #
+            method = method_table._get_method(selected_index)
             # Remove method
-            method_and_parameter_list.remove(chosen_pair)
+            method_table._remove(method)
             # Update observers and main data
-            self._update_main_data_for_every_action()
+            self._update_class_in_main_data(class_name)
             self._notify_observers(event_type=InterfaceOptions.DELETE_METHOD.value,
                                    data={"class_name": class_name, "method_name": method._get_name()}, is_undo_or_redo=is_undo_or_redo)
             self._current_number_of_method = self._current_number_of_method - 1
@@ -669,16 +968,15 @@ class UMLModel:
             return False
         
         # Get the correct method and parameter list based on the class
-        method_and_parameter_list = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
+        method_table = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
 
         # Convert the input to an index and validate the selection #
         selected_index = int(method_num) - 1
 
-        if 0 <= selected_index < len(method_and_parameter_list):
-            # Get the pair of method, param_list from the index given #
-            chosen_pair = method_and_parameter_list[selected_index]
-            # Extract method and param_list (key and value) from the dictionary
-            method, param_list = next(iter(chosen_pair.items()))
+        if 0 <= selected_index < len(method_table):
+            # Get the method and its param_list from the index given #
+            method = method_table._get_method(selected_index)
+            param_list = method_table._get_parameter_list(method)
             # Get the method name that will be changed (so it can be given to the observer)
             old_method_name = method._get_name()
             # Create a copy of the parameter list and make an object that represents the method with the added parameter
@@ -689,8 +987,8 @@ class UMLModel:
             if not is_method_valid_with_param:
                 return False
             # Set the new method name and update observers #
-            method._set_name(new_name)
-            self._update_main_data_for_every_action()
+            method_table._rename(method, new_name)
+            self._update_class_in_main_data(class_name)
             self._notify_observers(event_type=InterfaceOptions.RENAME_METHOD.value,
                                    data={"class_name": class_name, "old_method_name": old_method_name, "new_method_name": new_name}, is_undo_or_redo=is_undo_or_redo)
             return True
@@ -727,7 +1025,7 @@ class UMLModel:
             return False
         
         # Get the method and parameter list depending on class
-        method_and_parameter_list = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
+        method_table = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
         
         
         if is_loading:
@@ -746,16 +1044,16 @@ class UMLModel:
         selected_index = int(method_num) - 1
 
         # Ensure the selected index is valid #
-        if 0 <= selected_index < len(method_and_parameter_list):
-            # Get the pair of method, param_list from the index given #
-            chosen_pair = method_and_parameter_list[selected_index]
+        if 0 <= selected_index < len(method_table):
+            # Get the method and its param_list from the index given #
+            method = method_table._get_method(selected_index)
 
             # Extract the selected method and its parameter list #
-            method, param_list = next(iter(chosen_pair.items()))
+            param_list = method_table._get_parameter_list(method)
 
             # Check if the parameter already exists in the method #
             is_param_exist = self._validate_entities(
-                class_name=class_name, method_and_param_list=chosen_pair, 
+                class_name=class_name, chosen_method=method, 
                 parameter_name=param_name, class_should_exist=True, method_should_exist=True, parameter_should_exist=False
             )
             if not is_param_exist:
@@ -773,10 +1071,10 @@ class UMLModel:
                 return False
 
             # If not a duplicate, add the new parameter to the method's parameter list
-            param_list.append(new_param)
+            method_table._add_parameter(method, new_param)
 
             # Update main data and notify observers #
-            self._update_main_data_for_every_action()
+            self._update_class_in_main_data(class_name)
             if not is_loading:
                 self._notify_observers(event_type=InterfaceOptions.ADD_PARAM.value,
                                    data={"class_name": class_name, "method_name": method._get_name(), "param_name": param_name, "type": param_type}, is_undo_or_redo=is_undo_or_redo)
@@ -807,7 +1105,7 @@ class UMLModel:
             return False
         
         # Get the method and parameter list based on the class
-        method_and_parameter_list = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
+        method_table = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
 
         # Check if the method_num input is numeric or not
         is_method_num_a_number = self._check_method_num(method_num)
@@ -818,15 +1116,15 @@ class UMLModel:
         selected_index = int(method_num) - 1
 
         # Ensure the selected index is valid #
-        if 0 <= selected_index < len(method_and_parameter_list):
+        if 0 <= selected_index < len(method_table):
             # Get correct pair based on index
-            chosen_pair = method_and_parameter_list[selected_index]
+            method = method_table._get_method(selected_index)
 
             # Extract the selected method and its parameter list #
-            method, param_list = next(iter(chosen_pair.items()))
+            param_list = method_table._get_parameter_list(method)
             # Check if the parameter already exists in the method #
             is_param_exist = self._validate_entities(
-                class_name=class_name, method_and_param_list=chosen_pair, 
+                class_name=class_name, chosen_method=method, 
                 parameter_name=param_name, class_should_exist=True, method_should_exist=True, parameter_should_exist=True
             )
             if not is_param_exist:
@@ -844,10 +1142,10 @@ class UMLModel:
                 return False
 
             # If not a duplicate, delete the parameter from the method's parameter list
-            param_list.remove(chosen_parameter)
+            method_table._remove_parameter(method, chosen_parameter)
 
             # Update main data and notify observers #
-            self._update_main_data_for_every_action()
+            self._update_class_in_main_data(class_name)
             self._notify_observers(event_type=InterfaceOptions.DELETE_PARAM.value,
                                    data={"class_name": class_name, "method_name": method._get_name(), 
                                          "param_type": chosen_parameter._get_type() , "param_name": param_name}, is_undo_or_redo=is_undo_or_redo)
@@ -877,7 +1175,7 @@ class UMLModel:
         if not is_class_and_method_and_parameter_exist:
             return False
         
-        method_and_parameter_list = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
+        method_table = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
 
         # Check if the method number is numeric
         is_method_num_a_number = self._check_method_num(method_num)
@@ -888,14 +1186,14 @@ class UMLModel:
         selected_index = int(method_num) - 1
 
         # Ensure the selected index is valid #
-        if 0 <= selected_index < len(method_and_parameter_list):
-            chosen_pair = method_and_parameter_list[selected_index]
+        if 0 <= selected_index < len(method_table):
+            method = method_table._get_method(selected_index)
 
             # Extract the selected method and its parameter list #
-            method, param_list = next(iter(chosen_pair.items()))
+            param_list = method_table._get_parameter_list(method)
             # Check if the parameter already exists in the method #
             is_param_exist = self._validate_entities(
-                class_name=class_name, method_and_param_list=chosen_pair, 
+                class_name=class_name, chosen_method=method, 
                 parameter_name=param_name, class_should_exist=True, method_should_exist=True, parameter_should_exist=True
             )
             if not is_param_exist:
@@ -905,27 +1203,20 @@ class UMLModel:
             chosen_parameter = self.__get_chosen_parameter(class_name, selected_index, param_name)
             old_param_type = chosen_parameter._get_type()
 
-            new_param_list = []
-            for param in param_list:
-                if param._get_parameter_name() == param_name:
-                    new_param = self.create_parameter(param_name, new_type)
-                    new_param_list.append(new_param)
-                else:
-                    new_param_list.append(param)
-            method_with_new_param = {method: new_param_list}
+            new_param_type_list = [new_type if param is chosen_parameter else param._get_type() for param in param_list]
 
-            # Check to see if the method without the parameter is a duplicate
-            is_method_valid_with_param = self._check_method_param_list(class_name, method_with_new_param)
-            if not is_method_valid_with_param:
-                return False
+            # Check to see if the method with the new parameter type is a duplicate
+            # (keeping the same type leaves the signature as it is)
+            if new_type != old_param_type:
+                is_method_valid_with_param = self._check_method_signature(class_name, method._get_name(), new_param_type_list)
+                if not is_method_valid_with_param:
+                    return False
             
             # If not a duplicate, then change type
-            for param in param_list:
-                if param._get_parameter_name() == param_name:
-                    param._set_type(new_type)
+            method_table._set_parameter_type(method, chosen_parameter, new_type)
 
             # Update main data and notify observers #
-            self._update_main_data_for_every_action()
+            self._update_class_in_main_data(class_name)
             self._notify_observers(event_type=InterfaceOptions.EDIT_PARAM_TYPE.value,
                                    data={"class_name": class_name, "method_name": method._get_name(), "old_param_type": old_param_type , 
                                          "param_name": param_name, "new_param_type": new_type}, is_undo_or_redo=is_undo_or_redo)
@@ -956,7 +1247,7 @@ class UMLModel:
         if not is_class_and_method_and_parameter_exist:
             return False
             
-        method_and_parameter_list = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
+        method_table = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
 
         # Check if the method number is numeric
         is_method_num_a_number = self._check_method_num(method_num)
@@ -967,21 +1258,19 @@ class UMLModel:
         selected_index = int(method_num) - 1
 
         # Ensure the selected index is valid #
-        if 0 <= selected_index < len(method_and_parameter_list):
-            chosen_pair = method_and_parameter_list[selected_index]
-            
-            # Extract the selected method and its parameter list #
-            method, param_list = next(iter(chosen_pair.items()))
+        if 0 <= selected_index < len(method_table):
+            # Extract the selected method #
+            method = method_table._get_method(selected_index)
             method_name = method._get_name()
             
             # Check if the current parameter exists in the method #
             is_param_exist = self._validate_entities(
-                class_name=class_name, method_and_param_list=chosen_pair, 
+                class_name=class_name, chosen_method=method, 
                 parameter_name=current_param_name, class_should_exist=True, method_should_exist=True, parameter_should_exist=True
             )
             # Check if the new parameter name already exists
             is_new_param_exist = self._validate_entities(
-                class_name=class_name, method_and_param_list=chosen_pair, 
+                class_name=class_name, chosen_method=method, 
                 parameter_name=new_param_name, class_should_exist=True, method_should_exist=True, parameter_should_exist=False
             )
             if not is_param_exist or not is_new_param_exist:
@@ -989,9 +1278,9 @@ class UMLModel:
             
             chosen_parameter = self.__get_chosen_parameter(class_name, selected_index, current_param_name)
             # Rename the parameter
-            chosen_parameter._set_parameter_name(new_param_name)
+            method_table._rename_parameter(method, chosen_parameter, new_param_name)
             # Update main data and notify observers
-            self._update_main_data_for_every_action()
+            self._update_class_in_main_data(class_name)
             self._notify_observers(event_type=InterfaceOptions.RENAME_PARAM.value, data={"class_name": class_name, "method_name": method_name, 
                                                                                          "old_param_name": current_param_name, "new_param_name": new_param_name}, is_undo_or_redo=is_undo_or_redo)
             return True
@@ -1016,11 +1305,11 @@ class UMLModel:
             return False
         
         # Get the method and parameter list
-        method_and_parameter_list = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
+        method_table = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
     
         selected_index = int(method_num) - 1
 
-        if 0 <= selected_index < len(method_and_parameter_list):
+        if 0 <= selected_index < len(method_table):
             if len(new_param_name_list) == 0:
                 return True
             # Prepare new parameter list
@@ -1039,19 +1328,15 @@ class UMLModel:
                 new_param = self.create_parameter(param_type, param_name)
                 new_params_obj_list.append(new_param)
                 
-            chosen_pair = method_and_parameter_list[selected_index]
-            # Extract the selected method and its parameter list #
-            method, params_list = next(iter(chosen_pair.items()))
+            # Extract the selected method #
+            method = method_table._get_method(selected_index)
             # Check to see if the method with the new parameter is a duplicate
             is_method_valid_with_param = self._check_method_param_list(class_name, {method: new_params_obj_list})
             if not is_method_valid_with_param:
                 return False
-            params_list.clear()
-        
-            for param in new_params_obj_list:
-                params_list.append(param)
+            method_table._replace_parameter_list(method, new_params_obj_list)
             
-            self._update_main_data_for_every_action()
+            self._update_class_in_main_data(class_name)
             self._notify_observers(
                 event_type=InterfaceOptions.REPLACE_PARAM.value,
                 data={"class_name": class_name, "method_name": method._get_name(), "new_list": new_params_obj_list}, is_undo_or_redo=is_undo_or_redo
@@ -1077,14 +1362,14 @@ class UMLModel:
             return False
         
         # Get the method and parameter list
-        method_and_parameter_list = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
+        method_table = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
     
         selected_index = int(method_num) - 1
 
-        if 0 <= selected_index < len(method_and_parameter_list):
-            chosen_pair = method_and_parameter_list[selected_index]
+        if 0 <= selected_index < len(method_table):
+            method = method_table._get_method(selected_index)
             # Extract the selected method and its parameter list #
-            method, params_list = next(iter(chosen_pair.items()))
+            params_list = method_table._get_parameter_list(method)
             param_string_list = []
             for param in params_list:
                 param_format = param._get_type() + " " + param._get_parameter_name()
@@ -1100,10 +1385,10 @@ class UMLModel:
         for param_name in new_param_name_list:
             new_param = self.create_parameter(param_name)
             new_param_list.append(new_param)
-        method_and_parameter_list = self._get_method_and_parameter_list_of_chosen_class(class_name)
-        method_and_parameter_list[method_name] = new_param_list
+        chosen_method = self._get_chosen_field_or_method(class_name, method_name, is_field=False)
+        self.__class_list[class_name]._get_method_table()._replace_parameter_list(chosen_method, new_param_list)
         # Update main data and notify observers
-        self._update_main_data_for_every_action()
+        self._update_class_in_main_data(class_name)
         self._notify_observers(event_type=InterfaceOptions.REPLACE_PARAM.value, data={"class_name": class_name, "method_name": method_name, "new_list": new_param_list})
         return True
         
@@ -1156,17 +1441,17 @@ class UMLModel:
         # Create a new relationship and add it to the relationship list
         new_relationship = self.create_relationship(source_class_name, destination_class_name, rel_type)
         self.__relationship_list.append(new_relationship)
+        self.__index_relationship(new_relationship)
         # Update main data and notify observers
-        self._update_main_data_for_every_action()
+        self._update_relationship_in_main_data(new_relationship)
         self._notify_observers(event_type=InterfaceOptions.ADD_REL.value, data={"source": source_class_name, "dest": destination_class_name, 
                                                                                 "type": rel_type}, is_loading=is_loading, is_undo_or_redo=is_undo_or_redo)
         return True
     
     def _get_rel_type(self, source_class_name: str, destination_class_name: str):
-        for relationship in self.__relationship_list:
-            if (relationship._get_source_class() == source_class_name and
-                relationship._get_destination_class() == destination_class_name):
-                return relationship._get_type()
+        relationship = self.__relationship_by_pair.get((source_class_name, destination_class_name))
+        if relationship is not None:
+            return relationship._get_type()
         return None
         
     # Delete relationship #
@@ -1195,8 +1480,9 @@ class UMLModel:
         # Delete the relationship
         current_relationship = self._get_chosen_relationship(source_class_name, destination_class_name)
         self.__relationship_list.remove(current_relationship)
+        self.__unindex_relationship(source_class_name, destination_class_name)
         # Update main data and notify observers
-        self._update_main_data_for_every_action()
+        self._remove_relationship_from_main_data(source_class_name, destination_class_name)
         self._notify_observers(event_type=InterfaceOptions.DELETE_REL.value, data={"source": source_class_name, "dest": destination_class_name}, is_undo_or_redo=is_undo_or_redo)
         return True
         
@@ -1232,7 +1518,7 @@ class UMLModel:
             return False
         current_relationship._set_type(new_type)
         # Update main data and notify observers
-        self._update_main_data_for_every_action()
+        self._update_relationship_in_main_data(current_relationship)
         self._notify_observers(event_type=InterfaceOptions.EDIT_REL_TYPE.value, data={"source": source_class_name, "dest": destination_class_name, "new_type": new_type}, is_undo_or_redo=is_undo_or_redo)
         return True
          
@@ -1310,14 +1596,22 @@ class UMLModel:
 
         Parameters:
             class_name (str): The name of the class to clean relationships for.
-        """
-        # Create a new list that excludes relationships with dest or source equal to class_name
-        relationship_list = self.__relationship_list
-        relationship_list[:] = [
-            relationship
-            for relationship in relationship_list
-            if relationship._get_source_class() != class_name and relationship._get_destination_class() != class_name
-        ]
+
+        Returns:
+            List[Relationship]: The relationships that were removed.
+        """
+        # Find the incident relationships through the adjacency maps instead of scanning every relationship
+        removed_relationships: List[Relationship] = list(self.__outgoing_relationships.get(class_name, {}).values())
+        removed_relationships.extend(relationship for relationship in self.__incoming_relationships.get(class_name, {}).values()
+                                     if relationship._get_source_class() != class_name)
+        for relationship in removed_relationships:
+            self.__unindex_relationship(relationship._get_source_class(), relationship._get_destination_class())
+        if removed_relationships:
+            # Keep the remaining relationships in their original order
+            removed_id_set = {id(relationship) for relationship in removed_relationships}
+            relationship_list = self.__relationship_list
+            relationship_list[:] = [relationship for relationship in relationship_list if id(relationship) not in removed_id_set]
+        return removed_relationships
     
     # Update source/destination class name when we rename a class name #
     def __update_name_in_relationship(self, current_name: str, new_name: str):
@@ -1327,28 +1621,74 @@ class UMLModel:
         Parameters:
             current_name (str): The current class name.
             new_name (str): The new class name to update in relationships.
-        """
-        # Get relationship list
-        relationship_list = self.__relationship_list
-        # Loop through the relationship list
-        for each_relationship in relationship_list:
+
+        Returns:
+            List[tuple]: (old (source, destination) pair, relationship) for every relationship that was updated.
+        """
+        # Only the relationships incident to the renamed class are visited
+        incident_relationships = list(self.__outgoing_relationships.get(current_name, {}).values())
+        incident_relationships.extend(relationship for relationship in self.__incoming_relationships.get(current_name, {}).values()
+                                      if relationship._get_source_class() != current_name)
+        renamed_relationships = []
+        for each_relationship in incident_relationships:
             source_name = each_relationship._get_source_class()
             destination_name = each_relationship._get_destination_class()
+            self.__unindex_relationship(source_name, destination_name)
             if source_name == current_name:
                 each_relationship._set_source_class(new_name)
             if destination_name == current_name:
                 each_relationship._set_destination_class(new_name)
+            self.__index_relationship(each_relationship)
+            renamed_relationships.append(((source_name, destination_name), each_relationship))
+        return renamed_relationships
+
+    # Add a relationship to the relationship index #
+    def __index_relationship(self, relationship: Relationship):
+        """
+        Registers a relationship in the pair-keyed index and in the forward and reverse adjacency maps.
+
+        Parameters:
+            relationship (Relationship): The relationship to register.
+        """
+        source_name = relationship._get_source_class()
+        destination_name = relationship._get_destination_class()
+        self.__relationship_by_pair[source_name, destination_name] = relationship
+        self.__outgoing_relationships.setdefault(source_name, {})[destination_name] = relationship
+        self.__incoming_relationships.setdefault(destination_name, {})[source_name] = relationship
+
+    # Remove a relationship from the relationship index #
+    def __unindex_relationship(self, source_class_name: str, destination_class_name: str):
+        """
+        Removes a relationship from the pair-keyed index and from the forward and reverse adjacency maps.
+
+        Parameters:
+            source_class_name (str): The source class name.
+            destination_class_name (str): The destination class name.
+        """
+        self.__relationship_by_pair.pop((source_class_name, destination_class_name), None)
+        outgoing = self.__outgoing_relationships.get(source_class_name)
+        if outgoing is not None:
+            outgoing.pop(destination_class_name, None)
+            if not outgoing:
+                del self.__outgoing_relationships[source_class_name]
+        incoming = self.__incoming_relationships.get(destination_class_name)
+        if incoming is not None:
+            incoming.pop(source_class_name, None)
+            if not incoming:
+                del self.__incoming_relationships[destination_class_name]
                 
-    # Get method and parameter list of a chosen class #
-    def _get_data_from_chosen_class(self, class_name: str, is_field_list: bool=None, is_method_and_param_list: bool=None) -> Dict[Method, List[Parameter]] | None:
+    # Get field list or method table of a chosen class #
+    def _get_data_from_chosen_class(self, class_name: str, is_field_list: bool=None, is_method_and_param_list: bool=None) -> List[Field] | MethodTable | None:
         """
-        Retrieves the method and parameter list of a specified class.
+        Retrieves the field list or the method table of a specified class.
 
         Parameters:
-            class_name (str): The name of the class to retrieve the method and parameter list for.
+            class_name (str): The name of the class to retrieve the data for.
+            is_field_list (bool, optional): Return the field list.
+            is_method_and_param_list (bool, optional): Return the method table (methods and their parameters).
 
         Returns:
-            Dict[str, List[Parameter]] | None: The method and parameter list, or None if the class does not exist.
+            List[Field] | MethodTable | None: The requested data, or None if the class does not exist.
         """
         is_class_name_exist = self.__validate_class_existence(class_name, should_exist=True)
         if not is_class_name_exist:
@@ -1358,7 +1698,7 @@ class UMLModel:
         # elif is_method_list:
         #     return self.__class_list[class_name]._get_class_method_list()
         elif is_method_and_param_list:
-            return self.__class_list[class_name]._get_method_and_parameters_list()
+            return self.__class_list[class_name]._get_method_table()
     
     ## FIELD AND METHOD RELATED ##
     
@@ -1379,21 +1719,11 @@ class UMLModel:
         is_class_exist = self.__validate_class_existence(class_name, should_exist=True)
         if not is_class_exist:
             return
-        # Select the correct list based on whether it's a field or method
+        # Look the name up in the member tables of the class
+        class_object = self.__class_list[class_name]
         if is_field:
-            field_list = self._get_data_from_chosen_class(class_name, is_field_list=True)
-            for field in field_list:
-                if field._get_name() == input_name:
-                    return True
-        else:
-            method_and_parameter_list = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
-            for each_element in method_and_parameter_list:
-                for method in each_element:
-                    if method._get_name() == input_name:
-                        return True
-        # Loop through the list to find the field or method
-        
-        return False
+            return class_object._get_field(input_name) is not None
+        return len(class_object._get_method_table()._get_overloads(input_name)) > 0
     
     # Validate field existence based on whether it should exist or not #
     def __validate_field_existence(self, class_name: str, field_name: str, should_exist: bool) -> bool:
@@ -1487,52 +1817,50 @@ class UMLModel:
         Returns:
             Field | Method | None: The field or method object, or None if not found.
         """
-        # Select the correct list based on whether it's a field or method
+        is_class_exist = self.__validate_class_existence(class_name, should_exist=True)
+        if not is_class_exist:
+            return None
+        # Look the name up in the member tables of the class
+        class_object = self.__class_list[class_name]
         if is_field:
-            general_list = self._get_data_from_chosen_class(class_name, is_field_list=True)
-        else:
-            general_list = self._get_data_from_chosen_class(class_name, is_method_list=True)
-        for element in general_list:
-            if element._get_name() == input_name:
-                return element
+            return class_object._get_field(input_name)
+        overload_list = class_object._get_method_table()._get_overloads(input_name)
+        if overload_list:
+            return overload_list[0]
         return None
     
     ## PARAMETER RELATED ##
     
     # Check if parameter exists #
-    def __parameter_exist(self, class_name: str, method_and_param_list: Dict, parameter_name: str) -> bool:
+    def __parameter_exist(self, class_name: str, chosen_method: Method, parameter_name: str) -> bool:
         """
         Checks if a parameter exists for a specified method in a class.
 
         Parameters:
             class_name (str): The name of the class containing the method.
-            method_name (str): The name of the method.
+            chosen_method (Method): The method whose parameters are checked.
             parameter_name (str): The name of the parameter to check.
 
         Returns:
             bool: True if the parameter exists, False otherwise.
         """
-        method, param_list = next(iter(method_and_param_list.items()))
-        for param in param_list:
-            if param._get_parameter_name() == parameter_name:
-                return True
-        return False
+        return self.__class_list[class_name]._get_method_table()._get_parameter(chosen_method, parameter_name) is not None
     
     # Validate parameter existence #
-    def __validate_parameter_existence(self, class_name: str, method_and_param_list: Dict, parameter_name: str, should_exist: bool) -> bool:
+    def __validate_parameter_existence(self, class_name: str, chosen_method: Method, parameter_name: str, should_exist: bool) -> bool:
         """
         Validates the existence of a parameter in a method based on whether it should or should not exist.
 
         Parameters:
             class_name (str): The name of the class containing the method.
-            method_name (str): The name of the method containing the parameter.
+            chosen_method (Method): The method containing the parameter.
             parameter_name (str): The name of the parameter to validate.
             should_exist (bool): True if the parameter should exist, False if it should not.
 
         Returns:
             bool: True if validation passes, False otherwise.
         """
-        is_parameter_exist = self.__parameter_exist(class_name, method_and_param_list, parameter_name)
+        is_parameter_exist = self.__parameter_exist(class_name, chosen_method, parameter_name)
         if should_exist and not is_parameter_exist:
             self.__console.print(f"\n[bold red]Parameter [bold white]'{parameter_name}'[/bold white] does not exist![/bold red]")
             return False
@@ -1554,15 +1882,10 @@ class UMLModel:
         Returns:
             Parameter: The parameter object, or None if not found.
         """
-        method_and_parameter_list = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
-        chosen_pair = method_and_parameter_list[method_index]
-        # Extract the selected method and its parameter list #
-        method, param_list = next(iter(chosen_pair.items()))
-
-        for each_parameter in param_list:
-            if each_parameter._get_parameter_name() == parameter_name:
-                return each_parameter
-        return None
+        method_table = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
+        # Look the parameter up in the parameter table of the selected method #
+        method = method_table._get_method(method_index)
+        return method_table._get_parameter(method, parameter_name)
     
     ## RELATIONSHIP RELATED ##
     
@@ -1611,11 +1934,7 @@ class UMLModel:
         Returns:
             bool: True if the relationship exists, False otherwise.
         """
-        relationship_list = self.__relationship_list
-        for each_relationship in relationship_list:
-            if each_relationship._get_source_class() == source_class_name and each_relationship._get_destination_class() == destination_class_name:
-                return True
-        return False
+        return (source_class_name, destination_class_name) in self.__relationship_by_pair
     
     # Get the chosen relationship #
     def _get_chosen_relationship(self, source_class_name: str, destination_class_name: str) -> Relationship:
@@ -1629,11 +1948,7 @@ class UMLModel:
         Returns:
             Relationship: The relationship object, or None if not found.
         """
-        relationship_list = self.__relationship_list
-        for each_relationship in relationship_list:
-            if each_relationship._get_source_class() == source_class_name and each_relationship._get_destination_class() == destination_class_name:
-                return each_relationship
-        return None
+        return self.__relationship_by_pair.get((source_class_name, destination_class_name))
     
     # Get the relationship type between two classes #
     def _get_chosen_relationship_type(self, source_class_name: str, destination_class_name: str) -> str | None:
@@ -1691,24 +2006,15 @@ class UMLModel:
         # Method format list to store methods in JSON format
         method_list_format: List[Dict] = []
         # Get method and parameter list for the specified class
-        method_and_parameter_list = class_object._get_method_and_parameters_list()
+        method_table = class_object._get_method_table()
         
-        for each_element in method_and_parameter_list:
-            for each_method in each_element:
-                # Convert method to JSON format
-                method_json_format = each_method._convert_to_json_method()
-                # Get the parameters of the current method
-                parameter_list = each_element[each_method]
-                parameter_json_list = []
-                for parameter in parameter_list:
-                    parameter_json_list.append(parameter._convert_to_json_parameter())
-                method_json_format["params"] = parameter_json_list
-                # Convert each parameter to JSON format
-                parameter_format_list: List[Dict] = []
-                for each_parameter in parameter_list:
-                    parameter_format_list.append(each_parameter._convert_to_json_parameter())
-                # Add method format to the method list format
-                method_list_format.append(method_json_format)
+        for each_method, parameter_list in method_table:
+            # Convert method to JSON format
+            method_json_format = each_method._convert_to_json_method()
+            # Convert each parameter of the current method to JSON format
+            method_json_format["params"] = [parameter._convert_to_json_parameter() for parameter in parameter_list]
+            # Add method format to the method list format
+            method_list_format.append(method_json_format)
                         
         return method_list_format
     
@@ -1781,17 +2087,17 @@ class UMLModel:
         if user_input == "quit":
             self.__console.print("\n[bold green]Canceled saving![/bold green]")
             return
-        # Class and relationship data lists for storing in main data
-        class_data_list = []
-        relationship_data_list = []
-        # Update main data with class and relationship information
-        main_data = self.__update_main_data_from_loaded_file(user_input, class_data_list, relationship_data_list)
+        # Add the file name to the saved list if it is a new one
+        self.__storage_manager._add_name_to_saved_file(user_input)
         current_active_file = self._get_active_file()
         if current_active_file == "No active file!":
             self._set_file_status(user_input, "on")
-        self.__storage_manager._update_saved_list(saved_list)
-        # Save data to JSON file
-        self.__storage_manager._save_data_to_json(user_input, main_data)
+        self.__storage_manager._update_saved_list()
+        # Stream class and relationship data to the JSON file, unless it already holds them
+        self.__save_if_changed(self.__storage_manager._get_json_path(user_input),
+                               lambda: self.__storage_manager._save_data_to_json(user_input, self._iter_main_data()))
+        if user_input == self._get_active_file():
+            self.__is_detached = False
         self.__console.print(f"\n[bold green]Successfully saved data to [bold white]'{user_input}.json'![/bold white][/bold green]")
 
     # Save for GUI #
@@ -1803,29 +2109,46 @@ class UMLModel:
             file_name (str): The name of the file to save.
             file_path (str): The file path for saving the data.
         """
-        # Update position
-        for class_name_gui, class_box in class_name_list_from_gui.items():
-            if class_name_gui in self.__class_list:
-                self.__class_list[class_name_gui]._set_position(class_box.box_position["x"], class_box.box_position["y"])
-                
-        # Class and relationship data lists for storing in main data
-        class_data_list = []
-        relationship_data_list = []
-        # Update main data with class and relationship information
-        main_data = self.__update_main_data_from_loaded_file(file_name, class_data_list, relationship_data_list, file_path=full_path)
+        self._update_positions(class_name_list_from_gui)
+        # Add the file name and path to the saved lists if they are new
+        self.__storage_manager._add_name_to_saved_file(file_name)
+        self.__storage_manager._add_name_to_saved_file_gui(full_path)
         current_active_file = self._get_active_file()
         if current_active_file == "No active file!":
             self._set_file_status(file_name, "on")
         current_active_file_gui = self._get_active_file_gui()
         if current_active_file_gui == "No active file!":
             self._set_file_status_gui(full_path, "on")
-        saved_list = self.__storage_manager._get_saved_list()
-        self.__storage_manager._update_saved_list(saved_list)
-        saved_list_gui = self.__storage_manager._get_saved_list_gui()
-        self.__storage_manager._update_saved_list_gui(saved_list_gui)
-        # Save data to JSON via the GUI
-        self.__storage_manager._save_data_to_json(file_name, main_data)
-        self.__storage_manager._save_data_to_json_gui(full_path, main_data)
+        self.__storage_manager._update_saved_list()
+        self.__storage_manager._update_saved_list_gui()
+        # Stream class and relationship data to JSON via the GUI, SQLite databases only get what changed.
+        # Files that already hold the data are not written again, nor is the same file written twice
+        json_path = self.__storage_manager._get_json_path(file_name)
+        self.__save_if_changed(json_path, lambda: self.__storage_manager._save_data_to_json(file_name, self._iter_main_data()))
+        # The active file now holds the data, unless only the changes of a subset went to its database
+        if full_path == self._get_active_file_gui() and not (self.__is_sqlite_subset and full_path == self.__sqlite_path):
+            self.__is_detached = False
+        if os.path.abspath(full_path) == os.path.abspath(json_path):
+            return
+        if self.__storage_manager._is_sqlite_path(full_path):
+            self._save_sqlite(full_path)
+        else:
+            self.__save_if_changed(full_path, lambda: self.__storage_manager._save_data_to_json_gui(full_path, self._iter_main_data()))
+
+    # Update class positions from the GUI #
+    def _update_positions(self, class_name_list_from_gui):
+        """
+        Copies the positions of the class boxes into the classes, only the classes that moved are refreshed in main data.
+
+        Parameters:
+            class_name_list_from_gui (Dict): Class name -> class box on the canvas.
+        """
+        for class_name_gui, class_box in class_name_list_from_gui.items():
+            if class_name_gui in self.__class_list:
+                class_object = self.__class_list[class_name_gui]
+                if class_object._get_position() != class_box.box_position:
+                    class_object._set_position(class_box.box_position["x"], class_box.box_position["y"])
+                    self._update_class_in_main_data(class_name_gui)
 
     # Load data #
     def _load(self):
@@ -1853,155 +2176,309 @@ class UMLModel:
         if not is_loading:
             self.__console.print(f"\n[bold red]File [bold white]'{user_input}.json'[/bold white] does not exist[/bold red]")
             return
-        # Load data from the file and update program state
-        main_data = self.__main_data = self.__storage_manager._load_data_from_json(user_input)
-        self.__update_data_members(main_data)
+        # Reloading the active file while nothing changed on either side is a no-op
+        file_path = self.__storage_manager._get_json_path(user_input)
+        if user_input == self._get_active_file() and self.__is_synced(file_path):
+            self.__console.print(f"\n[bold green]Data from [bold white]'{user_input}.json'[/bold white] is already loaded![/bold green]")
+            return
+        # Read the file one record at a time and build the program state as it is read
+        with self.__console.status(f"[bold yellow]Loading [bold white]'{user_input}.json'[/bold white]...[/bold yellow]") as status:
+            def show_progress(bytes_read: int, total_bytes: int, class_count: int):
+                status.update(f"[bold yellow]Loading [bold white]'{user_input}.json'[/bold white]: "
+                              f"{bytes_read / 1024 / 1024:.1f} of {total_bytes / 1024 / 1024:.1f} MB, {class_count} classes read[/bold yellow]")
+            record_iter = self.__storage_manager._load_records_from_json(user_input, progress_callback=show_progress)
+            if record_iter is None:
+                return
+            is_loaded = self.__update_data_members_from_records(record_iter)
+        if not is_loaded:
+            self.__console.print(f"\n[bold red]Error decoding JSON from [bold white]'{user_input}.json'[/bold white]![/bold red]")
+            return
+        self.__mark_synced(file_path)
         self.__check_file_and_set_status(user_input)
         self.__console.print(f"\n[bold green]Successfully loaded data from [bold white]'{user_input}.json'[/bold white]![/bold green]")
         
-    def _load_gui(self, file_name: str, file_path: str, graphical_view: GUIView):
+    def _load_gui(self, file_name: str, file_path: str, graphical_view: GUIView, progress_callback: Callable[[int, int, int], None] = None):
         """
         Loads UML data from a saved JSON file, prompting the user for a file name or displaying a list of saved files.
         The data is loaded and the program's state is updated.
+
+        Parameters:
+            progress_callback (Callable, optional): Called while reading with (bytes read, total bytes, classes read).
         """
-        # Load data from the file and update program state
-        main_data = self.__main_data = self.__storage_manager._load_data_from_json_gui(file_path)
+        # Reloading the active file while nothing changed on either side is a no-op
+        if file_path == self._get_active_file_gui() and self.__is_synced(file_path):
+            return
+        # Read the file one record at a time and build the program state as it is read
+        record_iter = self.__storage_manager._load_records_from_json_gui(file_path, progress_callback=progress_callback)
+        if record_iter is None:
+            return
         is_file_exist_gui = self._check_saved_file_exist_gui(file_name)
         if not is_file_exist_gui:
             self.__storage_manager._add_name_to_saved_file_gui(file_path)
         is_file_exist = self._check_saved_file_exist(file_name)
         if not is_file_exist:
             self.__storage_manager._add_name_to_saved_file(file_name)
-        self.__storage_manager._save_data_to_json(file_name, main_data)
-        self.__update_data_members_gui(main_data, graphical_view)
+        is_loaded = self.__update_data_members_gui_from_records(record_iter, graphical_view)
+        if not is_loaded:
+            print(f"\nError decoding JSON from {file_path}.")
+            return
+        # The model now matches the database, the next save to it only writes what changes from here
+        if self.__storage_manager._is_sqlite_path(file_path):
+            self.__mark_clean(file_path)
+        else:
+            self.__mark_clean()
+        self.__mark_synced(file_path)
+        # Keep a copy of the file with the saved files
+        if self.__storage_manager._copy_data_to_json(file_path, file_name):
+            self.__mark_synced(self.__storage_manager._get_json_path(file_name))
         self.__check_file_and_set_status(file_name)
         self._check_file_and_set_status_gui(file_path)
 
-    # Update main data to store data to JSON file #
-    def __update_main_data_from_loaded_file(self, user_input: str, class_data_list: List, relationship_data_list: List, file_path=None) -> Dict:
+    # Save to an SQLite database #
+    def _save_sqlite(self, file_path: str) -> bool:
         """
-        Updates the main data to be saved into a JSON file by compiling class data and relationship data.
+        Saves the UML data to an SQLite database in one transaction. When the model was last saved to or
+        loaded from the same database, only the rows of the classes and relationships that changed since
+        are rewritten or deleted, otherwise the whole diagram is written.
 
         Parameters:
-            user_input (str): The name of the file to save or load.
-            class_data_list (List): A list to store formatted class data.
-            relationship_data_list (List): A list to store formatted relationship data.
+            file_path (str): The path of the database.
 
         Returns:
-            Dict: The updated main data dictionary containing class and relationship details.
+            bool: True if the data was saved, False otherwise.
         """
-        # Format relationships for JSON storage
-        relationship_data_list = self._get_relationship_format_list()
-        main_data = self.__main_data
-        # Add the file name to the saved list if it is a new one
-        self.__storage_manager._add_name_to_saved_file(user_input)
-        if file_path is not None:
-            self.__storage_manager._add_name_to_saved_file_gui(file_path)
-        # Format classes for JSON storage
-        for class_name in self.__class_list:
-            class_data_format = self._class_json_format(class_name)
-            class_data_list.append(class_data_format)
-        # Store formatted class and relationship data in main_data
-        main_data["classes"] = class_data_list
-        main_data["relationships"] = relationship_data_list
-        return main_data
+        if self.__is_synced(file_path):
+            return True
+        storage_manager = self.__storage_manager
+        is_same_database = file_path == self.__sqlite_path and os.path.isfile(file_path)
+        if not is_same_database or (self.__sqlite_change_tracker._is_all_changed() and not self.__is_sqlite_subset):
+            is_saved = storage_manager._save_data_to_sqlite(file_path, self._iter_main_data())
+            if is_saved:
+                self.__mark_clean(file_path)
+                self.__mark_synced(file_path)
+            return is_saved
+        # A subset only knows its own classes, when everything changed all it holds is rewritten and nothing else is touched
+        changes = self._collect_changes(self.__sqlite_change_tracker)
+        is_saved = storage_manager._save_changes_to_sqlite(
+            file_path, changes["classes"], changes["deleted_classes"],
+            changes["relationships"], changes["deleted_relationships"], changes["renamed_classes"])
+        if not is_saved:
+            # The changes are lost to the tracker, write everything the next time
+            self.__sqlite_change_tracker._clear(is_all_changed=True)
+        else:
+            self.__mark_synced(file_path)
+        return is_saved
+    
+    # Load from an SQLite database #
+    def _load_sqlite(self, file_path: str, class_name_list: List[str] = None, name_prefix: str = None,
+                     progress_callback: Callable[[int, int, int], None] = None) -> bool:
+        """
+        Loads UML data from an SQLite database. A subset of the classes can be loaded, only their rows are read,
+        with the relationships between them. Saving back to the same database then only writes what changed
+        and leaves the classes that were not loaded as they are.
+
+        Parameters:
+            file_path (str): The path of the database.
+            class_name_list (List[str], optional): Only load these classes.
+            name_prefix (str, optional): Only load the classes whose name starts with this prefix.
+            progress_callback (Callable, optional): Called while reading with (bytes read, total bytes, classes read).
+
+        Returns:
+            bool: True if the data was loaded, False otherwise.
+        """
+        record_iter = self.__storage_manager._load_records_from_sqlite(file_path, class_name_list, name_prefix, progress_callback)
+        if record_iter is None:
+            return False
+        is_loaded = self.__update_data_members_from_records(record_iter)
+        if not is_loaded:
+            print(f"\nError reading {file_path}.")
+            return False
+        self.__mark_clean(file_path, is_subset=class_name_list is not None or name_prefix is not None)
+        self.__mark_synced(file_path)
+        # The active file is left as it is, the data loaded does not belong to it
+        self.__is_detached = True
+        return True
+
+    # Load a file without touching the saved file lists #
+    def _load_records_from_file(self, file_path: str, graphical_view: GUIView = None) -> bool:
+        """
+        Replaces the UML data with the content of a JSON file, binary snapshot or SQLite database, without adding it
+        to the saved file lists or changing the active file. Used to restore a recovered session.
+
+        Parameters:
+            file_path (str): The full path of the file.
+            graphical_view (GUIView, optional): The canvas to rebuild, the data is loaded without one in CLI mode.
+
+        Returns:
+            bool: True if the data was loaded, False otherwise.
+        """
+        record_iter = self.__storage_manager._load_records_from_json_gui(file_path)
+        if record_iter is None:
+            return False
+        if graphical_view is None:
+            return self.__update_data_members_from_records(record_iter)
+        return self.__update_data_members_gui_from_records(record_iter, graphical_view)
+
+    # Main data to stream into a JSON file #
+    def _iter_main_data(self) -> Dict:
+        """
+        Builds the data to save as generators over the class and relationship objects, so a save
+        serializes one class at a time straight into the file instead of building all of main data first.
+        The generators can be consumed once, call again for every save.
+
+        Returns:
+            Dict: The "classes" and "relationships" sections as generators of JSON-formatted entries.
+        """
+        return {
+            "classes": (self._class_json_format(class_name) for class_name in self.__class_list),
+            "relationships": (relationship._convert_to_json_relationship() for relationship in self.__relationship_list),
+        }
     
     # Update UMLCoreManager data after loading a file #
     def __update_data_members(self, main_data: Dict):
         """
-        Updates the internal data members (class and relationship) after loading from a JSON file.
+        Updates the internal data members (class and relationship) from data already loaded from a JSON file.
 
         Parameters:
             main_data (Dict): The data dictionary loaded from a JSON file.
         """
-        class_data = main_data["classes"]
-        relationship_data = main_data["relationships"]
+        self.__update_data_members_from_records(iter_main_data_records(main_data))
+    
+    # Update UMLCoreManager data while reading a file #
+    def __update_data_members_from_records(self, record_iter: Iterator[Tuple[str, Dict]]) -> bool:
+        """
+        Updates the internal data members (class and relationship) from the records of a JSON file.
+        Each class is built directly from its record as soon as it is read, in a single validating pass.
+        Relationships are built once every class is in place. Main data is rebuilt once at the end and
+        observers receive one LOAD notification instead of one event per entity.
+        Invalid or duplicated entries are reported and skipped.
+
+        Parameters:
+            record_iter (Iterator[Tuple[str, Dict]]): ("classes", class data) and ("relationships", relationship data) records.
+
+        Returns:
+            bool: True if every record was read, False if the file turned out to be malformed; the model is then left empty.
+        """
         # Reset the current storage before loading new data
         self._reset_storage()
-        # Set the new main data
-        self.__main_data = main_data
-        # Extract and recreate class, fields, methods, and parameters from the loaded data
-        extracted_class_data = self._extract_class_data(class_data)
-        for each_pair in extracted_class_data:
-            for class_name, data in each_pair.items():
-                field_list = data["fields"]
-                method_list = data["method_list"]
-
-                # Check for position data in the loaded class information
-                position = data.get("position")
-
-                # Add classes, fields, methods, and parameters to the program state
-                self._add_class(class_name, is_loading=True)
-
-                if position:
-                    self.__class_list[class_name]._set_position(position["x"], position["y"])
-
-                for each_field in field_list:
-                    field_name = each_field["name"]
-                    field_type = each_field["type"]
-                    self._add_field(class_name, field_type, field_name, is_loading=True)
-                method_num = "0"
-                i = 0
-                for each_element in method_list:
-                    i = i + 1
-                    method_num = f"{i}"
-                    method_name = each_element["name"]
-                    return_type = each_element["return_type"]
-                    parameter_list = each_element["params"]
-                    self._add_method(class_name, return_type, method_name, is_loading=True)
-                    for param in parameter_list:
-                        param_type = param["type"]
-                        param_name = param["name"]
-                        self._add_parameter(class_name, method_num, param_type, param_name, is_loading=True)
-        # Recreate relationships from the loaded data
+        class_list = self.__class_list
+        relationship_list = self.__relationship_list
+        relationship_data = []
+        number_of_method = 0
+        try:
+            for section, record in record_iter:
+                if section == "classes":
+                    number_of_method += self.__load_class_record(record)
+                elif section == "relationships":
+                    relationship_data.append(record)
+        except json.JSONDecodeError:
+            self._reset_storage()
+            return False
+        # Build relationships from the loaded data
         for each_dictionary in relationship_data:
-            self._add_relationship(each_dictionary["source"], each_dictionary["destination"], each_dictionary["type"], is_loading=True, is_gui=False)
+            source_class_name = each_dictionary["source"]
+            destination_class_name = each_dictionary["destination"]
+            rel_type = each_dictionary["type"]
+            if not self._is_valid_input(source_class=source_class_name, destination_class=destination_class_name, rel_type=rel_type):
+                continue
+            if not self.__validate_class_existence(source_class_name, should_exist=True) or not self.__validate_class_existence(destination_class_name, should_exist=True):
+                continue
+            if self._relationship_exist(source_class_name, destination_class_name):
+                self.__console.print(f"\n[bold red]Relationship between class [bold white]'{source_class_name}'[/bold white] and class [bold white]'{destination_class_name}'[/bold white] already exists![/bold red]")
+                continue
+            if not self.__validate_type_existence(rel_type, should_exist=True):
+                continue
+            new_relationship = self.create_relationship(source_class_name, destination_class_name, rel_type)
+            relationship_list.append(new_relationship)
+            self.__index_relationship(new_relationship)
+        self._current_number_of_method = self._current_number_of_method + number_of_method
+        # Rebuild main data once and notify observers once
+        self._update_main_data_for_every_action()
+        self._notify_observers(event_type=InterfaceOptions.LOAD.value, data={"class_count": len(class_list), "relationship_count": len(relationship_list)}, is_loading=True)
+        return True
+    
+    # Build one class from its record #
+    def __load_class_record(self, class_element: Dict) -> int:
+        """
+        Builds a class, its fields, methods, and parameters from one loaded class record and adds it to the class list.
+
+        Parameters:
+            class_element (Dict): The class data as saved in a JSON file.
+
+        Returns:
+            int: The number of methods added.
+        """
+        class_list = self.__class_list
+        number_of_method = 0
+        class_name = class_element["name"]
+        if not self._is_valid_input(class_name=class_name):
+            return 0
+        if not self.__validate_class_existence(class_name, should_exist=False):
+            return 0
+        # Keep the saved position if there is one, otherwise fall back to the default position
+        position = class_element.get("position")
+        if position:
+            class_object = Class(class_name, x=position["x"], y=position["y"])
+        else:
+            class_object = self.create_class(class_name)
+        for each_field in class_element["fields"]:
+            field_name = each_field["name"]
+            field_type = each_field["type"]
+            if not self._is_valid_input(field_name=field_name, field_type=field_type):
+                continue
+            if class_object._get_field(field_name) is not None:
+                self.__console.print(f"\n[bold red]Field [bold white]'{field_name}'[/bold white] has already existed in class [bold white]'{class_name}'[/bold white]![/bold red]")
+                continue
+            class_object._add_field(self.create_field(field_type, field_name))
+        method_table = class_object._get_method_table()
+        for each_method in class_element["methods"]:
+            method_name = each_method["name"]
+            return_type = each_method["return_type"]
+            if not self._is_valid_input(method_name=method_name, method_type=return_type):
+                continue
+            param_list: List[Parameter] = []
+            param_name_set = set()
+            for param in each_method["params"]:
+                param_name = param["name"]
+                param_type = param["type"]
+                if not self._is_valid_input(parameter_name=param_name, parameter_type=param_type):
+                    continue
+                if param_name in param_name_set:
+                    self.__console.print(f"\n[bold red]Parameter [bold white]'{param_name}'[/bold white] has already existed![/bold red]")
+                    continue
+                param_name_set.add(param_name)
+                param_list.append(self.create_parameter(param_type, param_name))
+            # Overloads are allowed, identical signatures are not
+            signature = (method_name, tuple(param._get_type() for param in param_list))
+            if method_table._has_signature(signature):
+                self.__console.print(f"\n[bold red]New method [bold white]'{method_name}'[/bold white] "
+                                     f"has the same parameter list signature as an existing method in class [bold white]'{class_name}'[/bold white]![bold red]")
+                continue
+            method_table._append(self.create_method(return_type, method_name), param_list)
+            number_of_method += 1
+        class_list[class_name] = class_object
+        return number_of_method
             
-    def __update_data_members_gui(self, main_data: Dict, graphical_view: GUIView):
+    def __update_data_members_gui_from_records(self, record_iter: Iterator[Tuple[str, Dict]], graphical_view: GUIView) -> bool:
         """
-        Updates the internal data members (class and relationship) after loading from a JSON file.
+        Updates the internal data members (class and relationship) from the records of a JSON file in the same
+        single validating pass as the CLI, with one LOAD notification, then builds the boxes and arrows of the
+        graphical view from the loaded main data.
 
         Parameters:
-            main_data (Dict): The data dictionary loaded from a JSON file.
+            record_iter (Iterator[Tuple[str, Dict]]): ("classes", class data) and ("relationships", relationship data) records.
+            graphical_view (GUIView): The canvas the classes and relationships are added to.
+
+        Returns:
+            bool: True if every record was read, False if the file turned out to be malformed; the model and the canvas are then left empty.
         """
-        class_data = main_data["classes"]
-        relationship_data = main_data["relationships"]
-        method_num = 0
-        # Reset the current storage before loading new data
-        self._reset_storage()
-        # Set the new main data
-        self.__main_data = main_data
-        # Extract and recreate class, fields, methods, and parameters from the loaded data
-        extracted_class_data = self._extract_class_data(class_data)
-        for each_pair in extracted_class_data:
-            for class_name, data in each_pair.items():
-                field_list = data["fields"]
-                method_list = data["method_list"]
-                position = data["position"]
-                # Add classes, fields, methods, and parameters to the program state
-                graphical_view.add_class(class_name, x=position["x"], y=position["y"], is_loading=True)
-                for each_field in field_list:
-                    field_name = each_field["name"]
-                    field_type = each_field["type"]
-                    graphical_view.add_field(class_name, field_type, field_name, is_loading=True)
-                for each_element in method_list:
-                    method_name = each_element["name"]
-                    return_type = each_element["return_type"]
-                    parameter_list = each_element["params"]
-                    graphical_view.add_method(class_name, return_type, method_name, is_loading=True)
-                    method_num += 1
-                    for param in parameter_list:
-                        param_type = param["type"]
-                        param_name = param["name"]
-                        graphical_view.add_param(class_name, method_num, param_type, param_name, is_loading=True)
-        # Recreate relationships from the loaded data
-        for each_dictionary in relationship_data:
-            graphical_view.add_relationship(
-                loaded_source_class=each_dictionary["source"],
-                loaded_dest_class=each_dictionary["destination"],
-                loaded_type=each_dictionary["type"],
-                is_loading=True
-            )
+        if not self.__update_data_members_from_records(record_iter):
+            # Leave neither the model nor the canvas with the classes read so far
+            graphical_view.clear_current_scene()
+            graphical_view.class_name_list = {}
+            return False
+        graphical_view.build_from_main_data(self._get_main_data())
+        return True
             
     # Extract class, field, method, and parameters from json file #
     def _extract_class_data(self, class_data: List[Dict]) -> List[Dict[str, Dict[str, List | Dict]]]:
@@ -2074,22 +2551,16 @@ class UMLModel:
             self.__console.print(f"[bold red]File [bold white]'{user_input}.json'[/bold white] does not exist![/bold red]")
             return
        # Remove the file from saved list and filesystem
-        save_list = self.__storage_manager._get_saved_list()
-        for dictionary in save_list.copy():
-            if user_input in dictionary:
-                save_list.remove(dictionary)
+        self.__storage_manager._get_saved_registry()._remove(user_input)
 
         # Remove file path in NAME_LIST_GUI.json
-        save_list_gui = self.__storage_manager._get_saved_list_gui()
-        for dictionary in save_list_gui.copy():
-            for full_path in dictionary:
-                file_name_with_ext = os.path.basename(full_path)
-                file_name_without_ext, extension = os.path.splitext(file_name_with_ext)
-                if file_name_without_ext == user_input:
-                    save_list_gui.remove(dictionary)
+        saved_registry_gui = self.__storage_manager._get_saved_registry_gui()
+        for full_path in list(saved_registry_gui):
+            if self.__storage_manager._get_file_name(full_path) == user_input:
+                saved_registry_gui._remove(full_path)
                     
-        self.__storage_manager._update_saved_list(save_list)
-        self.__storage_manager._update_saved_list_gui(save_list_gui)
+        self.__storage_manager._update_saved_list()
+        self.__storage_manager._update_saved_list_gui()
         file_path = os.path.join(root_directory, f"{user_input}.json")
         os.remove(file_path)
         self.__console.print(f"\n[bold green]Successfully removed file [bold white]'{user_input}.json'[/bold white][/bold green]")
@@ -2105,12 +2576,7 @@ class UMLModel:
         Returns:
             bool: True if the file exists, False otherwise.
         """
-        saved_list = self.__storage_manager._get_saved_list()
-        for element in saved_list:
-            for name in element:
-                if file_name == name:
-                    return True
-        return False
+        return file_name in self.__storage_manager._get_saved_registry()
     
     # Check if a saved file exists #
     def _check_saved_file_exist_gui(self, file_path: str):
@@ -2123,12 +2589,7 @@ class UMLModel:
         Returns:
             bool: True if the file exists, False otherwise.
         """
-        saved_list = self.__storage_manager._get_saved_list_gui()
-        for element in saved_list:
-            for path in element:
-                if file_path == path:
-                    return True
-        return False
+        return file_path in self.__storage_manager._get_saved_registry_gui()
     
     # End session and return to blank state #
     def _new_file(self):
@@ -2148,12 +2609,8 @@ class UMLModel:
         Returns:
             str: The name of the active file, or 'No active file!' if none is active.
         """
-        saved_list = self.__storage_manager._get_saved_list()
-        for each_dictionary in saved_list:
-            for key, val in each_dictionary.items():
-                if val == "on":
-                    return key
-        return "No active file!"
+        active_file = self.__storage_manager._get_saved_registry()._get_active()
+        return "No active file!" if active_file is None else active_file
     
     # Get active file #
     def _get_active_file_gui(self) -> str:
@@ -2163,20 +2620,15 @@ class UMLModel:
         Returns:
             str: The name of the active file, or 'No active file!' if none is active.
         """
-        saved_list = self.__storage_manager._get_saved_list_gui()
-        for each_dictionary in saved_list:
-            for key, val in each_dictionary.items():
-                if val == "on":
-                    return key
-        return "No active file!"
+        active_file_path = self.__storage_manager._get_saved_registry_gui()._get_active()
+        return "No active file!" if active_file_path is None else active_file_path
     
     # Clear data in the current active file #
     def _clear_current_active_data(self):
         """
         Clears all data in the currently active file and resets it, effectively starting with a blank slate.
         """
-        saved_list = self.__storage_manager._get_saved_list()
-        if len(saved_list) == 0:
+        if len(self.__storage_manager._get_saved_registry()) == 0:
             self.__console.print("\n[bold red]No active file to clear data![bold red]")
             return
         current_active_file = self._get_active_file()
@@ -2184,7 +2636,8 @@ class UMLModel:
             self.__console.print("\n[bold red]No active file![bold red]")
             return
         self._reset_storage()
-        self.__storage_manager._save_data_to_json(current_active_file, self.__main_data)
+        self.__save_if_changed(self.__storage_manager._get_json_path(current_active_file),
+                               lambda: self.__storage_manager._save_data_to_json(current_active_file, self._get_main_data()))
         self.__console.print(f"\n[bold green]Successfully cleared data in file [bold white]'{current_active_file}.json'[/bold white][/bold green]")
     
     # Exit program #
@@ -2202,11 +2655,8 @@ class UMLModel:
         Resets the status of all files in the saved list, setting their status to 'off' (inactive).
         """
         # CLI
-        saved_list = self.__storage_manager._get_saved_list()
-        for each_dictionary in saved_list:
-            for key in each_dictionary:
-                each_dictionary[key] = "off"
-        self.__storage_manager._update_saved_list(saved_list)
+        self.__storage_manager._get_saved_registry()._set_active(None)
+        self.__storage_manager._update_saved_list()
 
     # Set a specific file's status #
     def _set_file_status(self, file_name: str, status: str):
@@ -2217,11 +2667,7 @@ class UMLModel:
             file_name (str): The name of the file.
             status (str): The new status to assign to the file ('on' or 'off').
         """
-        saved_list = self.__storage_manager._get_saved_list()
-        for each_dictionary in saved_list:
-            for key in each_dictionary:
-                if key == file_name:
-                    each_dictionary[key] = status
+        self.__storage_manager._get_saved_registry()._set_status(file_name, status)
     
     # Check and set file status #
     def __check_file_and_set_status(self, file_name: str) -> str:
@@ -2231,21 +2677,16 @@ class UMLModel:
         Parameters:
             file_name (str): The name of the file to activate.
         """
-        saved_list = self.__storage_manager._get_saved_list()
-        for each_dictionary in saved_list:
-            for key in each_dictionary:
-                if each_dictionary[key] == "on":
-                    each_dictionary[key] = "off"
+        saved_registry = self.__storage_manager._get_saved_registry()
+        if file_name not in saved_registry:
+            saved_registry._set_active(None)
         self._set_file_status(file_name, status="on")
-        self.__storage_manager._update_saved_list(saved_list)
+        self.__storage_manager._update_saved_list()
     
     # Set all files' status to 'off' #
     def _set_all_file_off_gui(self):
-        saved_list = self.__storage_manager._get_saved_list_gui()
-        for each_dictionary in saved_list:
-            for key in each_dictionary:
-                each_dictionary[key] = "off"
-        self.__storage_manager._update_saved_list_gui(saved_list)
+        self.__storage_manager._get_saved_registry_gui()._set_active(None)
+        self.__storage_manager._update_saved_list_gui()
     
     # Set a specific file's status #
     def _set_file_status_gui(self, file_path: str, status: str):
@@ -2256,12 +2697,7 @@ class UMLModel:
             file_name (str): The name of the file.
             status (str): The new status to assign to the file ('on' or 'off').
         """
-        
-        saved_list = self.__storage_manager._get_saved_list_gui()
-        for each_dictionary in saved_list:
-            for key in each_dictionary:
-                if key == file_path:
-                    each_dictionary[key] = status
+        self.__storage_manager._get_saved_registry_gui()._set_status(file_path, status)
                     
     # Check and set file status #
     def _check_file_and_set_status_gui(self, file_path: str) -> str:
@@ -2271,22 +2707,28 @@ class UMLModel:
         Parameters:
             file_name (str): The name of the file to activate.
         """
-        saved_list = self.__storage_manager._get_saved_list_gui()
-        for each_dictionary in saved_list:
-            for key in each_dictionary:
-                if each_dictionary[key] == "on":
-                    each_dictionary[key] = "off"
+        saved_registry = self.__storage_manager._get_saved_registry_gui()
+        if file_path not in saved_registry:
+            saved_registry._set_active(None)
         self._set_file_status_gui(file_path, status="on")
-        self.__storage_manager._update_saved_list_gui(saved_list)
+        self.__storage_manager._update_saved_list_gui()
     
     # Reset all storage (classes, relationships, and main data) #
     def _reset_storage(self):
         """
         Resets the entire storage by clearing all class data, relationships, and the main data dictionary.
         """
-        self.__class_list: Dict[str, Class] = {}
+        self.__class_list: Dict[str, Class] = UMLSlotDict()
         self.__relationship_list: List = []
+        self.__relationship_by_pair: Dict[tuple, Relationship] = {}
+        self.__outgoing_relationships: Dict[str, Dict[str, Relationship]] = {}
+        self.__incoming_relationships: Dict[str, Dict[str, Relationship]] = {}
         self.__main_data: Dict = {"classes": [], "relationships" : []}
+        self.__class_slot_index: Dict[str, int] = {}
+        self.__relationship_slot_index: Dict[tuple, int] = {}
+        self.__is_detached = False
+        self.__mark_dirty()
+        self.__main_data_changed()
     
     #################################################################
     ### UTILITY FUNCTIONS ###
@@ -2302,28 +2744,328 @@ class UMLModel:
         Returns:
             bool: True if the file name exists, False if it does not.
         """
-        saved_list = self.__storage_manager._get_saved_list()
-        for each_pair in saved_list:
-            for file_name in each_pair:
-                if file_name == save_file_name:
-                    return True
-        return False
+        return save_file_name in self.__storage_manager._get_saved_registry()
     
     # Update main data for every action #
     def _update_main_data_for_every_action(self, is_undo_or_redo: bool=None):
         """
         Updates the main data by fetching and formatting all classes and relationships, ensuring the state is kept up to date after every change.
+        Inside a batch the rebuild is deferred until the batch commits.
         """
+        # When a batch commits, its edits already marked the classes they changed
+        if self.__batch_depth or self.__batch_backup is None:
+            self.__mark_dirty()
+        if self.__defer_main_data_update():
+            return
         class_data_list = []
         relationship_data_list = self._get_relationship_format_list()
         main_data = self.__main_data
         # Fetch and format class data
         for class_name in self.__class_list:
-            class_data_format = self._class_json_format(class_name)
+            class_data_format = freeze_data(self._class_json_format(class_name))
             class_data_list.append(class_data_format)
-            main_data["classes"] = class_data_list
-        main_data["relationships"] = relationship_data_list
+        main_data["classes"] = class_data_list
+        main_data["relationships"] = [freeze_data(rel_data) for rel_data in relationship_data_list]
+        self.__rebuild_main_data_index()
+        self.__main_data_changed()
+
+    # Rebuild the slot index of main data #
+    def __rebuild_main_data_index(self):
+        """
+        Rebuilds the class-name-to-slot and (source, destination)-to-slot indexes from the current main data.
+        Must be called whenever main data is replaced or rebuilt as a whole.
+        """
+        self.__class_slot_index = {}
+        self.__relationship_slot_index = {}
+        class_data_list = self.__main_data.get("classes", [])
+        for slot, class_data in enumerate(class_data_list):
+            class_name = class_data.get("name") if class_data is not None else None
+            if class_name is not None:
+                self.__class_slot_index[class_name] = slot
+        # Fall back to the class list order when entries do not carry a name
+        if len(self.__class_slot_index) != sum(class_data is not None for class_data in class_data_list):
+            self.__class_slot_index = {class_name: slot for slot, class_name in enumerate(self.__class_list)}
+        for slot, rel_data in enumerate(self.__main_data.get("relationships", [])):
+            if rel_data is not None:
+                self.__relationship_slot_index[(rel_data.get("source"), rel_data.get("destination"))] = slot
+    
+    # Drop the empty slots left by deleted main data entries #
+    def __compact_main_data(self, data_key: str, slot_index: Dict):
+        """
+        A deleted entry leaves None in its slot, so the entries after it keep their slots. Once the empty
+        slots make up half of the list they are dropped and the slots numbered again, so a delete is O(1) amortized.
+
+        Parameters:
+            data_key (str): "classes" or "relationships".
+            slot_index (Dict): The slot index of that list.
+        """
+        data_list = self.__main_data[data_key]
+        if len(data_list) < MIN_COMPACT_SIZE or (len(data_list) - len(slot_index)) * 2 < len(data_list):
+            return
+        data_list[:] = [entry for entry in data_list if entry is not None]
+        self.__rebuild_main_data_index()
+
+    # Mark main data as changed #
+    def __main_data_changed(self, class_name_list: List[str] = None):
+        """
+        Bumps the data version and drops the snapshots of the previous version, so the next
+        _get_main_data / _get_class_list call takes a new one.
+
+        Parameters:
+            class_name_list (List[str], optional): The classes whose objects changed, every class when None.
+        """
+        self.__data_version += 1
+        self.__main_data_snapshot = None
+        self.__class_list_snapshot = None
+        if class_name_list is None:
+            self.__class_snapshot_table = {}
+        else:
+            for class_name in class_name_list:
+                self.__class_snapshot_table.pop(class_name, None)
+
+    # Defer a main data update while a batch is running #
+    def __defer_main_data_update(self, class_name_list: List[str] = None) -> bool:
+        """
+        Inside a batch, records that main data must be rebuilt on commit instead of updating it now.
+
+        Parameters:
+            class_name_list (List[str], optional): The classes whose objects changed, every class when None.
+
+        Returns:
+            bool: True if the update was deferred, False if it must happen now.
+        """
+        if not self.__batch_depth:
+            return False
+        self.__is_batch_main_data_dirty = True
+        self.__main_data_changed(class_name_list)
+        return True
+
+    # Record what changed since the last save to an SQLite database #
+    def __mark_dirty(self, class_name_list: List[str] = None, relationship_key_list: List[tuple] = ()):
+        """
+        Records changed classes and relationships in every change tracker, so the next save to the same
+        SQLite database only rewrites their rows and the command journal only records them.
+
+        Parameters:
+            class_name_list (List[str], optional): The classes that changed, every class when None.
+            relationship_key_list (List[tuple]): The (source, destination) pairs of the relationships that changed.
+        """
+        for tracker in self.__change_tracker_list:
+            tracker._mark(class_name_list, relationship_key_list)
+    
+    # Forget the recorded changes, the model now matches an SQLite database #
+    def __mark_clean(self, sqlite_path: str = None, is_subset: bool = False):
+        self.__sqlite_path = sqlite_path
+        self.__is_sqlite_subset = is_subset
+        self.__sqlite_change_tracker._clear(is_all_changed=sqlite_path is None)
+    
+    # Track which files hold the current data #
+    def __is_synced(self, file_path: str) -> bool:
+        """
+        Checks whether a file still holds the current data: the model was saved to or loaded from it at the
+        current data version, and the file was not modified since.
+        """
+        synced_entry = self.__synced_file_table.get(os.path.abspath(file_path))
+        if synced_entry is None or synced_entry[0] != self.__data_version:
+            return False
+        return synced_entry[1] == self.__get_file_stamp(file_path)
+    
+    def __mark_synced(self, file_path: str):
+        file_stamp = self.__get_file_stamp(file_path)
+        if file_stamp is not None:
+            self.__synced_file_table[os.path.abspath(file_path)] = (self.__data_version, file_stamp)
+    
+    @staticmethod
+    def __get_file_stamp(file_path: str) -> Tuple[int, int] | None:
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            return None
+        return file_stat.st_mtime_ns, file_stat.st_size
+    
+    # Write a file unless it already holds the current data #
+    def __save_if_changed(self, file_path: str, write_function: Callable[[], bool]) -> bool:
+        """
+        Parameters:
+            file_path (str): The full path write_function writes to.
+            write_function (Callable): Writes the file, returns True on success.
+
+        Returns:
+            bool: True if the file holds the current data, False if the write failed.
+        """
+        if self.__is_synced(file_path):
+            return True
+        if not write_function():
+            return False
+        self.__mark_synced(file_path)
+        return True
+    
+    # Attach and detach change trackers #
+    def _add_change_tracker(self, tracker: ChangeTracker):
+        """
+        Attaches a change tracker, it records every class and relationship that changes from now on.
+        """
+        if tracker not in self.__change_tracker_list:
+            self.__change_tracker_list.append(tracker)
+    
+    def _remove_change_tracker(self, tracker: ChangeTracker):
+        if tracker in self.__change_tracker_list:
+            self.__change_tracker_list.remove(tracker)
     
+    # Collect what a change tracker recorded #
+    def _collect_changes(self, tracker: ChangeTracker) -> Dict:
+        """
+        Collects the changes a tracker recorded since it was last cleared, as JSON-formatted entries, and clears it.
+
+        Parameters:
+            tracker (ChangeTracker): An attached change tracker.
+
+        Returns:
+            Dict: "is_all_changed" (bool), "renamed_classes" ((old name, new name) pairs in order),
+                "classes" (the changed classes that exist, in class list order), "deleted_classes" (names),
+                "relationships" (the changed relationships that exist) and "deleted_relationships" ((source, destination) pairs).
+                When everything changed, "classes" and "relationships" hold the whole diagram.
+                The class and relationship entries are generated when they are read, read them before editing the model again.
+        """
+        class_list = self.__class_list
+        relationship_by_pair = self.__relationship_by_pair
+        class_name_set = tracker._get_class_name_set()
+        relationship_key_set = tracker._get_relationship_key_set()
+        if tracker._is_all_changed():
+            changed_class_name_list = list(class_list)
+            changed_relationship_list = list(self.__relationship_list)
+        else:
+            changed_class_name_list = [class_name for class_name in class_list if class_name in class_name_set]
+            changed_relationship_list = [relationship_by_pair[key] for key in relationship_by_pair if key in relationship_key_set]
+        changes = {
+            "is_all_changed": tracker._is_all_changed(),
+            "renamed_classes": list(tracker._get_renamed_class_list()),
+            "classes": (self._class_json_format(class_name) for class_name in changed_class_name_list),
+            "deleted_classes": sorted(class_name for class_name in class_name_set if class_name not in class_list),
+            "relationships": (relationship._convert_to_json_relationship() for relationship in changed_relationship_list),
+            "deleted_relationships": sorted(key for key in relationship_key_set if key not in relationship_by_pair),
+        }
+        tracker._clear()
+        return changes
+    
+    # Update a single class entry in main data #
+    def _update_class_in_main_data(self, class_name: str):
+        """
+        Re-serializes only the given class and writes it into its slot in main data,
+        appending a new slot if the class is not in main data yet.
+
+        Parameters:
+            class_name (str): The name of the class that changed.
+        """
+        self.__mark_dirty([class_name])
+        if self.__defer_main_data_update([class_name]):
+            return
+        class_data_format = self._class_json_format(class_name)
+        if class_data_format is None:
+            return
+        class_data_format = freeze_data(class_data_format)
+        self.__main_data_changed([class_name])
+        class_data_list = self.__main_data.setdefault("classes", [])
+        slot = self.__class_slot_index.get(class_name)
+        if slot is None:
+            self.__class_slot_index[class_name] = len(class_data_list)
+            class_data_list.append(class_data_format)
+        else:
+            class_data_list[slot] = class_data_format
+
+    # Rename a class entry in main data #
+    def _rename_class_in_main_data(self, current_name: str, new_name: str):
+        """
+        Moves the slot of a renamed class to its new name and refreshes the entry in place.
+
+        Parameters:
+            current_name (str): The old class name.
+            new_name (str): The new class name.
+        """
+        for tracker in self.__change_tracker_list:
+            tracker._mark_rename(current_name, new_name)
+        if self.__defer_main_data_update([current_name, new_name]):
+            return
+        slot = self.__class_slot_index.pop(current_name, None)
+        if slot is not None:
+            self.__class_slot_index[new_name] = slot
+        self.__main_data_changed([current_name])
+        self._update_class_in_main_data(new_name)
+
+    # Remove a class entry from main data #
+    def _remove_class_from_main_data(self, class_name: str):
+        """
+        Removes a class entry from main data, leaving its slot empty until main data is compacted.
+
+        Parameters:
+            class_name (str): The name of the deleted class.
+        """
+        self.__mark_dirty([class_name])
+        if self.__defer_main_data_update([class_name]):
+            return
+        self.__main_data_changed([class_name])
+        slot = self.__class_slot_index.pop(class_name, None)
+        if slot is None:
+            return
+        self.__main_data["classes"][slot] = None
+        self.__compact_main_data("classes", self.__class_slot_index)
+
+    # Update a single relationship entry in main data #
+    def _update_relationship_in_main_data(self, relationship: Relationship, old_key: tuple = None):
+        """
+        Re-serializes only the given relationship and writes it into its slot in main data,
+        appending a new slot if the relationship is not in main data yet.
+
+        Parameters:
+            relationship (Relationship): The relationship that changed.
+            old_key (tuple, optional): The previous (source, destination) pair if the relationship was re-keyed.
+        """
+        new_key = (relationship._get_source_class(), relationship._get_destination_class())
+        self.__mark_dirty([], [new_key] if old_key is None else [new_key, old_key])
+        if self.__defer_main_data_update([]):
+            return
+        rel_data_format = freeze_data(relationship._convert_to_json_relationship())
+        self.__main_data_changed([])
+        rel_data_list = self.__main_data.setdefault("relationships", [])
+        slot = self.__relationship_slot_index.pop(old_key if old_key is not None else new_key, None)
+        if slot is None:
+            slot = len(rel_data_list)
+            rel_data_list.append(rel_data_format)
+        else:
+            rel_data_list[slot] = rel_data_format
+        self.__relationship_slot_index[new_key] = slot
+
+    # Remove a relationship entry from main data #
+    def _remove_relationship_from_main_data(self, source_class_name: str, destination_class_name: str):
+        """
+        Removes a relationship entry from main data, leaving its slot empty until main data is compacted.
+
+        Parameters:
+            source_class_name (str): The source class name.
+            destination_class_name (str): The destination class name.
+        """
+        self._remove_relationships_from_main_data([(source_class_name, destination_class_name)])
+
+    # Remove several relationship entries from main data #
+    def _remove_relationships_from_main_data(self, pair_list: List[tuple]):
+        """
+        Removes several relationship entries from main data at once, leaving their slots empty until main data is compacted.
+
+        Parameters:
+            pair_list (List[tuple]): The (source, destination) pairs of the deleted relationships.
+        """
+        self.__mark_dirty([], pair_list)
+        if self.__defer_main_data_update([]):
+            return
+        slot_list = [slot for slot in (self.__relationship_slot_index.pop(each_pair, None) for each_pair in pair_list) if slot is not None]
+        if not slot_list:
+            return
+        self.__main_data_changed([])
+        rel_data_list = self.__main_data["relationships"]
+        for slot in slot_list:
+            rel_data_list[slot] = None
+        self.__compact_main_data("relationships", self.__relationship_slot_index)
+
     # Validate entities (Class, Field, Method, Parameter) #
     def _validate_entities(
         self, 
@@ -2331,7 +3073,7 @@ class UMLModel:
         field_name: str = None, 
         method_name: str = None, 
         parameter_name: str = None, 
-        method_and_param_list: Dict = None,
+        chosen_method: Method = None,
         class_should_exist: bool = None, 
         field_should_exist: bool = None,
         method_should_exist: bool = None, 
@@ -2345,6 +3087,7 @@ class UMLModel:
             field_name (str, optional): Name of the field to check.
             method_name (str, optional): Name of the method to check.
             parameter_name (str, optional): Name of the parameter to check.
+            chosen_method (Method, optional): The method whose parameters are checked.
             class_should_exist (bool, optional): Whether the class should exist or not.
             field_should_exist (bool, optional): Whether the field should exist or not.
             method_should_exist (bool, optional): Whether the method should exist or not.
@@ -2370,7 +3113,7 @@ class UMLModel:
                 return False
         # Validate parameter existence
         if parameter_name is not None and parameter_should_exist is not None:
-            is_parameter_exist = self.__validate_parameter_existence(class_name, method_and_param_list, parameter_name, parameter_should_exist)
+            is_parameter_exist = self.__validate_parameter_existence(class_name, chosen_method, parameter_name, parameter_should_exist)
             if not is_parameter_exist:
                 return False
         return True
@@ -2461,7 +3204,7 @@ class UMLModel:
                 data={"class_name": class_name, "field_name": input_name, "new_type": new_type},
                 is_undo_or_redo=is_undo_or_redo
             )
-            self._update_main_data_for_every_action()
+            self._update_class_in_main_data(class_name)
             return True
 
         elif is_method:
@@ -2478,16 +3221,15 @@ class UMLModel:
             if not is_method_num_a_number:
                 return False
             # Retrieve the method and parameter list
-            method_and_parameter_list = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
+            method_table = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
             # Convert method_num to index and validate
             selected_index = int(method_num) - 1
-            if 0 <= selected_index < len(method_and_parameter_list):
-                chosen_pair = method_and_parameter_list[selected_index]
-                method, param_list = next(iter(chosen_pair.items()))
+            if 0 <= selected_index < len(method_table):
+                method = method_table._get_method(selected_index)
                 # Update the method's return type
                 method._set_type(new_type)
                 # Notify observers and update main data
-                self._update_main_data_for_every_action()
+                self._update_class_in_main_data(class_name)
                 self._notify_observers(
                     event_type=InterfaceOptions.EDIT_METHOD_TYPE.value,
                     data={"class_name": class_name, "method_name": method._get_name(), "new_type": new_type},
@@ -0,0 +1,76 @@
+from collections.abc import MutableMapping
+from typing import Any, Dict, Hashable, Iterator, List
+
+###################################################################################################
+# Ordered mapping for the class list of UMLModel
+# Classes are listed in the order they were added, and a renamed class keeps its place. A plain
+# dict can only do that by rebuilding itself on every rename, so this mapping keeps the keys in a
+# list of slots with a key-to-slot index next to it: a rename writes the new key into the same
+# slot, a delete leaves an empty slot behind, and the empty slots are dropped all at once when
+# they make up half of the list. Every operation is O(1), amortized for deletes.
+
+# The slot list is not compacted below this size, a few empty slots cost nothing
+MIN_COMPACT_SIZE = 32
+
+class _Tombstone:
+    __slots__ = ()
+
+    def __repr__(self):
+        return "<deleted>"
+
+# Marks a slot whose key was deleted, None is a valid key
+TOMBSTONE = _Tombstone()
+
+class UMLSlotDict(MutableMapping):
+    """
+    A dict that keeps its keys in insertion order and can rename a key in place with _rename_key.
+    """
+
+    def __init__(self, items=()):
+        self.__value_table: Dict[Hashable, Any] = {}
+        self.__key_slot_list: List[Any] = []
+        self.__slot_index: Dict[Hashable, int] = {}
+        self.update(items)
+
+    def __getitem__(self, key):
+        return self.__value_table[key]
+
+    def __setitem__(self, key, value):
+        if key not in self.__value_table:
+            self.__slot_index[key] = len(self.__key_slot_list)
+            self.__key_slot_list.append(key)
+        self.__value_table[key] = value
+
+    def __delitem__(self, key):
+        del self.__value_table[key]
+        self.__key_slot_list[self.__slot_index.pop(key)] = TOMBSTONE
+        tombstone_count = len(self.__key_slot_list) - len(self.__value_table)
+        if len(self.__key_slot_list) >= MIN_COMPACT_SIZE and tombstone_count * 2 >= len(self.__key_slot_list):
+            self.__compact()
+
+    def __contains__(self, key):
+        return key in self.__value_table
+
+    def __iter__(self) -> Iterator:
+        return (key for key in self.__key_slot_list if key is not TOMBSTONE)
+
+    def __len__(self):
+        return len(self.__value_table)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    def _rename_key(self, current_key, new_key):
+        """
+        Moves the value of current_key to new_key, keeping its place in the order.
+        """
+        if new_key in self.__value_table:
+            raise KeyError(new_key)
+        slot = self.__slot_index.pop(current_key)
+        self.__value_table[new_key] = self.__value_table.pop(current_key)
+        self.__key_slot_list[slot] = new_key
+        self.__slot_index[new_key] = slot
+
+    def __compact(self):
+        self.__key_slot_list = [key for key in self.__key_slot_list if key is not TOMBSTONE]
+        self.__slot_index = {key: slot for slot, key in enumerate(self.__key_slot_list)}
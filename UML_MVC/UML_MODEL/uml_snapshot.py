@@ -0,0 +1,51 @@
+import copy
+
+###################################################################################################
+# Read-only containers for the snapshots handed out by UMLModel
+# A snapshot shares its entries with the model (and with older snapshots), so nothing
+# inside it may change. These containers still are a dict / list, so readers, tests and
+# json.dump keep working, but every in-place modification raises TypeError.
+# Copying a snapshot gives back ordinary mutable dicts and lists.
+
+def _read_only(*args, **kwargs):
+    raise TypeError("UML snapshots are read-only, copy them before modifying")
+
+class UMLSnapshotDict(dict):
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {copy.deepcopy(key, memo): copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+class UMLSnapshotList(list):
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(value, memo) for value in self]
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+# Freeze JSON-like data (dicts, lists and plain values) into snapshot containers #
+def freeze_data(data):
+    if isinstance(data, (UMLSnapshotDict, UMLSnapshotList)):
+        return data
+    if isinstance(data, dict):
+        return UMLSnapshotDict((key, freeze_data(value)) for key, value in data.items())
+    if isinstance(data, list):
+        return UMLSnapshotList(freeze_data(value) for value in data)
+    return data
@@ -209,6 +209,7 @@ class UMLView(Observer):
             ["add_class [bright_white]<class_name>[bright_white]", "Add a new class"],
             ["delete_class [bright_white]<class_name>[bright_white]", "Delete an existing class"],
             ["rename_class [bright_white]<class_name> <new_name>[bright_white]", "Rename a class"],
+            ["copy_class [bright_white]<class_name> <new_name>[bright_white]", "Copy a class with its fields and methods"],
 
             ["[bold yellow]Field Commands[/bold yellow]", ""],
             ["add_field [bright_white]<class_name> <type/Empty> <attr_name>[bright_white]", "Add a field to a class"],
@@ -235,6 +236,9 @@ class UMLView(Observer):
             ["edit_rel_type [bright_white]<source_class> <destination_class> <new_type>[bright_white]", "Modify the type of a relationship"],
             ["undo", "Undo an action"],
             ["redo", "Redo an action"],
+            ["undo_stats", "Show the size of the undo history"],
+            ["history", "List the undo history"],
+            ["goto [bright_white]<entry_number>[bright_white]", "Undo or redo up to an entry of the history"],
 
             ["[bold yellow]Class-Related Commands[/bold yellow]", ""],
             ["list_class", "List all created classes"],
@@ -430,12 +434,56 @@ class UMLView(Observer):
         self.console.print(table)
         return True
         
+    def _display_history_stats(self, history_stats: Dict):
+        """
+        Displays the number of commands in the undo history and their estimated memory use.
+        
+        Args:
+            history_stats (Dict): The statistics returned by InputHandler._get_history_stats.
+        """
+        table = Table(title="\n[bold white]Undo History[bold white]", show_header=True, header_style="bold yellow", border_style="bold dodger_blue2")
+        table.add_column("Entry", justify="left", style="bold white")
+        table.add_column("Value", justify="right", style="bold white")
+        table.add_row("Commands", f"{history_stats['entries']} / {history_stats['max_entries']}")
+        table.add_row("Undo available", str(history_stats["undo_entries"]))
+        table.add_row("Redo available", str(history_stats["redo_entries"]))
+        table.add_row("Estimated memory", f"{history_stats['estimated_bytes'] / 1024:,.1f} KB / {history_stats['max_bytes'] / 1024:,.0f} KB")
+        table.add_row("Commands dropped", str(history_stats["evicted_entries"]))
+        self.console.print(table)
+
+    def _display_history(self, history_list: List[Dict], position: int):
+        """
+        Displays the entries of the undo history, marking the one the diagram is at.
+        
+        Args:
+            history_list (List[Dict]): The entries returned by InputHandler._get_history.
+            position (int): The number of commands done.
+        """
+        if len(history_list) == 0:
+            self.console.print("\n[bold red]No command in the history![/bold red]")
+            return False
+        table = Table(title="\n[bold white]History[bold white]", show_header=True, header_style="bold yellow", border_style="bold dodger_blue2")
+        table.add_column("Entry", justify="right", style="bold white")
+        table.add_column("Command", justify="left", style="bold white")
+        table.add_column("State", justify="left", style="bold white")
+        table.add_row("0", "Start", "[bold green]current[/bold green]" if position == 0 else "")
+        for entry in history_list:
+            if entry["position"] == position:
+                state = "[bold green]current[/bold green]"
+            else:
+                state = "done" if entry["is_done"] else "[dim]undone[/dim]"
+            if entry["has_checkpoint"]:
+                state += " (checkpoint)"
+            table.add_row(str(entry["position"]), entry["description"], state)
+        self.console.print(table)
+        return True
+
     def _display_method_and_parameter_list(self, method_and_param_list: List):
         """
         Displays the list of methods and their parameters in a UML diagram using a table format.
         
         Args:
-            method_and_param_list (List): A list of methods and their parameter lists.
+            method_and_param_list (UMLMethodTable): The method table of a class (iterates as method, parameter list pairs).
         """
         if len(method_and_param_list) == 0:
             self.console.print("\n[bold red]No method exists![/bold red]")
@@ -449,23 +497,22 @@ class UMLView(Observer):
         # Counter to dynamically number the methods
         method_counter = 1
 
-        for each_element in method_and_param_list:
-            for method, param_list in each_element.items():
-                # Extract method name and return type
-                method_name = method._get_name()
-                return_type = method._get_type() + " "  # Assuming method has a return type
-                
-                # Extract and format parameters as "type param"
-                formatted_params = ', '.join([f"[bold italic cyan]{param._get_type()}[/bold italic cyan] {param._get_parameter_name()}" for param in param_list])
-                
-                # Format the method as "method_name(type param1, type param2)"
-                method_signature = f"[bold italic cyan]{return_type}[/bold italic cyan][bold dark_orange]{method_name}([bold white]{formatted_params}[/bold white])[/bold dark_orange]"
-                
-                # Add the numbered method and the formatted parameters to the table
-                table.add_row(f"{method_counter}", f"[bold cyan]{method_signature}[/bold cyan]")
-                
-                # Increment the counter for the next method
-                method_counter += 1
+        for method, param_list in method_and_param_list:
+            # Extract method name and return type
+            method_name = method._get_name()
+            return_type = method._get_type() + " "  # Assuming method has a return type
+            
+            # Extract and format parameters as "type param"
+            formatted_params = ', '.join([f"[bold italic cyan]{param._get_type()}[/bold italic cyan] {param._get_parameter_name()}" for param in param_list])
+            
+            # Format the method as "method_name(type param1, type param2)"
+            method_signature = f"[bold italic cyan]{return_type}[/bold italic cyan][bold dark_orange]{method_name}([bold white]{formatted_params}[/bold white])[/bold dark_orange]"
+            
+            # Add the numbered method and the formatted parameters to the table
+            table.add_row(f"{method_counter}", f"[bold cyan]{method_signature}[/bold cyan]")
+            
+            # Increment the counter for the next method
+            method_counter += 1
 
         # Use the console to print the table
         self.console.print(table)
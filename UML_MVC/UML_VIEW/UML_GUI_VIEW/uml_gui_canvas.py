@@ -1,4 +1,5 @@
 import os
+import time
 from PyQt5 import QtWidgets, QtGui, QtCore, QtPrintSupport
 from UML_MVC.UML_VIEW.UML_GUI_VIEW.uml_gui_class_box import UMLClassBox
 from UML_ENUM_CLASS.uml_enum import RelationshipType
@@ -53,7 +54,8 @@ class UMLGraphicsView(QtWidgets.QGraphicsView):
         # Track selected class or arrow
         self.selected_class = False
 
-        self.move_start_pos = None  # Starting position for move actions
+        self.move_start_table = {}  # Starting position of every selected box, for group moves
+        self.move_start_time = None  # When the current move started
 
     #################################################################
     ## GRID VIEW RELATED ##
@@ -196,6 +198,77 @@ class UMLGraphicsView(QtWidgets.QGraphicsView):
                 None, "Warning", f"Class name '{new_class_name}' already exists!"
             )
 
+    def duplicate_class(self):
+        """
+        Adds a copy of the selected class, with all its fields, methods and parameters, under a new name.
+
+        The class and its members are added by one composite command, so the copy is undone in one step.
+        """
+        if not self.selected_class:
+            QtWidgets.QMessageBox.warning(None, "Warning", "No class selected!")
+            return
+        class_name = self.selected_class.class_name_text.toPlainText()
+        new_class_name, ok = QtWidgets.QInputDialog.getText(
+            None, "Duplicate Class", f"Enter a name for the copy of '{class_name}':"
+        )
+        if not ok or not new_class_name:
+            return
+        is_class_name_valid = self.interface.is_valid_input(class_name=new_class_name)
+        if not is_class_name_valid:
+            QtWidgets.QMessageBox.warning(
+                None,
+                "Warning",
+                f"Class name '{new_class_name}' is invalid! Only letters, numbers, and underscores allowed.",
+            )
+            return
+
+        class_data = next(
+            each_class for each_class in self.interface.get_main_data()["classes"]
+            if each_class["name"] == class_name
+        )
+        # Every child works on the new box, so the factory hands it out to all of them
+        self.command_factory.class_box = UMLClassBox(self.interface, class_name=new_class_name)
+        child_command_list = [
+            self.command_factory.create_command(command_name="add_class", class_name=new_class_name)
+        ]
+        for field in class_data["fields"]:
+            child_command_list.append(
+                self.command_factory.create_command(
+                    command_name="add_field",
+                    class_name=new_class_name,
+                    field_type=field["type"],
+                    input_name=field["name"],
+                )
+            )
+        for method_num, method in enumerate(class_data["methods"], start=1):
+            child_command_list.append(
+                self.command_factory.create_command(
+                    command_name="add_method",
+                    class_name=new_class_name,
+                    input_name=method["name"],
+                    method_type=method["return_type"],
+                )
+            )
+            for param in method["params"]:
+                child_command_list.append(
+                    self.command_factory.create_command(
+                        command_name="add_param",
+                        class_name=new_class_name,
+                        method_num=str(method_num),
+                        param_type=param["type"],
+                        input_name=param["name"],
+                    )
+                )
+        duplicate_class_command = self.command_factory.create_command(
+            command_name="composite", child_command_list=child_command_list
+        )
+
+        is_class_duplicated = self.input_handler.execute_command(duplicate_class_command)
+        if not is_class_duplicated:
+            QtWidgets.QMessageBox.warning(
+                None, "Warning", f"Class '{new_class_name}' already exists!"
+            )
+
     def add_field(self, loaded_class_name=None, loaded_field_type=None, loaded_field_name=None, is_loading=False):
         """
         Adds a field to a UML class box, either during loading or interactively.
@@ -1162,33 +1235,48 @@ class UMLGraphicsView(QtWidgets.QGraphicsView):
 
     def open_folder_gui(self):
         """
-        Opens a file dialog to allow the user to select a JSON file for loading into the application.
+        Opens a file dialog to allow the user to select a JSON file, compressed JSON file, binary snapshot or SQLite database for loading into the application.
 
-        This function uses the `QFileDialog` to let the user select a `.json` file from the file system.
-        If a valid JSON file is selected, the function proceeds to load the file into the interface.
-        If the selected file is not a JSON file, a warning is displayed to the user.
+        This function uses the `QFileDialog` to let the user select a `.json`, `.json.gz`, `.json.xz`, `.umlb` or `.umldb` file from the file system.
+        If a valid file is selected, the function proceeds to load the file into the interface.
+        If the selected file is neither, a warning is displayed to the user.
         """
         # Show an open file dialog and store the selected file path
         full_path, _ = QtWidgets.QFileDialog.getOpenFileName(
-            self, "Open File", os.getcwd(), "JSON Files (*.json)"
+            self, "Open File", os.getcwd(), "Diagram Files (*.json *.json.gz *.json.xz *.umlb *.umldb);;JSON Files (*.json);;Compressed JSON Files (*.json.gz *.json.xz);;Binary Snapshots (*.umlb);;SQLite Databases (*.umldb)"
         )
         # Check if the user canceled the dialog (full_path will be empty if canceled)
         if not full_path:
             return  # Exit the function if the user cancels the dialog
-        # Check if the selected file is a JSON file
-        if not full_path.endswith('.json'):
+        # Check if the selected file is a JSON file, a binary snapshot or an SQLite database
+        if not full_path.endswith(('.json', '.json.gz', '.json.xz', '.umlb', '.umldb')):
             QtWidgets.QMessageBox.warning(
                 None,
                 "Warning",
-                "The selected file is not a JSON file. Please select a valid JSON file.",
+                "The selected file is not a JSON file, compressed JSON file, binary snapshot or SQLite database. Please select a valid file.",
             )
             return
         self.clear_current_scene()  # Clear the scene before loading a new file
         # If a valid file is selected, proceed to load it into the interface
         if full_path:
             file_base_name = os.path.basename(full_path)  # Extract the file name from the full path
-            file_name_only = os.path.splitext(file_base_name)[0]  # Remove the file extension
-            self.interface.load_gui(file_name_only, full_path, self)  # Load the file into the GUI
+            file_name_only = self.interface.get_storage_manager()._get_file_name(full_path)  # Remove the file extension
+            # Show how much of the file has been read while it loads
+            progress_dialog = QtWidgets.QProgressDialog(f"Loading '{file_base_name}'...", None, 0, 100, self)
+            progress_dialog.setWindowTitle("Open File")
+            progress_dialog.setWindowModality(QtCore.Qt.WindowModal)
+            progress_dialog.setMinimumDuration(500)
+
+            def show_progress(bytes_read, total_bytes, class_count):
+                if total_bytes:
+                    progress_dialog.setValue(min(99, bytes_read * 100 // total_bytes))
+                progress_dialog.setLabelText(
+                    f"Loading '{file_base_name}': {bytes_read / 1024 / 1024:.1f} MB, {class_count} classes read"
+                )
+                QtWidgets.QApplication.processEvents()
+
+            self.interface.load_gui(file_name_only, full_path, self, show_progress)  # Load the file into the GUI
+            progress_dialog.setValue(100)
 
     def save_as_gui(self):
         """
@@ -1198,20 +1286,19 @@ class UMLGraphicsView(QtWidgets.QGraphicsView):
         If the user cancels the dialog or selects an invalid file, appropriate actions are taken.
         """
         full_path, _ = QtWidgets.QFileDialog.getSaveFileName(
-            self, "Save File", os.getcwd(), "JSON Files (*.json)"
+            self, "Save File", os.getcwd(), "JSON Files (*.json);;Compressed JSON Files (*.json.gz *.json.xz);;Binary Snapshots (*.umlb);;SQLite Databases (*.umldb)"
         )
         if not full_path:
             return  # If canceled, just return and do nothing
-        if not full_path.endswith('.json'):
+        if not full_path.endswith(('.json', '.json.gz', '.json.xz', '.umlb', '.umldb')):
             QtWidgets.QMessageBox.warning(
                 None,
                 "Warning",
-                "The selected file is not a JSON file. Please select a valid JSON file.",
+                "The selected file is not a JSON file, compressed JSON file, binary snapshot or SQLite database. Please select a valid file.",
             )
             return
         if full_path:
-            file_base_name = os.path.basename(full_path)
-            file_name_only = os.path.splitext(file_base_name)[0]
+            file_name_only = self.interface.get_storage_manager()._get_file_name(full_path)
             self.interface.save_gui(file_name_only, full_path, self.class_name_list)
 
     def save_gui(self):
@@ -1226,8 +1313,7 @@ class UMLGraphicsView(QtWidgets.QGraphicsView):
         if current_active_file_path == "No active file!":
             self.save_as_gui()
         else:
-            file_base_name = os.path.basename(current_active_file_path)
-            file_name_only = os.path.splitext(file_base_name)[0]
+            file_name_only = self.interface.get_storage_manager()._get_file_name(current_active_file_path)
             self.interface.save_gui(file_name_only, current_active_file_path, self.class_name_list)
 
     #################################################################
@@ -1253,6 +1339,20 @@ class UMLGraphicsView(QtWidgets.QGraphicsView):
         self.input_handler.redo()
         self.scene().update()
 
+    def go_to_history(self, position: int) -> bool:
+        """
+        Undoes or redoes commands until the given number of them is done.
+
+        Args:
+            position (int): The number of commands to have done, 0 before the first one.
+
+        Returns:
+            bool: True if the position exists in the history, False otherwise.
+        """
+        is_moved = self.input_handler._go_to(position)
+        self.scene().update()
+        return is_moved
+
     def clear_current_scene(self):
         """
         Removes all UMLClassBox and ArrowLine items from the scene.
@@ -1267,6 +1367,67 @@ class UMLGraphicsView(QtWidgets.QGraphicsView):
                 # Remove the item from the scene
                 self.scene().removeItem(item)
 
+    def build_from_main_data(self, main_data):
+        """
+        Replaces the canvas with a box for every class and an arrow for every relationship in main data.
+
+        The model has already loaded and checked the data, so the boxes are filled in directly and each box
+        is laid out once, instead of adding every member through the interface.
+
+        Parameters:
+            main_data (Dict): The main data of the model, with "classes" and "relationships".
+        """
+        self.clear_current_scene()
+        self.class_name_list = {}
+        self.relationship_track_list = {}
+        for class_data in main_data["classes"]:
+            position = class_data["position"]
+            class_box = UMLClassBox(self.interface, class_name=class_data["name"], x=position["x"], y=position["y"])
+            class_box.set_box_position()
+            for each_field in class_data["fields"]:
+                field_key = (each_field["type"], each_field["name"])
+                class_box.field_list[field_key] = class_box.create_text_item(
+                    f"{each_field['type']} {each_field['name']}",
+                    is_field=True,
+                    selectable=False,
+                    color=class_box.text_color,
+                )
+                class_box.field_key_list.append(field_key)
+            for each_method in class_data["methods"]:
+                method_text = class_box.create_text_item(
+                    f"{each_method['return_type']} {each_method['name']}()",
+                    is_method=True,
+                    selectable=False,
+                    color=class_box.text_color,
+                )
+                class_box.method_list.append({
+                    "method_key": (each_method["return_type"], each_method["name"]),
+                    "method_text": method_text,
+                    "parameters": [(param["type"], param["name"]) for param in each_method["params"]],
+                })
+            if class_box.method_list:
+                # Separator between the fields and the methods
+                class_box.create_separator(is_first=False)
+                class_box.param_num = len(class_box.method_list[-1]["parameters"])
+            class_box.update_box()
+            self.class_name_list[class_data["name"]] = class_box
+            self.scene().addItem(class_box)
+        # Boxes with arrows are laid out again once all their arrows are in place
+        connected_box_list = {}
+        for rel_data in main_data["relationships"]:
+            source_class_obj = self.class_name_list[rel_data["source"]]
+            dest_class_obj = self.class_name_list[rel_data["destination"]]
+            source_class_obj.is_source_class = True
+            arrow_line = ArrowLine(source_class_obj, dest_class_obj, rel_data["type"])
+            self.relationship_track_list.setdefault(rel_data["source"], []).append(
+                {"dest_class": rel_data["destination"], "arrow_list": arrow_line}
+            )
+            self.scene().addItem(arrow_line)
+            connected_box_list[rel_data["source"]] = source_class_obj
+            connected_box_list[rel_data["destination"]] = dest_class_obj
+        for class_box in connected_box_list.values():
+            class_box.update_box()
+
     #################################################################
     ## CONTEXT MENU ACTIONS ##
 
@@ -1292,6 +1453,7 @@ class UMLGraphicsView(QtWidgets.QGraphicsView):
 
             # CLASS MANAGEMENT OPTIONS
             self.add_context_menu_action(contextMenu, "Rename Class", self.rename_class, enabled=True)
+            self.add_context_menu_action(contextMenu, "Duplicate Class", self.duplicate_class, enabled=True)
 
             self.add_context_menu_separator(contextMenu)
 
@@ -1416,7 +1578,6 @@ class UMLGraphicsView(QtWidgets.QGraphicsView):
         item = self.itemAt(event.pos())
         if isinstance(item, UMLClassBox):
             self.selected_class = item
-            self.move_start_pos = item.pos()  # Store the initial position
         else:
             self.selected_class = None
 
@@ -1431,6 +1592,14 @@ class UMLGraphicsView(QtWidgets.QGraphicsView):
         # Call the parent class's mousePressEvent for default behavior
         super().mousePressEvent(event)
 
+        # Once the selection is updated, remember where every selected box starts, they all move together
+        if self.selected_class:
+            moving_boxes = [item for item in self.scene().selectedItems() if isinstance(item, UMLClassBox)]
+            if self.selected_class not in moving_boxes:
+                moving_boxes.append(self.selected_class)
+            self.move_start_table = {class_box: class_box.pos() for class_box in moving_boxes}
+            self.move_start_time = time.monotonic()
+
     def mouseMoveEvent(self, event):
         """
         Handles mouse move events for updating the rubber band rectangle or panning the view.
@@ -1484,19 +1653,21 @@ class UMLGraphicsView(QtWidgets.QGraphicsView):
             event.accept()
 
         if self.selected_class and event.button() == QtCore.Qt.LeftButton:
-            # Capture the new position after the move
-            new_x = self.selected_class.pos().x()
-            new_y = self.selected_class.pos().y()
-            old_x = self.move_start_pos.x()
-            old_y = self.move_start_pos.y()
-
-            # Only create and execute the command if the position has changed
-            if (new_x, new_y) != (old_x, old_y):
-                self.command_factory.class_box = self.selected_class
-                move_unit_command = self.command_factory.create_command(
-                    command_name="move_unit", old_x=old_x, old_y=old_y, new_x=new_x, new_y=new_y
+            # Capture the new position of every box that moved, the whole selection is one command
+            move_list = []
+            for class_box, start_pos in self.move_start_table.items():
+                new_x = class_box.pos().x()
+                new_y = class_box.pos().y()
+                if (new_x, new_y) != (start_pos.x(), start_pos.y()):
+                    move_list.append((class_box, start_pos.x(), start_pos.y(), new_x, new_y))
+
+            # Only create and execute the command if a position has changed
+            if move_list:
+                move_group_command = self.command_factory.create_command(
+                    command_name="move_group", move_list=move_list, start_time=self.move_start_time
                 )
-                self.input_handler.execute_command(move_unit_command)
+                self.input_handler.execute_command(move_group_command)
+            self.move_start_table = {}
                 
         self.update_all_arrow_line()
 
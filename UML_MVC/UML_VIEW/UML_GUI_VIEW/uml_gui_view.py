@@ -167,6 +167,29 @@ class MainWindow(QtWidgets.QMainWindow, Observer):
         self.export_pdf_action.triggered.connect(self.export_pdf_gui)
         self.export_png_action.triggered.connect(self.export_png_gui)
 
+        #################################################################
+        # Bring back the work of a session that crashed and journal every command from here
+        self.interface.recover_journal(self.grid_view)
+        # Autosave the active file, the timer checks for changes on the GUI thread and the writes run in the background
+        self.interface.start_autosave(is_gui=True, sync_callback=lambda: self.interface.update_positions(self.grid_view.class_name_list))
+        self.autosave_timer = QtCore.QTimer(self)
+        self.autosave_timer.timeout.connect(self.interface.poll_autosave)
+        self.autosave_timer.start(500)
+        # Size of the undo history, shown in the status bar and refreshed with the autosave timer
+        self.history_label = QtWidgets.QLabel(self)
+        self.statusBar().addPermanentWidget(self.history_label)
+        self.autosave_timer.timeout.connect(self.update_history_status)
+        self.update_history_status()
+        # History panel, one row per command, clicking a row undoes or redoes up to it
+        self.history_list_widget = QtWidgets.QListWidget(self)
+        self.history_list_widget.itemClicked.connect(self.go_to_history_gui)
+        self.history_dock = QtWidgets.QDockWidget("History", self)
+        self.history_dock.setWidget(self.history_list_widget)
+        self.addDockWidget(QtCore.Qt.RightDockWidgetArea, self.history_dock)
+        self.history_revision = None
+        self.autosave_timer.timeout.connect(self.update_history_panel)
+        self.update_history_panel()
+
     #################################################################
     ### EVENT FUNCTIONS ###
     # These functions manage events triggered by the user, such as adding/deleting UML components,
@@ -309,6 +332,40 @@ class MainWindow(QtWidgets.QMainWindow, Observer):
         """
         self.grid_view.redo()
 
+    def update_history_status(self):
+        """
+        Show the number of undoable commands and their estimated memory use in the status bar.
+        """
+        history_stats = self.interface.get_history_stats()
+        self.history_label.setText(
+            f"Undo history: {history_stats['entries']} / {history_stats['max_entries']} commands, "
+            f"~{history_stats['estimated_bytes'] / 1024:,.0f} KB"
+        )
+
+    def update_history_panel(self):
+        """
+        Rebuild the history panel, only when the history changed since the last rebuild.
+        """
+        revision = self.interface.get_history_revision()
+        if revision == self.history_revision:
+            return
+        self.history_revision = revision
+        position = self.interface.get_history_position()
+        self.history_list_widget.clear()
+        self.history_list_widget.addItem("0  Start")
+        for entry in self.interface.get_history():
+            self.history_list_widget.addItem(f"{entry['position']}  {entry['description']}")
+            if not entry["is_done"]:
+                self.history_list_widget.item(entry["position"]).setForeground(QtCore.Qt.gray)
+        self.history_list_widget.setCurrentRow(position)
+
+    def go_to_history_gui(self, item):
+        """
+        Undo or redo up to the clicked row of the history panel.
+        """
+        self.grid_view.go_to_history(self.history_list_widget.row(item))
+        self.update_history_panel()
+
     def new_file_gui(self):
         """
         End the current session and reset to the default state.
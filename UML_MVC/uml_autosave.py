@@ -0,0 +1,242 @@
+import hashlib
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict
+from UML_MVC.UML_CONTROLLER.uml_json_stream import iter_json_chunks
+
+###################################################################################################
+# Background autosave
+# The model is only ever touched on its own thread (the CLI prompt loop or the Qt event loop),
+# the autosave worker thread only ever touches snapshots. _poll runs on the model's thread: it
+# notices changes through the data version, a change counting from the poll that first sees it.
+# Once the diagram has been quiet for idle_threshold seconds and interval seconds have passed
+# since the last autosave, it takes a read-only snapshot with _get_main_data. Taking a snapshot only copies the two top-level lists,
+# the entries are shared and never modified in place, so the worker can encode, hash and write
+# it while the user keeps editing.
+#
+# The Qt event loop calls _poll from a timer. The CLI prompt loop is blocked waiting for input,
+# so there the worker polls on its own, under the model lock the prompt loop holds while it runs
+# a command; the worker only takes the lock when it is free, so it never delays a command.
+#
+# The target is the whole active file. While the model holds data that does not belong to it (an
+# SQLite database loaded, possibly only in part, see UMLModel._is_detached) the target callback
+# returns None, so a partial or unrelated diagram never replaces the active file.
+#
+# A snapshot that encodes to the same content as the last autosave is not written again.
+# Explicit saves and loads go through _suspend, which waits for a write in progress, drops
+# snapshots that were not written yet and takes the saved state as the new starting point, so an
+# autosave never overwrites a newer explicit save.
+
+class UMLAutosaveService:
+    """
+    Saves the diagram to the active file on a background thread, after bursts of edits settle down.
+    """
+
+    def __init__(self, uml_model, target_callback: Callable[[], str | None], interval: float = 30.0,
+                 idle_threshold: float = 2.0, poll_interval: float = 0.5):
+        """
+        Args:
+            uml_model: The model to save.
+            target_callback (Callable): Called on the model's thread, returns the full path to autosave to, None when there is no active file.
+            interval (float): Minimum number of seconds between two autosaves.
+            idle_threshold (float): Number of seconds without changes before an autosave, so a burst of edits is saved once.
+            poll_interval (float): Number of seconds between two checks for changes when the worker polls on its own.
+        """
+        self.__model = uml_model
+        self.__target_callback = target_callback
+        self.__interval = interval
+        self.__idle_threshold = idle_threshold
+        self.__poll_interval = poll_interval
+        # Optional callback run on the model's thread before every poll
+        self.__sync_callback: Callable[[], None] = None
+        # Held by the model's thread while it changes the model, taken by the worker to poll on its own
+        self.__model_lock = threading.RLock()
+        # Held while a file is written, by the worker and by explicit saves
+        self.__write_lock = threading.Lock()
+        # Guards the pending snapshot and wakes the worker up
+        self.__condition = threading.Condition()
+        self.__thread: threading.Thread = None
+        self.__is_self_polling = False
+        self.__is_stopping = False
+        # (generation, target path, snapshot, data version) waiting to be written
+        self.__pending_job: tuple = None
+        # Bumped by _suspend, snapshots from an older generation are dropped
+        self.__generation = 0
+        # Last data version seen by _poll and when it was first seen
+        self.__seen_version: int = None
+        self.__last_change_time = 0.0
+        # Data version on disk, or handed to the worker
+        self.__saved_version: int = None
+        self.__last_save_time = 0.0
+        # Target path and content hash of the last autosave
+        self.__last_target_path: str = None
+        self.__last_hash: bytes = None
+        self.__write_count = 0
+        self.__skip_count = 0
+
+    #################################################################
+    # Getters and setters #
+
+    def _get_model_lock(self) -> threading.RLock:
+        return self.__model_lock
+
+    def _get_write_count(self) -> int:
+        return self.__write_count
+
+    def _get_skip_count(self) -> int:
+        return self.__skip_count
+
+    def _is_running(self) -> bool:
+        return self.__thread is not None
+
+    def _set_sync_callback(self, sync_callback: Callable[[], None]):
+        """
+        Args:
+            sync_callback (Callable): Run on the model's thread before every poll, to bring state
+                the model does not track yet (the GUI box positions) into it.
+        """
+        self.__sync_callback = sync_callback
+
+    def _configure(self, interval: float = None, idle_threshold: float = None, poll_interval: float = None):
+        """
+        Changes the thresholds, the ones left as None are kept.
+        """
+        if interval is not None:
+            self.__interval = interval
+        if idle_threshold is not None:
+            self.__idle_threshold = idle_threshold
+        if poll_interval is not None:
+            self.__poll_interval = poll_interval
+        with self.__condition:
+            self.__condition.notify()
+
+    #################################################################
+    # Service #
+
+    def _start(self, is_self_polling: bool = True):
+        """
+        Starts the worker thread, the current state of the model counts as saved.
+
+        Args:
+            is_self_polling (bool): The worker polls on its own, under the model lock. Pass False when
+                the model's thread calls _poll itself, from a Qt timer.
+        """
+        if self.__thread is not None:
+            return
+        self.__is_self_polling = is_self_polling
+        self.__is_stopping = False
+        self.__reset_baseline()
+        self.__thread = threading.Thread(target=self.__run, name="UMLAutosave", daemon=True)
+        self.__thread.start()
+
+    def _stop(self, timeout: float = 5.0):
+        """
+        Stops the worker thread. A write in progress is finished, snapshots not written yet are dropped.
+        """
+        thread = self.__thread
+        if thread is None:
+            return
+        with self.__condition:
+            self.__is_stopping = True
+            self.__pending_job = None
+            self.__condition.notify()
+        thread.join(timeout)
+        self.__thread = None
+
+    def _poll(self) -> bool:
+        """
+        Runs on the model's thread. Hands a snapshot to the worker if the diagram changed, has been quiet
+        for idle_threshold seconds and the last autosave is at least interval seconds old.
+
+        Returns:
+            bool: True if a snapshot was handed to the worker, False otherwise.
+        """
+        if self.__thread is None or self.__is_stopping:
+            return False
+        if self.__sync_callback is not None:
+            self.__sync_callback()
+        now = time.monotonic()
+        version = self.__model._get_data_version()
+        if version != self.__seen_version:
+            self.__seen_version = version
+            self.__last_change_time = now
+        if version == self.__saved_version:
+            return False
+        if now - self.__last_change_time < self.__idle_threshold or now - self.__last_save_time < self.__interval:
+            return False
+        target_path = self.__target_callback()
+        if target_path is None:
+            return False
+        snapshot = self.__model._get_main_data()
+        self.__saved_version = version
+        self.__last_save_time = now
+        with self.__condition:
+            self.__pending_job = (self.__generation, target_path, snapshot, version)
+            self.__condition.notify()
+        return True
+
+    @contextmanager
+    def _suspend(self):
+        """
+        Wraps an explicit save, load or reset on the model's thread. Waits for an autosave being written,
+        drops the snapshots not written yet, and afterwards takes the state of the model as saved.
+        """
+        with self.__write_lock:
+            with self.__condition:
+                self.__generation += 1
+                self.__pending_job = None
+            try:
+                yield
+            finally:
+                self.__reset_baseline()
+
+    #################################################################
+    # Helpers #
+
+    def __reset_baseline(self):
+        version = self.__model._get_data_version()
+        self.__seen_version = version
+        self.__saved_version = version
+        self.__last_target_path = None
+        self.__last_hash = None
+
+    def __run(self):
+        while True:
+            with self.__condition:
+                if self.__pending_job is None and not self.__is_stopping:
+                    self.__condition.wait(self.__poll_interval if self.__is_self_polling else None)
+                if self.__is_stopping:
+                    return
+                job = self.__pending_job
+                self.__pending_job = None
+            if job is None and self.__is_self_polling and self.__model_lock.acquire(blocking=False):
+                # The prompt loop is waiting for input, the model is not being changed
+                try:
+                    self._poll()
+                finally:
+                    self.__model_lock.release()
+            if job is not None:
+                self.__write(*job)
+
+    def __write(self, generation: int, target_path: str, snapshot: Dict, version: int):
+        storage_manager = self.__model._get_storage_manager()
+        content_hash = hashlib.blake2b(digest_size=16)
+        for chunk in iter_json_chunks(snapshot, is_compact=True):
+            content_hash.update(chunk.encode("utf-8"))
+        content_hash = content_hash.digest()
+        with self.__write_lock:
+            if generation != self.__generation:
+                return
+            if target_path == self.__last_target_path and content_hash == self.__last_hash:
+                self.__skip_count += 1
+                return
+            if storage_manager._save_data_to_json_gui(target_path, snapshot):
+                self.__last_target_path = target_path
+                self.__last_hash = content_hash
+                self.__write_count += 1
+            elif self.__saved_version == version:
+                # Try again at the next poll
+                self.__saved_version = None
+
+###################################################################################################
@@ -38,7 +38,8 @@ class CommandFactory:
         method_num=None, param_type=None, selected_param_index=None,
         new_param_list_obj=None, new_param_list_str=None,
         source_class=None, dest_class=None,
-        rel_type=None, new_type=None, arrow_line=None
+        rel_type=None, new_type=None, arrow_line=None,
+        move_list=None, start_time=None, child_command_list=None
     ) -> Command:
         """
         Create a command object based on the provided command name and parameters.
@@ -65,6 +66,9 @@ class CommandFactory:
             rel_type (str, optional): The type of the relationship.
             new_type (str, optional): The new type for change type commands.
             arrow_line: The arrow line object in the GUI (for relationships).
+            move_list (list, optional): (class_box, old_x, old_y, new_x, new_y) for every moved box (for group moves).
+            start_time (float, optional): When the move started, from time.monotonic (for group moves).
+            child_command_list (list, optional): The commands to run as one step (for composite commands).
 
         Returns:
             Command: An instance of a command class corresponding to the command name.
@@ -79,6 +83,20 @@ class CommandFactory:
                 new_x=new_x,
                 new_y=new_y
             )
+        elif command_name == CommandType.MOVE_GROUP.value:
+            # Create a MoveGroupCommand to move every selected class box at once
+            return Command.MoveGroupCommand(
+                move_list=move_list,
+                start_time=start_time
+            )
+        elif command_name == CommandType.COMPOSITE.value:
+            # Create a CompositeCommand to run several commands as one undo step
+            return Command.CompositeCommand(
+                uml_model=self.uml_model,
+                child_command_list=child_command_list,
+                view=self.view,
+                is_gui=self.is_gui
+            )
         elif command_name == CommandType.ADD_CLASS.value:
             # Create an AddClassCommand to add a new class
             return Command.AddClassCommand(
@@ -0,0 +1,254 @@
+import json
+import os
+from typing import Dict, Tuple
+from UML_MVC.UML_MODEL.uml_change_tracker import UMLChangeTracker as ChangeTracker
+
+###################################################################################################
+# Write-ahead command journal
+# Every command executed, undone or redone through InputHandler appends one compact JSON line
+# to '<active file>.journal' holding the classes and relationships the command changed, as
+# they are after the command. Appending a line is far cheaper than saving the whole diagram,
+# so nothing done since the last save is lost when the program crashes.
+#
+# Every compaction_threshold records, the current diagram is written to '<active file>.checkpoint'
+# and the journal is emptied. A session that exits cleanly, saves or loads drops both files.
+# When they are still there on startup, the previous session crashed: the checkpoint (or the
+# active file when there is none) is read and the journal is replayed on top of it.
+#
+# Every record carries a sequence number and the checkpoint the number of the last record it
+# holds, so a crash between writing a checkpoint and emptying the journal replays nothing twice.
+# A torn last line, from a crash in the middle of an append, is ignored.
+
+JOURNAL_EXTENSION = ".journal"
+CHECKPOINT_EXTENSION = ".checkpoint"
+SEQUENCE_SECTION = "journal_sequence"
+
+class UMLCommandJournal:
+    """
+    Appends the changes of every command to a journal next to the active file, compacts it into
+    checkpoints and rebuilds the state of a crashed session from them.
+    """
+
+    def __init__(self, uml_model, compaction_threshold: int = 500):
+        """
+        Args:
+            uml_model: The model whose changes are recorded.
+            compaction_threshold (int): Number of records after which the journal is compacted into a checkpoint.
+        """
+        self.__model = uml_model
+        self.__tracker: ChangeTracker = ChangeTracker()
+        uml_model._add_change_tracker(self.__tracker)
+        self.__compaction_threshold = compaction_threshold
+        self.__base_path: str = None
+        self.__journal_file = None
+        # Number of the last record written and number of records since the last compaction
+        self.__sequence = 0
+        self.__record_count = 0
+
+    #################################################################
+    # Getters and setters #
+
+    def _get_base_path(self) -> str:
+        return self.__base_path
+
+    def _get_journal_path(self) -> str:
+        return self.__base_path + JOURNAL_EXTENSION
+
+    def _get_checkpoint_path(self) -> str:
+        return self.__base_path + CHECKPOINT_EXTENSION
+
+    def _get_record_count(self) -> int:
+        return self.__record_count
+
+    def _set_compaction_threshold(self, compaction_threshold: int):
+        self.__compaction_threshold = compaction_threshold
+
+    #################################################################
+    # Journaling #
+
+    def _start(self, base_path: str, is_recovered: bool = False):
+        """
+        Starts journaling the changes made on top of a file. The model must hold the content of the file.
+        Any journal left for the file is dropped, and so is its checkpoint unless the state was just recovered from it.
+
+        Args:
+            base_path (str): The full path of the active file.
+            is_recovered (bool): The model holds the state recovered by _recover, its checkpoint is kept as the new base.
+        """
+        self.__close_file()
+        self.__base_path = base_path
+        self.__record_count = 0
+        self.__tracker._clear()
+        if not is_recovered:
+            self.__sequence = 0
+            self.__remove(self._get_checkpoint_path())
+        self.__remove(self._get_journal_path())
+
+    def _record(self, action: str, command=None) -> bool:
+        """
+        Appends the changes made since the previous record as one line, if anything changed.
+
+        Args:
+            action (str): "execute", "undo" or "redo".
+            command (Command, optional): The command, only its class name is recorded.
+
+        Returns:
+            bool: True if a record was appended, False if the journal is not started, nothing changed or the write failed.
+        """
+        if self.__base_path is None or not self.__tracker._has_changes():
+            return False
+        changes = self.__model._collect_changes(self.__tracker)
+        record = {"sequence": self.__sequence + 1, "action": action}
+        if command is not None:
+            record["command"] = type(command).__name__
+        if changes["is_all_changed"]:
+            record["is_all_changed"] = True
+        for key in ("renamed_classes", "classes", "deleted_classes", "relationships", "deleted_relationships"):
+            value = list(changes[key])
+            if value:
+                record[key] = value
+        try:
+            if self.__journal_file is None:
+                self.__journal_file = open(self._get_journal_path(), "a", encoding="utf-8")
+            self.__journal_file.write(json.dumps(record, separators=(",", ":")) + "\n")
+            self.__journal_file.flush()
+        except OSError:
+            print(f"\nError writing to {self._get_journal_path()}.")
+            self.__close_file()
+            # The changes are lost to the journal, the next record holds the whole diagram
+            self.__tracker._clear(is_all_changed=True)
+            return False
+        self.__sequence += 1
+        self.__record_count += 1
+        if self.__record_count >= self.__compaction_threshold:
+            self._compact()
+        return True
+
+    def _compact(self) -> bool:
+        """
+        Writes the current diagram as the checkpoint, replacing the previous one atomically, and empties the journal.
+
+        Returns:
+            bool: True if the journal was compacted, False if the checkpoint could not be written; the journal is kept then.
+        """
+        if self.__base_path is None:
+            return False
+        storage_manager = self.__model._get_storage_manager()
+        # Main data keeps renamed classes in their place, like the replay does
+        main_data = self.__model._get_main_data()
+        section_table = {SEQUENCE_SECTION: self.__sequence, "classes": main_data["classes"], "relationships": main_data["relationships"]}
+        if not storage_manager._write_json_atomic(self._get_checkpoint_path(), section_table):
+            return False
+        self.__close_file()
+        self.__remove(self._get_journal_path())
+        self.__record_count = 0
+        return True
+
+    def _close(self, is_discarded: bool = False):
+        """
+        Stops journaling.
+
+        Args:
+            is_discarded (bool): Also delete the journal and checkpoint, for a clean exit.
+        """
+        self.__close_file()
+        if is_discarded and self.__base_path is not None:
+            self.__remove(self._get_journal_path())
+            self.__remove(self._get_checkpoint_path())
+        self.__base_path = None
+
+    #################################################################
+    # Recovery #
+
+    def _recover(self, base_path: str) -> str | None:
+        """
+        Rebuilds the state a crashed session left for a file: reads its checkpoint, or the file itself when
+        there is none, replays the journal on top of it and writes the result as the new checkpoint.
+        Load the returned checkpoint into the model, then call _start(base_path, is_recovered=True).
+
+        Args:
+            base_path (str): The full path of the active file.
+
+        Returns:
+            str: The path of the checkpoint holding the recovered state.
+            None: If there is nothing to recover.
+        """
+        journal_path = base_path + JOURNAL_EXTENSION
+        checkpoint_path = base_path + CHECKPOINT_EXTENSION
+        if not os.path.isfile(journal_path) and not os.path.isfile(checkpoint_path):
+            return None
+        storage_manager = self.__model._get_storage_manager()
+        class_table: Dict[str, Dict] = {}
+        relationship_table: Dict[Tuple[str, str], Dict] = {}
+        sequence = 0
+        source_path = checkpoint_path if os.path.isfile(checkpoint_path) else base_path
+        if os.path.isfile(source_path):
+            try:
+                for section, entry in storage_manager._load_records_from_json_gui(source_path):
+                    if section == "classes":
+                        class_table[entry["name"]] = entry
+                    elif section == "relationships":
+                        relationship_table[(entry["source"], entry["destination"])] = entry
+                    elif section == SEQUENCE_SECTION:
+                        sequence = entry
+            except json.JSONDecodeError:
+                print(f"\nError decoding JSON from {source_path}.")
+                return None
+        if os.path.isfile(journal_path):
+            with open(journal_path, "r", encoding="utf-8") as journal_file:
+                for line in journal_file:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn write at the end of the journal
+                        break
+                    if record["sequence"] <= sequence:
+                        continue
+                    _apply_record(class_table, relationship_table, record)
+                    sequence = record["sequence"]
+        section_table = {SEQUENCE_SECTION: sequence, "classes": list(class_table.values()),
+                         "relationships": list(relationship_table.values())}
+        if not storage_manager._write_json_atomic(checkpoint_path, section_table):
+            return None
+        self.__remove(journal_path)
+        self.__sequence = sequence
+        return checkpoint_path
+
+    #################################################################
+    # Helpers #
+
+    def __close_file(self):
+        if self.__journal_file is not None:
+            self.__journal_file.close()
+            self.__journal_file = None
+
+    @staticmethod
+    def __remove(file_path: str):
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            print(f"\nError removing {file_path}.")
+
+# Replay one journal record on the classes and relationships of a diagram #
+def _apply_record(class_table: Dict[str, Dict], relationship_table: Dict[Tuple[str, str], Dict], record: Dict):
+    if record.get("is_all_changed"):
+        class_table.clear()
+        relationship_table.clear()
+    for current_name, new_name in record.get("renamed_classes", ()):
+        if current_name in class_table and new_name not in class_table:
+            # Keep the renamed class in its place
+            item_list = [(new_name if class_name == current_name else class_name, entry) for class_name, entry in class_table.items()]
+            class_table.clear()
+            class_table.update(item_list)
+    for class_name in record.get("deleted_classes", ()):
+        class_table.pop(class_name, None)
+    for entry in record.get("classes", ()):
+        class_table[entry["name"]] = entry
+    for source, destination in record.get("deleted_relationships", ()):
+        relationship_table.pop((source, destination), None)
+    for entry in record.get("relationships", ()):
+        relationship_table[(entry["source"], entry["destination"])] = entry
+
+###################################################################################################
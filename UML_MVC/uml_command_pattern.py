@@ -1,6 +1,12 @@
+import sys
+import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from UML_MVC.UML_VIEW.UML_GUI_VIEW.uml_gui_arrow_line import UMLArrow as ArrowLine
 
+# Attributes shown by Command._describe, in this order
+DESCRIBED_ATTRIBUTE_LIST = ("class_name", "source_class", "dest_class", "field_name", "method_name", "new_name", "new_type", "rel_type")
+
 class Command(ABC):
     """
     Abstract base class for the Command pattern.
@@ -31,6 +37,33 @@ class Command(ABC):
             bool: True if the command was undone successfully, False otherwise.
         """
         pass
+
+    def _merge(self, command) -> bool:
+        """
+        Folds a command executed right after this one into this one, so both are undone in one step.
+
+        Parameters:
+            command (Command): The command that was just executed.
+
+        Returns:
+            bool: True if the command was folded into this one, False to keep it as a separate step.
+        """
+        return False
+
+    def _is_model_only(self) -> bool:
+        """
+        Returns:
+            bool: True if the command only changes the model, so restoring a checkpoint of the model undoes it.
+        """
+        return not getattr(self, "is_gui", False)
+
+    def _describe(self) -> str:
+        """
+        Returns:
+            str: A short description for the history, the kind of command and the names it works on.
+        """
+        name_list = [str(value) for value in (getattr(self, attribute, None) for attribute in DESCRIBED_ATTRIBUTE_LIST) if value is not None]
+        return " ".join([type(self).__name__.removesuffix("Command")] + name_list)
         
 class MoveUnitCommand(Command):
     """
@@ -85,7 +118,85 @@ class MoveUnitCommand(Command):
             self.class_box.update_box()
             return True
         return False
+
+    def _is_model_only(self) -> bool:
+        return False
         
+# Moves of the same boxes closer together than this many seconds are undone in one step
+MOVE_MERGE_WINDOW = 1.5
+
+class MoveGroupCommand(Command):
+    """
+    Command to move several UML class boxes at once, such as a rubber band selection.
+
+    This command records the old and new position of every box that moved in a single entry,
+    so the whole move is undone in one step. A move of the same boxes that starts shortly after
+    this one ended is merged into it, so a series of small nudges is one undo step too.
+    """
+
+    def __init__(self, move_list, start_time=None):
+        """
+        Initialize the MoveGroupCommand.
+
+        Parameters:
+            move_list (list): (class_box, old_x, old_y, new_x, new_y) for every box that moved.
+            start_time (float, optional): When the move started, from time.monotonic. Defaults to now.
+        """
+        self.move_list = [list(move) for move in move_list]
+        # When the move started and ended, to tell whether the next move follows on from this one
+        self.end_time = time.monotonic()
+        self.start_time = self.end_time if start_time is None else start_time
+
+    def execute(self, is_undo_or_redo=False):
+        """
+        Execute the move command by setting the new position of every class box.
+
+        Parameters:
+            is_undo_or_redo (bool): Indicates if the command is part of an undo or redo operation.
+
+        Returns:
+            bool: True if the move was successful, False if there was nothing to move.
+        """
+        for class_box, _, _, new_x, new_y in self.move_list:
+            class_box.setPos(new_x, new_y)
+            class_box.update_box()
+        return len(self.move_list) > 0
+
+    def undo(self):
+        """
+        Undo the move command by putting every class box back to its original position.
+
+        Returns:
+            bool: True if the undo was successful, False if there was nothing to move.
+        """
+        for class_box, old_x, old_y, _, _ in self.move_list:
+            class_box.setPos(old_x, old_y)
+            class_box.update_box()
+        return len(self.move_list) > 0
+
+    def _merge(self, command) -> bool:
+        """
+        Merges a move of the same boxes that started within MOVE_MERGE_WINDOW seconds of the end of this one.
+        The boxes keep their original positions from this command and take the new ones from the other.
+        """
+        if not isinstance(command, MoveGroupCommand) or command.start_time - self.end_time > MOVE_MERGE_WINDOW:
+            return False
+        move_table = {id(move[0]): move for move in self.move_list}
+        if len(move_table) != len(command.move_list) or any(id(move[0]) not in move_table for move in command.move_list):
+            return False
+        for class_box, _, _, new_x, new_y in command.move_list:
+            move = move_table[id(class_box)]
+            move[3] = new_x
+            move[4] = new_y
+        self.end_time = command.end_time
+        return True
+
+    def _is_model_only(self) -> bool:
+        return False
+
+    def _describe(self) -> str:
+        return f"MoveGroup {len(self.move_list)} box(es)"
+
 class AddClassCommand(Command):
     """
     Command to add a new UML class to the model and, if applicable, to the GUI.
@@ -179,7 +290,8 @@ class DeleteClassCommand(Command):
     Command to delete a UML class from the model and GUI.
 
     This command encapsulates the action of deleting a class from the UML model.
-    It stores the state before deletion to allow undoing the deletion.
+    It stores the class, its members and the relationships it takes part in before deletion,
+    and nothing else from the diagram, to allow undoing the deletion.
     """
 
     def __init__(self, uml_model, class_name, view=None, class_box=None, is_gui=False):
@@ -199,14 +311,14 @@ class DeleteClassCommand(Command):
         self.view = view
         self.class_box = class_box
         self.is_gui = is_gui
-        self.cli_class_list = None
-        self.cli_main_data = None
+        # The class and its incident relationships as returned by UMLModel._get_class_delta
+        self.class_delta = None
 
         # Store the state of the class before deletion
         self.stored_fields = []          # List of tuples: (field_type, field_name)
         self.stored_methods = []         # List of tuples: (method_type, method_name)
         self.stored_parameters = {}      # Dict: {method_key: [(param_type, param_name), ...]}
-        self.stored_relationships = {}   # Dictionary of relationships
+        self.stored_relationships = []   # List of incident relationships: {"source", "destination", "type"}
 
     def execute(self, is_undo_or_redo=False):
         """
@@ -218,15 +330,17 @@ class DeleteClassCommand(Command):
         Returns:
             bool: True if the class was deleted successfully, False otherwise.
         """
-        self.cli_main_data = self.uml_model._get_main_data()
+        self.class_delta = self.uml_model._get_class_delta(self.class_name)
         if self.is_gui:
-            # Store relationships
-            self.stored_relationships = self.view.relationship_track_list.copy()
+            # Store the relationships of this class only
+            self.stored_relationships = list(self.class_delta["relationships"]) if self.class_delta else []
             
             # Store all fields before deletion
             self.stored_fields = list(self.class_box.field_list.keys())
 
             # Store all methods and their parameters before deletion
+            self.stored_methods = []
+            self.stored_parameters = {}
             for method_entry in self.class_box.method_list:
                 method_key = method_entry["method_key"]
                 self.stored_methods.append(method_key)
@@ -267,7 +381,7 @@ class DeleteClassCommand(Command):
             self.class_box.field_key_list = []
             self.class_box.method_list = []
             self.class_box.param_num = 0
-            self.view.relationship_track_list = {}
+            self.__untrack_relationships()
             self.view.class_name_list.pop(self.class_name, None)
 
         # Delete the class from the model
@@ -338,117 +452,56 @@ class DeleteClassCommand(Command):
                     )
                     add_param_command.execute(is_undo_or_redo=True)
 
-            # Restore all relationships (arrow lines)
-            for source_class_str, arrow_list in self.stored_relationships.items():
-                source_class_obj = self.view.class_name_list.get(source_class_str)
-                if not source_class_obj:
-                    continue  # Skip if source class doesn't exist
-
-                for relationship in arrow_list:
-                    dest_class_str = relationship["dest_class"]
-                    arrow_line = relationship["arrow_list"]
-                    
-                    dest_class_obj = self.view.class_name_list.get(dest_class_str)
-                    if not dest_class_obj:
-                        continue  # Skip if destination class doesn't exist
-
-                    source_class_box = source_class_obj  
+            # Restore the relationships (arrow lines) this class took part in
+            for relationship in self.stored_relationships:
+                source_class_box = self.view.class_name_list.get(relationship["source"])
+                if not source_class_box or relationship["destination"] not in self.view.class_name_list:
+                    continue  # Skip if the other class doesn't exist anymore
 
-                    # Instantiate the AddRelationshipCommand
-                    add_relationship_command = AddRelationshipCommand(
-                        uml_model=self.uml_model,
-                        source_class=source_class_str,
-                        dest_class=dest_class_str,
-                        rel_type=arrow_line.arrow_type,
-                        view=self.view,
-                        class_box=source_class_box,
-                        is_gui=True
-                    )
-                    add_relationship_command.execute(is_undo_or_redo=True)
+                # Instantiate the AddRelationshipCommand
+                add_relationship_command = AddRelationshipCommand(
+                    uml_model=self.uml_model,
+                    source_class=relationship["source"],
+                    dest_class=relationship["destination"],
+                    rel_type=relationship["type"],
+                    view=self.view,
+                    class_box=source_class_box,
+                    is_gui=True
+                )
+                add_relationship_command.execute(is_undo_or_redo=True)
         else:
-            # For CLI mode, re-add the class and its components
-            if self.class_name in self.uml_model._get_class_list():
+            # For CLI mode, put the class and its relationships straight back into the model
+            if self.class_delta is None or not self.uml_model._restore_class(self.class_delta, is_undo_or_redo=True):
                 return False
-            main_data = self.cli_main_data
-            class_data = main_data["classes"]
-            relationship_data = main_data["relationships"]
-            extracted_class_data = self.uml_model._extract_class_data(class_data)
-
-            for each_pair in extracted_class_data:
-                for class_name, data in each_pair.items():
-                    field_list = data["fields"]
-                    method_list = data["method_list"]
-
-                    if class_name != self.class_name:
-                        continue
-                    add_class_command = AddClassCommand(
-                        uml_model=self.uml_model,
-                        class_name=self.class_name,
-                        view=self.view,
-                        class_box=self.class_box,
-                    )
-                    add_class_command.execute(is_undo_or_redo=True)
-                    
-                    for each_field in field_list:
-                        field_name = each_field["name"]
-                        field_type = each_field["type"]
-                        add_field_command = AddFieldCommand(
-                            uml_model=self.uml_model,
-                            class_name=self.class_name,
-                            type=field_type,
-                            field_name=field_name,
-                            view=self.view,
-                            class_box=self.class_box,
-                        )
-                        add_field_command.execute(is_undo_or_redo=True)
-                            
-                    method_num = "0"
-                    i = 0
-                    for each_element in method_list:
-                        i += 1
-                        method_num = f"{i}"
-                        method_name = each_element["name"]
-                        return_type = each_element["return_type"]
-                        parameter_list = each_element["params"]
-                        
-                        add_method_command = AddMethodCommand(
-                            uml_model=self.uml_model,
-                            class_name=self.class_name,
-                            type=return_type,
-                            method_name=method_name,
-                            view=self.view,
-                            class_box=self.class_box,
-                        )
-                        add_method_command.execute(is_undo_or_redo=True)
-                            
-                        for param in parameter_list:
-                            param_type = param["type"]
-                            param_name = param["name"]
-                            add_param_command = AddParameterCommand(
-                                uml_model=self.uml_model,
-                                class_name=self.class_name,
-                                method_num=method_num,
-                                param_type=param_type,
-                                param_name=param_name,
-                                view=self.view,
-                                class_box=self.class_box,
-                            )
-                            add_param_command.execute(is_undo_or_redo=True)
-                                
-            # Recreate relationships from the loaded data
-            for each_dictionary in relationship_data:
-                if each_dictionary["source"] == self.class_name:
-                    self.uml_model._add_relationship(each_dictionary["source"], each_dictionary["destination"], each_dictionary["type"], is_loading=True, is_gui=False)
-                if each_dictionary["destination"] == self.class_name:
-                    self.uml_model._add_relationship(each_dictionary["source"], each_dictionary["destination"], each_dictionary["type"], is_loading=True, is_gui=False)
                 
         # Clear stored data
         self.stored_fields = []
         self.stored_methods = []
         self.stored_parameters = {}
-        self.stored_relationships = {}
+        self.stored_relationships = []
+        self.class_delta = None
         return True
 
+    def __untrack_relationships(self):
+        """
+        Removes the relationships of the deleted class from the view's relationship tracker,
+        leaving the relationships between other classes tracked.
+        """
+        relationship_track_list = self.view.relationship_track_list
+        relationship_track_list.pop(self.class_name, None)
+        for relationship in self.stored_relationships:
+            source_class = relationship["source"]
+            if source_class == self.class_name:
+                continue
+            tracked_list = relationship_track_list.get(source_class)
+            if tracked_list is None:
+                continue
+            tracked_list[:] = [value for value in tracked_list if value["dest_class"] != self.class_name]
+            if not tracked_list:
+                source_class_box = self.view.class_name_list.get(source_class)
+                if source_class_box is not None:
+                    source_class_box.is_source_class = False
+
 class RenameClassCommand(Command):
     """
     Command to rename an existing UML class in the model and GUI.
@@ -1539,10 +1592,8 @@ class ChangeTypeCommand(Command):
         self.is_method = is_method
         self.is_param = is_param
         self.is_rel = is_rel
-        self.original_field_type = None  # Will be set during execution
-        self.original_method_type = None
-        self.original_param_type = None
-        self.original_rel_type = None
+        # The type before the change, set during execution; all undo needs, whatever the size of the diagram
+        self.original_type = None
         self.is_gui = is_gui
 
     def execute(self, is_undo_or_redo=False):
@@ -1561,7 +1612,7 @@ class ChangeTypeCommand(Command):
             chosen_field = self.uml_model._get_chosen_field_or_method(self.class_name, self.input_name, is_field=True)
             if chosen_field is not None:
                 # Store the original field type for undo
-                self.original_field_type = chosen_field._get_type()
+                self.original_type = chosen_field._get_type()
                 # Change the field's data type in the model
                 is_field_type_changed = self.uml_model._change_data_type(
                     class_name=self.class_name,
@@ -1600,7 +1651,7 @@ class ChangeTypeCommand(Command):
             chosen_method = self.uml_model._get_method_based_on_index(self.class_name, self.method_num)
             if chosen_method is not None:
                 # Store the original method return type for undo
-                self.original_method_type = chosen_method._get_type()
+                self.original_type = chosen_method._get_type()
                 # Change the method's return type in the model
                 is_method_return_type_changed = self.uml_model._change_data_type(
                     class_name=self.class_name,
@@ -1648,7 +1699,7 @@ class ChangeTypeCommand(Command):
             if chosen_param is None:
                 return False
             # Store the original parameter type for undo
-            self.original_param_type = chosen_param._get_type()
+            self.original_type = chosen_param._get_type()
             # Change the parameter's data type in the model
             is_param_type_changed = self.uml_model._change_data_type(
                 class_name=self.class_name,
@@ -1674,7 +1725,7 @@ class ChangeTypeCommand(Command):
         elif self.is_rel:
             # Handle changing the type of a relationship
             # Store the original relationship type for undo
-            self.original_rel_type = self.uml_model._get_rel_type(self.source_class, self.dest_class)
+            self.original_type = self.uml_model._get_rel_type(self.source_class, self.dest_class)
             # Change the relationship type in the model
             is_rel_type_changed = self.uml_model._change_data_type(
                 source_class=self.source_class,
@@ -1724,7 +1775,7 @@ class ChangeTypeCommand(Command):
             bool: True if the undo was successful, False otherwise.
         """
         # Restore the original type based on which element was changed
-        if self.is_field and self.original_field_type:
+        if self.is_field and self.original_type:
             # Handle restoring the data type of a field
             chosen_field = self.uml_model._get_chosen_field_or_method(self.class_name, self.input_name, is_field=True)
             if chosen_field is not None:
@@ -1732,7 +1783,7 @@ class ChangeTypeCommand(Command):
                 is_field_type_changed = self.uml_model._change_data_type(
                     class_name=self.class_name,
                     input_name=self.input_name,
-                    new_type=self.original_field_type,
+                    new_type=self.original_type,
                     is_field=True,
                     is_undo_or_redo=True
                 )
@@ -1750,20 +1801,20 @@ class ChangeTypeCommand(Command):
                             self.class_box.scene().removeItem(popped_item)
                     # Create a new text item with the original type
                     field_text = self.class_box.create_text_item(
-                        f"{self.original_field_type} {self.input_name}",
+                        f"{self.original_type} {self.input_name}",
                         is_field=True,
                         selectable=False,
                         color=self.class_box.text_color
                     )
                     # Update the internal field lists with the original field
-                    field_key = (self.original_field_type, self.input_name)
+                    field_key = (self.original_type, self.input_name)
                     self.class_box.field_list[field_key] = field_text
                     self.class_box.field_key_list.insert(self.position, field_key)
                     # Refresh the UML box to reflect changes
                     self.class_box.update_box()
                 return is_field_type_changed
 
-        elif self.is_method and self.original_method_type:
+        elif self.is_method and self.original_type:
             # Handle restoring the return type of a method
             chosen_method = self.uml_model._get_method_based_on_index(self.class_name, self.method_num)
             if chosen_method is not None:
@@ -1771,7 +1822,7 @@ class ChangeTypeCommand(Command):
                 is_method_return_type_changed = self.uml_model._change_data_type(
                     class_name=self.class_name,
                     method_num=self.method_num,
-                    new_type=self.original_method_type,
+                    new_type=self.original_type,
                     is_method=True,
                     is_undo_or_redo=True
                 )
@@ -1787,13 +1838,13 @@ class ChangeTypeCommand(Command):
                     current_param_list = method_entry["parameters"]
                     # Create a new method text item with the original return type
                     new_method_text = self.class_box.create_text_item(
-                        f"{self.original_method_type} {method_key[1]}()",
+                        f"{self.original_type} {method_key[1]}()",
                         is_method=True,
                         selectable=False,
                         color=self.class_box.text_color
                     )
                     # Create a new method entry with the original type
-                    new_method_key = (self.original_method_type, method_key[1])
+                    new_method_key = (self.original_type, method_key[1])
                     method_entry = {
                         "method_key": new_method_key,
                         "method_text": new_method_text,
@@ -1808,14 +1859,14 @@ class ChangeTypeCommand(Command):
                     self.class_box.update_box()
                 return is_method_return_type_changed
 
-        elif self.is_param and self.original_param_type:
+        elif self.is_param and self.original_type:
             # Handle restoring the data type of a parameter
             # Change the parameter's data type back to the original type in the model
             is_param_type_changed = self.uml_model._change_data_type(
                 class_name=self.class_name,
                 method_num=self.method_num,
                 input_name=self.input_name,
-                new_type=self.original_param_type,
+                new_type=self.original_type,
                 is_param=True,
                 is_undo_or_redo=True
             )
@@ -1826,19 +1877,19 @@ class ChangeTypeCommand(Command):
                     if param_tuple[1] != self.input_name:
                         continue
                     # Restore the parameter type to the original type
-                    method_entry["parameters"][i] = (self.original_param_type, param_tuple[1])
+                    method_entry["parameters"][i] = (self.original_type, param_tuple[1])
                     break
                 # Refresh the UML box to reflect changes
                 self.class_box.update_box()
             return is_param_type_changed
 
-        elif self.is_rel and self.original_rel_type:
+        elif self.is_rel and self.original_type:
             # Handle restoring the type of a relationship
             # Change the relationship type back to the original type in the model
             is_rel_type_changed = self.uml_model._change_data_type(
                 source_class=self.source_class,
                 dest_class=self.dest_class,
-                new_type=self.original_rel_type,
+                new_type=self.original_type,
                 is_rel=True,
                 is_undo_or_redo=True
             )
@@ -1861,7 +1912,7 @@ class ChangeTypeCommand(Command):
                 # Create a new arrow line with the original type
                 source_class_obj = self.class_box
                 dest_class_obj = self.view.class_name_list[self.dest_class]
-                self.arrow_line = ArrowLine(source_class_obj, dest_class_obj, self.original_rel_type)
+                self.arrow_line = ArrowLine(source_class_obj, dest_class_obj, self.original_type)
                 # Track the restored relationship in the view
                 value = {"dest_class": self.dest_class, "arrow_list": self.arrow_line}
                 if self.source_class not in self.view.relationship_track_list:
@@ -1876,24 +1927,394 @@ class ChangeTypeCommand(Command):
         # Return False if none of the conditions were met
         return False
 
+class CompositeCommand(Command):
+    """
+    Command that runs several commands as one, such as adding a class with all its members.
+
+    The children are executed in order inside a single model batch, so main data is rebuilt and
+    observers are notified once, and undone in reverse order as one undo step. In the GUI the view
+    is repainted once at the end instead of after every child.
+    """
+
+    def __init__(self, uml_model, child_command_list, view=None, is_gui=False):
+        """
+        Initialize the CompositeCommand.
+
+        Parameters:
+            uml_model: The UML model the children operate on.
+            child_command_list (list): The commands to run, in order.
+            view (UMLGraphicsView, optional): The view to repaint once the children ran.
+            is_gui (bool): Flag indicating whether the command is for GUI mode.
+        """
+        self.uml_model = uml_model
+        self.child_command_list = list(child_command_list)
+        self.view = view
+        self.is_gui = is_gui
+
+    def execute(self, is_undo_or_redo=False):
+        """
+        Execute every child in order. If a child fails, the composite is applied entirely or not at all:
+        the model is rolled back and the notifications held by the batch are dropped, so observers hear
+        nothing. GUI children are undone first, to take their boxes and arrows off the canvas.
+
+        Parameters:
+            is_undo_or_redo (bool): Indicates if the command is part of an undo or redo operation.
+
+        Returns:
+            bool: True if every child was executed successfully, False otherwise.
+        """
+        # A rollback undoes the outermost batch, inside someone else's batch the children are undone instead
+        is_outermost = not self.uml_model._is_in_batch()
+        with self.__single_refresh():
+            self.uml_model._begin_batch()
+            executed_list = []
+            try:
+                for child_command in self.child_command_list:
+                    if not child_command.execute(is_undo_or_redo=is_undo_or_redo):
+                        break
+                    executed_list.append(child_command)
+            except BaseException:
+                self.uml_model._rollback_batch()
+                raise
+            if len(executed_list) == len(self.child_command_list):
+                self.uml_model._commit_batch()
+                return len(executed_list) > 0
+            if not is_outermost or not self._is_model_only():
+                for executed_command in reversed(executed_list):
+                    executed_command.undo()
+            if is_outermost:
+                self.uml_model._rollback_batch()
+            else:
+                self.uml_model._commit_batch()
+            return False
+
+    def undo(self):
+        """
+        Undo every child in reverse order.
+
+        Returns:
+            bool: True if every child was undone successfully, False otherwise.
+        """
+        is_undone = True
+        with self.__single_refresh(), self.uml_model._batch():
+            for child_command in reversed(self.child_command_list):
+                if child_command.undo() is False:
+                    is_undone = False
+        return is_undone
+
+    def _is_model_only(self) -> bool:
+        return all(child_command._is_model_only() for child_command in self.child_command_list)
+
+    def _describe(self) -> str:
+        return f"Composite {len(self.child_command_list)} command(s)"
+
+    @contextmanager
+    def __single_refresh(self):
+        """
+        Holds back repaints of the view while the children run and repaints it once afterwards.
+        """
+        if not self.is_gui or self.view is None:
+            yield
+            return
+        self.view.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.view.setUpdatesEnabled(True)
+            self.view.viewport().update()
+
+###################################################################################################
+# Undo history budget
+# Every command stays in the history until it is evicted, with whatever it stored to undo itself
+# (deleted classes, relationship lists, GUI items). The history keeps an approximate cost in bytes
+# for every command, measured once it has run: plain data (dicts, lists, strings, numbers) is sized
+# with sys.getsizeof, commands held by a command are measured the same way, every other object
+# (a class box, an arrow) counts as OBJECT_COST, and the model and view every command points to
+# are shared with the diagram and not counted. Past max_entries commands or max_bytes estimated
+# bytes, the oldest commands are dropped; the last command done is always kept, and commands
+# undone but not redone yet are never dropped.
+
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+OBJECT_COST = 2048
+SHARED_ATTRIBUTE_SET = frozenset(("uml_model", "view"))
+PLAIN_SCALAR_TYPES = (str, bytes, int, float, bool, type(None))
+PLAIN_CONTAINER_TYPES = (dict, list, tuple, set, frozenset)
+
+# Approximate number of bytes a command keeps alive, the commands it holds included #
+def estimate_command_size(command, visited_id_set: set = None) -> int:
+    if visited_id_set is None:
+        visited_id_set = set()
+    size = sys.getsizeof(command)
+    for attribute, value in vars(command).items():
+        if attribute not in SHARED_ATTRIBUTE_SET:
+            size += _estimate_size(value, visited_id_set)
+    return size
+
+def _estimate_size(value, visited_id_set: set) -> int:
+    if isinstance(value, PLAIN_SCALAR_TYPES):
+        return sys.getsizeof(value)
+    if id(value) in visited_id_set:
+        return 0
+    visited_id_set.add(id(value))
+    if isinstance(value, Command):
+        return estimate_command_size(value, visited_id_set)
+    if not isinstance(value, PLAIN_CONTAINER_TYPES):
+        return OBJECT_COST
+    # Walk nested data with a stack, a deep diagram must not hit the recursion limit
+    size = 0
+    stack = [value]
+    while stack:
+        container = stack.pop()
+        size += sys.getsizeof(container)
+        item_iter = (item for pair in container.items() for item in pair) if isinstance(container, dict) else container
+        for item in item_iter:
+            if isinstance(item, PLAIN_SCALAR_TYPES):
+                size += sys.getsizeof(item)
+            elif id(item) not in visited_id_set:
+                visited_id_set.add(id(item))
+                if isinstance(item, PLAIN_CONTAINER_TYPES):
+                    stack.append(item)
+                elif isinstance(item, Command):
+                    size += estimate_command_size(item, visited_id_set)
+                else:
+                    size += OBJECT_COST
+    return size
+
+###################################################################################################
+# History timeline
+# Going to entry N of the history would mean undoing or redoing every command in between. Every
+# checkpoint_interval commands, InputHandler also keeps a checkpoint of the model, taken with
+# UMLModel._create_checkpoint, which shares everything that did not change with the model. _go_to
+# restores the checkpoint closest below N and replays only the commands after it, when that is
+# fewer steps than undoing back to N, all in one model batch that observers hear about as a single
+# LOAD event. Checkpoints are only used to go back: a command counted as done must have run, since
+# what it stored to undo itself may have been cleared by an earlier undo, while a command left
+# undone without running its undo is still redone correctly, redoing runs it again from the model.
+# Checkpoints only hold the model, not the canvas, so only model-only commands (the CLI commands)
+# are checkpointed and a checkpoint is only used when every command in between is model-only.
+# GUI commands are never checkpointed: a GUI history jump steps through the commands one by one,
+# still in one model batch with one journal record. Checkpoints count towards the memory budget
+# and are dropped before any command. A change made to the model outside the history (a load, a
+# reset) drops every checkpoint.
+
+DEFAULT_CHECKPOINT_INTERVAL = 50
+
 class InputHandler:
     """
     Handles the execution of commands and manages the undo/redo stack.
 
     This class maintains a list of executed commands and a pointer to the current position.
-    It provides methods to execute commands, undo, and redo actions.
+    It provides methods to execute commands, undo, and redo actions, and to go to any entry of the
+    history at once. The oldest commands are dropped once the history goes over its entry or memory budget.
     """
 
-    def __init__(self):
+    def __init__(self, journal=None, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES,
+                 uml_model=None, checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL):
         """
         Initialize the InputHandler.
 
+        Parameters:
+            journal (UMLCommandJournal, optional): Records the changes of every command, undo and redo for crash recovery.
+            max_entries (int): Maximum number of commands kept in the history.
+            max_bytes (int): Maximum estimated number of bytes the commands in the history keep alive.
+            uml_model (UMLModel, optional): The model the commands change, needed for checkpoints and to go to an entry in one batch.
+            checkpoint_interval (int): Number of commands between two checkpoints of the model.
+
         Attributes:
             command_list (list): The list of executed commands.
             pointer (int): The index of the current command in the command_list.
         """
         self.command_list = []
         self.pointer = -1  # Start before the first command
+        self.journal = journal
+        self.__max_entries = max_entries
+        self.__max_bytes = max_bytes
+        # Estimated size of every command in command_list, and their sum
+        self.__cost_list = []
+        self.__total_cost = 0
+        self.__evicted_count = 0
+        self.__model = uml_model
+        self.__checkpoint_interval = checkpoint_interval
+        # Number of commands done -> (checkpoint of the model once they were done, estimated size)
+        self.__checkpoint_table = {}
+        # Data version of the model after the last change made through the history
+        self.__model_version = uml_model._get_data_version() if uml_model is not None else None
+        # Bumped on every change of the history, so a view only rebuilds its list when it changed
+        self.__revision = 0
+
+    #################################################################
+    # History budget #
+
+    def _get_history_stats(self) -> dict:
+        """
+        Returns:
+            dict: The number of commands kept ("entries"), how many can be undone ("undo_entries")
+                and redone ("redo_entries"), their estimated size with the checkpoints ("estimated_bytes"), the budget
+                ("max_entries", "max_bytes"), the number of commands dropped so far ("evicted_entries")
+                and of model checkpoints ("checkpoints").
+        """
+        return {
+            "entries": len(self.command_list),
+            "undo_entries": self.pointer + 1,
+            "redo_entries": len(self.command_list) - self.pointer - 1,
+            "estimated_bytes": self.__total_cost,
+            "max_entries": self.__max_entries,
+            "max_bytes": self.__max_bytes,
+            "evicted_entries": self.__evicted_count,
+            "checkpoints": len(self.__checkpoint_table),
+        }
+
+    def _set_budget(self, max_entries: int = None, max_bytes: int = None):
+        """
+        Changes the budget, the limits left as None are kept. Commands over the new budget are dropped right away.
+        """
+        if max_entries is not None:
+            self.__max_entries = max_entries
+        if max_bytes is not None:
+            self.__max_bytes = max_bytes
+        self.__evict()
+
+    def __evict(self):
+        # Checkpoints only save time, they go first, from the oldest
+        for position in sorted(self.__checkpoint_table):
+            if self.__total_cost <= self.__max_bytes:
+                break
+            self.__drop_checkpoint(position)
+        # Only commands done and not the last one done can go, from the oldest
+        excess_count = len(self.command_list) - self.__max_entries
+        total_cost = self.__total_cost
+        evict_count = 0
+        while evict_count < self.pointer and (evict_count < excess_count or total_cost > self.__max_bytes):
+            total_cost -= self.__cost_list[evict_count]
+            evict_count += 1
+        if evict_count == 0:
+            return
+        del self.command_list[:evict_count]
+        del self.__cost_list[:evict_count]
+        self.__total_cost = total_cost
+        self.pointer -= evict_count
+        self.__evicted_count += evict_count
+        # Positions count from the oldest command kept
+        for position in [position for position in self.__checkpoint_table if position < evict_count]:
+            self.__drop_checkpoint(position)
+        self.__checkpoint_table = {position - evict_count: entry for position, entry in self.__checkpoint_table.items()}
+        self.__revision += 1
+
+    def __update_cost(self, index: int):
+        cost = estimate_command_size(self.command_list[index])
+        self.__total_cost += cost - self.__cost_list[index]
+        self.__cost_list[index] = cost
+
+    def __drop_checkpoint(self, position: int):
+        if position in self.__checkpoint_table:
+            self.__total_cost -= self.__checkpoint_table.pop(position)[1]
+
+    #################################################################
+    # History timeline #
+
+    def _get_revision(self) -> int:
+        return self.__revision
+
+    def _get_position(self) -> int:
+        """
+        Returns:
+            int: The number of commands done, the entry the history is at (0 before the first command).
+        """
+        return self.pointer + 1
+
+    def _get_history(self) -> list:
+        """
+        Lists the entries of the history, oldest first.
+
+        Returns:
+            list: One dict per command, with its position ("position", from 1), a description ("description"),
+                whether it is done ("is_done") and whether a checkpoint follows it ("has_checkpoint").
+        """
+        return [{"position": index + 1, "description": command._describe(), "is_done": index <= self.pointer,
+                 "has_checkpoint": index + 1 in self.__checkpoint_table}
+                for index, command in enumerate(self.command_list)]
+
+    def _go_to(self, position: int) -> bool:
+        """
+        Undoes or redoes commands until position commands are done, restoring a checkpoint of the
+        model and replaying the commands after it when that takes fewer steps and every command in
+        between is model-only. Observers then get one LOAD event instead of the replayed edits.
+
+        Parameters:
+            position (int): The number of commands to have done, from 0 (before the first command) to len(command_list).
+
+        Returns:
+            bool: True if the history is at the requested entry, False if the position is out of range.
+        """
+        if position < 0 or position > len(self.command_list):
+            return False
+        current = self.pointer + 1
+        if position == current:
+            return True
+        self.__check_outside_changes()
+        base = max((checkpoint_position for checkpoint_position in self.__checkpoint_table if checkpoint_position <= position), default=None)
+        # Only going back, the commands before the checkpoint stay done as they ran
+        is_replayed = (
+            base is not None
+            and position < current
+            and position - base < current - position
+            and all(command._is_model_only() for command in self.command_list[base:current])
+        )
+        start = base if is_replayed else current
+        with self.__batch():
+            if is_replayed:
+                self.__model._restore_checkpoint(self.__checkpoint_table[base][0])
+            if start > position:
+                for index in range(start - 1, position - 1, -1):
+                    self.command_list[index].undo()
+            else:
+                for index in range(start, position):
+                    self.command_list[index].execute(is_undo_or_redo=True)
+            if is_replayed:
+                self.__model._notify_reloaded()
+        for index in range(start, position):
+            # Running again may have stored different data to undo
+            self.__update_cost(index)
+        self.pointer = position - 1
+        self.__after_change()
+        if self.journal is not None:
+            self.journal._record("goto")
+        return True
+
+    def __check_outside_changes(self):
+        # The model changed outside the history, replaying from a checkpoint would lose the change
+        if self.__model is not None and self.__model._get_data_version() != self.__model_version:
+            for position in list(self.__checkpoint_table):
+                self.__drop_checkpoint(position)
+
+    def __after_change(self):
+        if self.__model is not None:
+            self.__model_version = self.__model._get_data_version()
+        self.__revision += 1
+
+    @contextmanager
+    def __batch(self):
+        if self.__model is None:
+            yield
+            return
+        with self.__model._batch():
+            yield
+
+    def __take_checkpoint(self, command):
+        # Restoring a checkpoint would leave the canvas behind, GUI commands are never checkpointed
+        position = self.pointer + 1
+        if self.__model is None or not command._is_model_only():
+            return
+        last_position = max((checkpoint_position for checkpoint_position in self.__checkpoint_table if checkpoint_position <= position), default=0)
+        if position - last_position >= self.__checkpoint_interval:
+            checkpoint = self.__model._create_checkpoint()
+            # Measured whole, shared with the model and the other checkpoints or not
+            self.__checkpoint_table[position] = (checkpoint, _estimate_size(checkpoint, set()))
+            self.__total_cost += self.__checkpoint_table[position][1]
+
+    #################################################################
+    # Commands #
 
     def execute_command(self, command):
         """
@@ -1905,15 +2326,37 @@ class InputHandler:
         Returns:
             bool: True if the command was executed successfully, False otherwise.
         """
+        self.__check_outside_changes()
         # Clear all commands after the current pointer position (for redo)
         del self.command_list[self.pointer + 1:]
+        self.__total_cost -= sum(self.__cost_list[self.pointer + 1:])
+        del self.__cost_list[self.pointer + 1:]
+        for position in [position for position in self.__checkpoint_table if position > self.pointer + 1]:
+            self.__drop_checkpoint(position)
         # Execute the new command
         is_command_valid = command.execute()
         if not is_command_valid:
+            self.__after_change()
             return False
+        # Fold it into the last command when they form one step, such as consecutive moves of the same boxes
+        if self.pointer >= 0 and self.command_list[self.pointer]._merge(command):
+            self.__update_cost(self.pointer)
+            self.__drop_checkpoint(self.pointer + 1)
+            self.__after_change()
+            if self.journal is not None:
+                self.journal._record("execute", command)
+            return True
         # Add the command to the list and increment the pointer
         self.command_list.append(command)
+        self.__cost_list.append(0)
         self.pointer += 1
+        # Measured after running, once the command holds what it needs to undo itself
+        self.__update_cost(self.pointer)
+        self.__take_checkpoint(command)
+        self.__evict()
+        self.__after_change()
+        if self.journal is not None:
+            self.journal._record("execute", command)
         return True
 
     def undo(self):
@@ -1923,12 +2366,16 @@ class InputHandler:
         Moves the pointer back and calls undo on the current command.
         """
         if self.pointer >= 0:
+            self.__check_outside_changes()
             # Retrieve the current command
             command = self.command_list[self.pointer]
             # Undo the command
             command.undo()
             # Move the pointer back
             self.pointer -= 1
+            self.__after_change()
+            if self.journal is not None:
+                self.journal._record("undo", command)
 
     def redo(self):
         """
@@ -1937,9 +2384,16 @@ class InputHandler:
         Moves the pointer forward and calls execute on the current command.
         """
         if self.pointer < len(self.command_list) - 1:
+            self.__check_outside_changes()
             # Move the pointer forward
             self.pointer += 1
             # Retrieve the command to redo
             command = self.command_list[self.pointer]
             # Execute the command again
-            command.execute(is_undo_or_redo=True)
\ No newline at end of file
+            command.execute(is_undo_or_redo=True)
+            # Running again may have stored different data to undo
+            self.__update_cost(self.pointer)
+            self.__evict()
+            self.__after_change()
+            if self.journal is not None:
+                self.journal._record("redo", command)
@@ -0,0 +1,203 @@
+from typing import Dict, List, Optional, Set, Tuple
+from UML_ENUM_CLASS.uml_enum import InterfaceOptions
+
+class UMLEvent:
+    """
+    A single model event as delivered to the observers' _update method.
+    """
+
+    __slots__ = ("event_type", "data", "is_loading", "is_undo_or_redo")
+
+    def __init__(self, event_type: str = None, data: Dict = None, is_loading: bool = None, is_undo_or_redo: bool = None):
+        self.event_type = event_type
+        self.data = data
+        self.is_loading = is_loading
+        self.is_undo_or_redo = is_undo_or_redo
+
+    def _get_class_scope(self) -> Set[str]:
+        """
+        Returns the names of the classes this event touches.
+        """
+        data = self.data if isinstance(self.data, dict) else {}
+        return {data[key] for key in ("class_name", "old_name", "new_name", "source", "dest") if key in data}
+
+class UMLEventBus:
+    """
+    Event bus between UMLModel and its observers.
+
+    Events are queued and dispatched in one pass at the flush point: once the number of pending events
+    reaches the flush threshold (1, the default, dispatches every event right away), on an explicit
+    _flush, or when the last _hold is released. While events are queued, redundant ones are merged:
+    a field or relationship type changed again only keeps its latest type, and a chain of class or
+    field renames collapses into one rename from the first to the last name, or into nothing when it
+    comes back to the first name. Events are only merged
+    when no other queued event touched the same classes in between, so observers see the same end state.
+
+    Observers subscribe either to every event type or to a list of event types only.
+    """
+
+    # Event type -> (key of a pending event that a later event can merge into, key the later event looks up)
+    __MERGE_RULE_TABLE = {
+        InterfaceOptions.EDIT_FIELD_TYPE.value: (("class_name", "field_name"), ("class_name", "field_name")),
+        InterfaceOptions.EDIT_REL_TYPE.value: (("source", "dest"), ("source", "dest")),
+        InterfaceOptions.RENAME_CLASS.value: (("new_name",), ("old_name",)),
+        InterfaceOptions.RENAME_FIELD.value: (("class_name", "new_field_name"), ("class_name", "old_field_name")),
+    }
+
+    def __init__(self, flush_threshold: int = 1):
+        self.__observer_list: List = []
+        # Observer -> event types it subscribed to, None for every event type
+        self.__event_type_table: Dict[object, Optional[Set[str]]] = {}
+        # Pending events in publishing order, None where a merged event cancelled out
+        self.__pending_event_list: List[Optional[UMLEvent]] = []
+        self.__dropped_count = 0
+        # Merge key -> position of the pending event that can absorb a later event with that key
+        self.__merge_key_table: Dict[Tuple, int] = {}
+        # Class name -> position of the last pending event that touched the class
+        self.__last_event_of_class: Dict[str, int] = {}
+        self.__flush_threshold = max(1, flush_threshold)
+        self.__hold_depth = 0
+
+    #################################################################
+    # Subscription #
+
+    def _get_observer_list(self) -> List:
+        return self.__observer_list
+
+    def _subscribe(self, observer, event_type_list: List[str] = None):
+        """
+        Subscribes an observer to the given event types, or to every event type when none are given.
+        Subscribing again replaces the event types of the observer.
+        """
+        if observer not in self.__observer_list:
+            self.__observer_list.append(observer)
+        self.__event_type_table[observer] = set(event_type_list) if event_type_list is not None else None
+
+    def _unsubscribe(self, observer):
+        if observer in self.__observer_list:
+            self.__observer_list.remove(observer)
+            self.__event_type_table.pop(observer, None)
+
+    #################################################################
+    # Flush point #
+
+    def _set_flush_threshold(self, flush_threshold: int):
+        """
+        Sets how many events may be pending before they are dispatched, 1 dispatches every event right away.
+        """
+        self.__flush_threshold = max(1, flush_threshold)
+        self.__flush_if_due()
+
+    def _hold(self):
+        """
+        Holds every event back until the matching _release, whatever the flush threshold. Holds nest.
+        """
+        self.__hold_depth += 1
+
+    def _release(self):
+        """
+        Releases one hold, dispatching the pending events when the last hold is released.
+        """
+        if self.__hold_depth:
+            self.__hold_depth -= 1
+        self.__flush_if_due()
+
+    def _discard(self):
+        """
+        Drops every pending event without dispatching it. Holds stay in place.
+        """
+        self.__clear_pending()
+
+    def _get_pending_count(self) -> int:
+        return len(self.__pending_event_list) - self.__dropped_count
+
+    #################################################################
+    # Publish and dispatch #
+
+    def _publish(self, event_type: str = None, data: Dict = None, is_loading: bool = None, is_undo_or_redo: bool = None):
+        """
+        Queues an event, merging it into a pending one if it is redundant, and dispatches when the flush point is reached.
+        """
+        event = UMLEvent(event_type, data, is_loading, is_undo_or_redo)
+        if not self.__merge(event):
+            self.__append(event)
+        self.__flush_if_due()
+
+    def _flush(self):
+        """
+        Dispatches every pending event to the observers subscribed to its type, in publishing order.
+        """
+        event_list = self.__pending_event_list
+        self.__clear_pending()
+        for event in event_list:
+            if event is None:
+                continue
+            for observer in list(self.__observer_list):
+                event_type_set = self.__event_type_table.get(observer)
+                if event_type_set is None or event.event_type in event_type_set:
+                    observer._update(event.event_type, event.data, event.is_loading, event.is_undo_or_redo)
+
+    def __flush_if_due(self):
+        if not self.__hold_depth and self._get_pending_count() >= self.__flush_threshold:
+            self._flush()
+
+    def __clear_pending(self):
+        self.__pending_event_list = []
+        self.__dropped_count = 0
+        self.__merge_key_table = {}
+        self.__last_event_of_class = {}
+
+    # Queue an event that could not be merged #
+    def __append(self, event: UMLEvent):
+        position = len(self.__pending_event_list)
+        self.__pending_event_list.append(event)
+        for class_name in event._get_class_scope():
+            self.__last_event_of_class[class_name] = position
+        merge_rule = self.__MERGE_RULE_TABLE.get(event.event_type)
+        if merge_rule is not None:
+            pending_key = self.__merge_key(event, merge_rule[0])
+            if pending_key is not None:
+                self.__merge_key_table[pending_key] = position
+
+    # Merge an event into a pending one, returns False when it cannot be merged #
+    def __merge(self, event: UMLEvent) -> bool:
+        merge_rule = self.__MERGE_RULE_TABLE.get(event.event_type)
+        if merge_rule is None:
+            return False
+        lookup_key = self.__merge_key(event, merge_rule[1])
+        position = self.__merge_key_table.get(lookup_key)
+        if position is None:
+            return False
+        pending_event = self.__pending_event_list[position]
+        if pending_event.is_loading != event.is_loading or pending_event.is_undo_or_redo != event.is_undo_or_redo:
+            return False
+        # Every class of both events must not have been touched by a later event
+        class_scope = pending_event._get_class_scope() | event._get_class_scope()
+        if any(self.__last_event_of_class.get(class_name, position) != position for class_name in class_scope):
+            return False
+        self.__merge_key_table.pop(self.__merge_key(pending_event, merge_rule[0]), None)
+        merged_data = dict(pending_event.data)
+        for key, value in event.data.items():
+            # A rename keeps the first old name, everything else takes the latest value
+            if not key.startswith("old_"):
+                merged_data[key] = value
+        old_key_list = [key for key in merged_data if key.startswith("old_")]
+        if old_key_list and all(merged_data[key] == merged_data.get("new_" + key[len("old_"):]) for key in old_key_list):
+            # Renamed back to the first name, the renames cancel out. The slot stays so the positions
+            # of the other pending events hold, and later events of the classes still cannot merge across it
+            self.__pending_event_list[position] = None
+            self.__dropped_count += 1
+            return True
+        merged_event = UMLEvent(event.event_type, merged_data, event.is_loading, event.is_undo_or_redo)
+        self.__pending_event_list[position] = merged_event
+        for class_name in merged_event._get_class_scope():
+            self.__last_event_of_class[class_name] = position
+        self.__merge_key_table[self.__merge_key(merged_event, merge_rule[0])] = position
+        return True
+
+    @staticmethod
+    def __merge_key(event: UMLEvent, key_name_tuple: Tuple[str, ...]) -> Optional[Tuple]:
+        data = event.data if isinstance(event.data, dict) else {}
+        if any(key_name not in data for key_name in key_name_tuple):
+            return None
+        return (event.event_type,) + tuple(data[key_name] for key_name in key_name_tuple)